@@ -6,27 +6,33 @@ Author: Pietro Agile Coach
 Purpose: Analyze Epic metrics and estimates for program management insights
 """
 
-import matplotlib.pyplot as plt
 import io
+import numpy as np
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file
 import logging
 from datetime import datetime, timedelta
 import os
 import tempfile
 import base64
-from io import BytesIO
 import re
 import time
 import json
+import csv
+import hashlib
+import secrets
+import socket
+import ipaddress
+import multiprocessing
+import threading
+from collections import OrderedDict, defaultdict, deque
 from urllib.parse import urlparse
-from functools import wraps
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 from jira_client import JiraClient
-from data_analyzer import DataAnalyzer
-from visualization import VisualizationGenerator
-from epic_pdf_generator import PDFReportGenerator
-from reportlab.lib.units import inch
+from json_provider import install_json_provider
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -35,11 +41,192 @@ logger = logging.getLogger('ObeyaEpic')
 # Security configurations
 MAX_JQL_LENGTH = 2000
 MAX_RESULTS_LIMIT = 5000
+CSV_HEADER = "Jira ID,Original Estimate (hours),Remaining Estimate (hours)\n"
 RATE_LIMIT_REQUESTS = 10  # requests per minute
 RATE_LIMIT_WINDOW = 60   # seconds
+ALLOW_PRIVATE_JIRA = os.environ.get('OBEYA_ALLOW_PRIVATE_JIRA', '').lower() in ('1', 'true', 'yes')  # on-prem Jira
 
-# Rate limiting storage
-rate_limit_storage = {}
+# Performance configurations
+EPIC_FIELDS = ['summary', 'status', 'timeoriginalestimate', 'timeestimate']  # fields read from epics
+FETCH_WORKERS = int(os.environ.get('OBEYA_FETCH_WORKERS', 8))  # parallel epic child fetches
+MAX_JIRA_IN_FLIGHT = int(os.environ.get('OBEYA_MAX_IN_FLIGHT', 20))  # concurrent Jira calls across all requests
+UPDATE_WORKERS = int(os.environ.get('OBEYA_UPDATE_WORKERS', 10))  # parallel estimate updates
+CHILDREN_CACHE_TTL = int(os.environ.get('OBEYA_CACHE_TTL', 300))  # seconds
+CHILDREN_CACHE_SIZE = 2048  # max cached epics
+REPORT_CACHE_TTL = 600  # seconds a rendered report stays exportable
+REPORT_CACHE_SIZE = 64  # max cached reports
+CHART_WORKERS = int(os.environ.get('OBEYA_CHART_WORKERS', os.cpu_count() or 1))  # chart render processes
+
+# Rate limiting storage: one bounded deque of request timestamps per client
+rate_limit_storage = defaultdict(lambda: deque(maxlen=RATE_LIMIT_REQUESTS))
+rate_limit_last_sweep = 0.0
+rate_limit_lock = threading.Lock()  # guards rate_limit_storage across request threads
+
+# Dangerous JQL patterns fused into a single precompiled alternation
+DANGEROUS_JQL_PATTERN = re.compile(
+    r'\b(?:DROP|DELETE|INSERT|UPDATE|CREATE|ALTER)\b'
+    r'|[;\x00-\x1f\x7f-\x9f]'  # Control characters
+    r'|<script[^>]*>.*?</script>'  # XSS
+    r'|javascript:'
+    r'|data:'
+    r'|vbscript:',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Caps concurrent Jira fan-out calls across all requests to respect Jira rate limits
+jira_in_flight = threading.BoundedSemaphore(MAX_JIRA_IN_FLIGHT)
+
+def call_jira_bounded(func, *args, **kwargs):
+    """Call a JiraClient method while holding a global in-flight slot."""
+    with jira_in_flight:
+        return func(*args, **kwargs)
+
+# Chart rendering process pool, created on first use
+chart_pool = None
+chart_pool_lock = threading.Lock()
+
+def get_chart_pool():
+    """
+    Return the shared chart rendering process pool, creating it on first use.
+
+    The pool is created from a request thread while other threads may hold locks,
+    so workers are started from a forkserver (spawn where it is unavailable)
+    rather than forked from this process.
+    """
+    global chart_pool
+    with chart_pool_lock:
+        if chart_pool is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            chart_pool = ProcessPoolExecutor(max_workers=CHART_WORKERS,
+                                             mp_context=multiprocessing.get_context(start_method))
+        return chart_pool
+
+# matplotlib and the chart generator are loaded on first use, so web workers
+# start without importing the plotting stack; only chart processes pay for it
+pyplot = None
+viz_gen = None
+
+def get_pyplot():
+    """Import matplotlib with the non-interactive backend on first use."""
+    global pyplot
+    if pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot
+        pyplot = matplotlib.pyplot
+    return pyplot
+
+def get_viz_gen():
+    """Return the per-process VisualizationGenerator, creating it on first use."""
+    global viz_gen
+    if viz_gen is None:
+        get_pyplot()
+        from visualization import VisualizationGenerator
+        viz_gen = VisualizationGenerator()
+    return viz_gen
+
+def render_estimate_chart(epic_names, original_estimates, remaining_estimates, chart_title):
+    """Render an estimate comparison bar chart and return the PNG bytes."""
+    chart = get_viz_gen().create_bar_chart(
+        epic_names,
+        [original_estimates, remaining_estimates],
+        chart_title,
+        'Hours',
+        ['Original Estimate', 'Remaining Estimate']
+    )
+    get_pyplot().close('all')
+    return chart.getvalue()
+
+def render_pie_chart(epic_sizes, title):
+    """Render the epic size distribution pie chart and return the PNG bytes."""
+    chart = get_viz_gen().create_pie_chart(epic_sizes, title)
+    get_pyplot().close('all')
+    return chart.getvalue()
+
+@lru_cache(maxsize=1)
+def render_empty_estimate_chart():
+    """Render the "no estimates" placeholder chart once and return the PNG bytes."""
+    plt = get_pyplot()
+    plt.figure(figsize=(12, 8))
+    plt.text(0.5, 0.5, "No epics with estimates found", ha='center', va='center')
+    plt.axis('off')
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format='png')
+    plt.close()
+    return buffer.getvalue()
+
+def render_charts(jobs):
+    """
+    Render charts in parallel on the process pool.
+    
+    Args:
+        jobs: List of (render_function, args) tuples
+        
+    Returns:
+        List of PNG bytes in the same order as jobs
+    """
+    global chart_pool
+    try:
+        pool = get_chart_pool()
+        futures = [pool.submit(func, *args) for func, args in jobs]
+        return [future.result() for future in futures]
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"⚠️ Chart process pool unavailable, rendering in-process: {str(e)}")
+        with chart_pool_lock:
+            chart_pool = None
+        return [func(*args) for func, args in jobs]
+
+def segment_sums(values, offsets):
+    """
+    Sum consecutive segments of values delimited by offsets.
+    
+    Args:
+        values: 1-D int64 array of all values
+        offsets: Segment boundaries (len = segments + 1), starting at 0
+        
+    Returns:
+        int64 array with one sum per segment (0 for empty segments)
+    """
+    cumulative = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(values, out=cumulative[1:])
+    return cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+
+def get_request_json():
+    """Parse the JSON request body with the app's JSON provider, without caching the raw bytes."""
+    return app.json.loads(request.get_data(cache=False))
+
+def get_child_totals(epic):
+    """
+    Return the (original, remaining) hour totals of an epic's children.
+    
+    Uses the totals computed by EpicAnalyzer and only falls back to summing
+    the children for payloads produced before those fields existed.
+    """
+    if 'child_original_hours' in epic and 'child_remaining_hours' in epic:
+        return epic['child_original_hours'], epic['child_remaining_hours']
+    return (
+        sum(child['original_estimate'] for child in epic['children']),
+        sum(child['remaining_estimate'] for child in epic['children'])
+    )
+
+@lru_cache(maxsize=256)
+def resolve_hostname(hostname):
+    """Resolve a hostname to an IP address (cached; resolution failures are not cached)."""
+    return socket.gethostbyname(hostname)
+
+def is_blocked_address(hostname):
+    """Check whether a hostname points to loopback, link-local or (by default) private networks."""
+    try:
+        ip = ipaddress.ip_address(hostname)
+    except ValueError:
+        try:
+            ip = ipaddress.ip_address(resolve_hostname(hostname))
+        except (socket.gaierror, UnicodeError):
+            return False  # Unresolvable hosts cannot be reached anyway
+    
+    if ip.is_loopback or ip.is_link_local or ip.is_unspecified or ip.is_multicast or ip.is_reserved:
+        return True
+    return ip.is_private and not ALLOW_PRIVATE_JIRA
 
 def validate_jira_url(url):
     """Validate Jira URL format and security."""
@@ -50,11 +237,11 @@ def validate_jira_url(url):
         parsed = urlparse(url)
         if not parsed.scheme in ['http', 'https']:
             return False
-        if not parsed.netloc:
+        if not parsed.netloc or not parsed.hostname:
             return False
         # Prevent localhost/internal network access in production
-        if parsed.hostname in ['localhost', '127.0.0.1', '0.0.0.0']:
-            logger.warning(f"🚨 Blocked localhost access attempt: {url}")
+        if parsed.hostname == 'localhost' or is_blocked_address(parsed.hostname):
+            logger.warning(f"🚨 Blocked internal network access attempt: {url}")
             return False
         return True
     except Exception:
@@ -65,22 +252,28 @@ def sanitize_jql(jql_query):
     if not jql_query or len(jql_query) > MAX_JQL_LENGTH:
         raise ValueError("JQL query too long or empty")
     
-    # Remove dangerous patterns
-    dangerous_patterns = [
-        r'\b(DROP|DELETE|INSERT|UPDATE|CREATE|ALTER)\b',
-        r'[;\x00-\x1f\x7f-\x9f]',  # Control characters
-        r'<script[^>]*>.*?</script>',  # XSS
-        r'javascript:',
-        r'data:',
-        r'vbscript:'
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, jql_query, re.IGNORECASE):
-            raise ValueError(f"Potentially dangerous JQL pattern detected")
+    # Reject dangerous patterns in a single pass
+    if DANGEROUS_JQL_PATTERN.search(jql_query):
+        raise ValueError("Potentially dangerous JQL pattern detected")
     
     return jql_query.strip()
 
+def sweep_rate_limit_storage(current_time):
+    """Evict clients whose newest request is older than the rate limit window.
+
+    Callers must hold rate_limit_lock.
+    """
+    global rate_limit_last_sweep
+    if current_time - rate_limit_last_sweep < RATE_LIMIT_WINDOW:
+        return
+    rate_limit_last_sweep = current_time
+    stale_clients = [
+        client_ip for client_ip, timestamps in list(rate_limit_storage.items())
+        if not timestamps or current_time - timestamps[-1] >= RATE_LIMIT_WINDOW
+    ]
+    for client_ip in stale_clients:
+        rate_limit_storage.pop(client_ip, None)
+
 def rate_limit(f):
     """Rate limiting decorator."""
     @wraps(f)
@@ -88,14 +281,21 @@ def rate_limit(f):
         client_ip = request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr)
         current_time = time.time()
         
-        # Clean old entries
-        rate_limit_storage[client_ip] = [
-            timestamp for timestamp in rate_limit_storage.get(client_ip, [])
-            if current_time - timestamp < RATE_LIMIT_WINDOW
-        ]
+        with rate_limit_lock:
+            # Periodically drop clients with no requests inside the window
+            sweep_rate_limit_storage(current_time)
+            
+            # Clean old entries
+            timestamps = rate_limit_storage[client_ip]
+            while timestamps and current_time - timestamps[0] >= RATE_LIMIT_WINDOW:
+                timestamps.popleft()
+            
+            # Check rate limit, recording the request only when it is allowed
+            limited = len(timestamps) >= RATE_LIMIT_REQUESTS
+            if not limited:
+                timestamps.append(current_time)
         
-        # Check rate limit
-        if len(rate_limit_storage.get(client_ip, [])) >= RATE_LIMIT_REQUESTS:
+        if limited:
             logger.warning(f"🚨 Rate limit exceeded for IP: {client_ip}")
             return jsonify({
                 'error': 'Rate limit exceeded',
@@ -105,14 +305,78 @@ def rate_limit(f):
                 }
             }), 429
         
-        # Add current request
-        if client_ip not in rate_limit_storage:
-            rate_limit_storage[client_ip] = []
-        rate_limit_storage[client_ip].append(current_time)
-        
         return f(*args, **kwargs)
     return decorated_function
 
+class TTLCache:
+    """
+    Thread-safe in-memory cache with per-entry TTL and LRU size bound.
+    """
+    
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 2048):
+        """
+        Initialize cache with TTL and size bound.
+        
+        Args:
+            ttl_seconds (int): Entry time-to-live in seconds
+            max_entries (int): Maximum number of cached entries
+        """
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value for key, or None if missing/expired."""
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            timestamp, value = entry
+            if time.time() - timestamp >= self.ttl:
+                del self.cache[key]
+                return None
+            self.cache.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        """Store value for key, evicting the oldest entries when full."""
+        with self.lock:
+            self.cache[key] = (time.time(), value)
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+    
+    def clear(self):
+        """Clear all cached entries and return how many were removed."""
+        with self.lock:
+            count = len(self.cache)
+            self.cache.clear()
+        logger.info(f"🗑️ Cleared {count} cached entries")
+        return count
+
+class EpicChildrenCache(TTLCache):
+    """
+    TTL cache for epic child issues.
+    
+    Avoids re-fetching children from Jira when the same epics are analyzed
+    again shortly afterwards. Entries are scoped per Jira server and token.
+    """
+    
+    @staticmethod
+    def make_key(jira_client, epic_key):
+        """Build a cache key from the client's server, token and the epic key."""
+        base_url = getattr(jira_client, 'base_url', '')
+        token = getattr(jira_client, 'access_token', '') or ''
+        token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+        return (base_url, token_hash, epic_key)
+
+# Shared across requests so repeat analyses skip Jira round-trips
+children_cache = EpicChildrenCache(CHILDREN_CACHE_TTL, CHILDREN_CACHE_SIZE)
+
+# Rendered PNG charts per analysis, so PDF export does not re-upload them
+report_cache = TTLCache(REPORT_CACHE_TTL, REPORT_CACHE_SIZE)
+
 class EpicAnalyzer:
     """Analyzes Epics and their associated work items."""
     
@@ -131,10 +395,32 @@ class EpicAnalyzer:
             List of dictionaries containing epic analysis
         """
         epic_analysis = []
+        children_by_epic = self._fetch_children(epics)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        # Flatten all children into one array per estimate, with per-epic offsets,
+        # so the totals for every epic come out of a single vectorized pass
+        linked_by_epic = [children_by_epic.get(epic['key'], []) for epic in epics]
+        offsets = np.zeros(len(epics) + 1, dtype=np.int64)
+        np.cumsum([len(linked_issues) for linked_issues in linked_by_epic], out=offsets[1:])
+        all_fields = [issue.get('fields', {}) for linked_issues in linked_by_epic for issue in linked_issues]
+        all_original = np.fromiter(
+            (fields.get('timeoriginalestimate', 0) or 0 for fields in all_fields),
+            dtype=np.int64, count=len(all_fields)
+        )
+        all_remaining = np.fromiter(
+            (fields.get('timeestimate', 0) or 0 for fields in all_fields),
+            dtype=np.int64, count=len(all_fields)
+        )
+        linked_original_totals = segment_sums(all_original, offsets).tolist()
+        linked_remaining_totals = segment_sums(all_remaining, offsets).tolist()
+        all_original_hours = (all_original / 3600.0).tolist()
+        all_remaining_hours = (all_remaining / 3600.0).tolist()
         
-        for epic in epics:
+        for i, epic in enumerate(epics):
             # Get all linked issues for the epic
-            linked_issues = self.jira_client.get_epic_children(epic['key'])
+            linked_issues = linked_by_epic[i]
+            start, end = offsets[i], offsets[i + 1]
             
             # Debug: Log raw linked issues
             # logger.info(f"📋 Epic {epic['key']} has {len(linked_issues)} linked issues")
@@ -148,20 +434,17 @@ class EpicAnalyzer:
             # logger.info(f"🔍 Epic {epic['key']}: original={epic_original}, remaining={epic_remaining}")
             
             # Add estimates from linked issues
-            linked_original = 0
-            linked_remaining = 0
+            linked_original = linked_original_totals[i]
+            linked_remaining = linked_remaining_totals[i]
+            child_fields = all_fields[start:end]
             
-            for issue in linked_issues:
-                issue_fields = issue.get('fields', {})
-                orig_est = issue_fields.get('timeoriginalestimate', 0) or 0
-                rem_est = issue_fields.get('timeestimate', 0) or 0
-                
-                # Debug logging for child estimates
-                if orig_est > 0 or rem_est > 0:
-                    logger.info(f"  📋 Child {issue.get('key', 'Unknown')}: original={orig_est}, remaining={rem_est}")
-                
-                linked_original += orig_est
-                linked_remaining += rem_est
+            # Debug logging for child estimates
+            if debug_enabled:
+                child_original = all_original[start:end]
+                child_remaining = all_remaining[start:end]
+                for idx in np.flatnonzero((child_original > 0) | (child_remaining > 0)):
+                    logger.debug("  📋 Child %s: original=%s, remaining=%s",
+                                 linked_issues[idx].get('key', 'Unknown'), child_original[idx], child_remaining[idx])
             
             total_original = epic_original + linked_original
             total_remaining = epic_remaining + linked_remaining
@@ -175,22 +458,118 @@ class EpicAnalyzer:
                 'progress': ((total_original - total_remaining) / total_original * 100) if total_original > 0 else 0,
                 'num_children': len(linked_issues),
                 'jira_epic_has_zero_estimates': (epic_original == 0 and epic_remaining == 0),  # Flag for update logic
+                'child_original_hours': linked_original / 3600,  # Children-only totals for update/export
+                'child_remaining_hours': linked_remaining / 3600,
                 'children': [
                     {
                         'key': issue.get('key', ''),
-                        'summary': issue.get('fields', {}).get('summary', ''),
-                        'status': issue.get('fields', {}).get('status', {}).get('name', ''),
-                        'original_estimate': (issue.get('fields', {}).get('timeoriginalestimate', 0) or 0) / 3600,
-                        'remaining_estimate': (issue.get('fields', {}).get('timeestimate', 0) or 0) / 3600
+                        'summary': fields.get('summary', ''),
+                        'status': fields.get('status', {}).get('name', ''),
+                        'original_estimate': orig_hours,
+                        'remaining_estimate': rem_hours
                     }
-                    for issue in linked_issues
+                    for issue, fields, orig_hours, rem_hours in zip(
+                        linked_issues, child_fields,
+                        all_original_hours[start:end], all_remaining_hours[start:end]
+                    )
                 ]
             }
             epic_analysis.append(epic_data)
         
         return epic_analysis
+    
+    def _fetch_children(self, epics):
+        """
+        Fetch child issues for all epics, serving repeats from the cache.
+        
+        Uncached epics are fetched with batched JQL queries when the client
+        supports it, otherwise with concurrent per-epic requests.
+        
+        Args:
+            epics: List of Epic issues from Jira
+            
+        Returns:
+            Dict mapping epic key to its list of child issues
+        """
+        if not epics:
+            return {}
+        
+        children_by_epic = {}
+        to_fetch = []
+        for epic in epics:
+            cached = children_cache.get(children_cache.make_key(self.jira_client, epic['key']))
+            if cached is not None:
+                children_by_epic[epic['key']] = cached
+            else:
+                to_fetch.append(epic['key'])
+        
+        if not to_fetch:
+            return children_by_epic
+        
+        fetched = self._fetch_children_batched(to_fetch)
+        if fetched is None:
+            fetched = self._fetch_children_parallel(to_fetch)
+        
+        for epic_key, children in fetched.items():
+            children_cache.set(children_cache.make_key(self.jira_client, epic_key), children)
+        children_by_epic.update(fetched)
+        
+        return children_by_epic
+    
+    def _fetch_children_batched(self, epic_keys):
+        """
+        Fetch child issues for many epics with a few batched JQL queries.
+        
+        Args:
+            epic_keys: Keys of the epics to fetch
+            
+        Returns:
+            Dict mapping epic key to its list of child issues, or None if
+            batched fetching is unavailable
+        """
+        if not hasattr(self.jira_client, 'get_children_for_epics'):
+            return None
+        
+        try:
+            return call_jira_bounded(self.jira_client.get_children_for_epics, epic_keys)
+        except Exception as e:
+            logger.warning("⚠️ Batched child fetch failed, falling back to per-epic requests: %s", e)
+            return None
+    
+    def _fetch_children_parallel(self, epic_keys):
+        """
+        Fetch child issues for each epic concurrently.
+        
+        Args:
+            epic_keys: Keys of the epics to fetch
+            
+        Returns:
+            Dict mapping epic key to its list of child issues (failed epics omitted,
+            so the failure is not cached)
+        """
+        children_by_epic = {}
+        max_workers = max(1, min(FETCH_WORKERS, len(epic_keys)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(call_jira_bounded, self.jira_client.get_epic_children, epic_key): epic_key
+                for epic_key in epic_keys
+            }
+            for future in as_completed(futures):
+                epic_key = futures[future]
+                try:
+                    children = future.result()
+                except Exception as e:
+                    logger.error("Error fetching children for %s: %s", epic_key, e)
+                    continue
+                if children is None:
+                    logger.warning("⚠️ Children of %s unavailable, not caching them", epic_key)
+                    continue
+                children_by_epic[epic_key] = children
+        
+        return children_by_epic
 
-app = Flask(__name__)
+app = install_json_provider(Flask(__name__))
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
 
 # Security headers
@@ -433,7 +812,12 @@ def analyze_epics():
             return jsonify({'error': 'Failed to connect to Jira. Please check your URL and access token.'}), 401
         
         # Get epics with result limit
-        epics = jira_client.fetch_issues(jql_query, max_results=MAX_RESULTS_LIMIT)
+        epics = jira_client.fetch_issues(
+            jql_query,
+            max_results=MAX_RESULTS_LIMIT,
+            fields=EPIC_FIELDS,
+            expand=None  # Status history is not used by the estimate analysis
+        )
         if not epics:
             return jsonify({
                 'error': 'No epics found with the given query',
@@ -448,21 +832,14 @@ def analyze_epics():
         epic_analyzer = EpicAnalyzer(jira_client)
         epic_analysis = epic_analyzer.analyze_epics(epics)
         
-        # Generate visualizations
-        viz_gen = VisualizationGenerator()
-        
-        # Generate charts
-        viz_gen = VisualizationGenerator()
-        
-        # Generate pie chart for epic size distribution
-        epic_pie_chart = viz_gen.create_pie_chart(
-            epic_analysis,
-            'Epic Size Distribution'
-        )
+        # Generate charts on the process pool so rendering runs in parallel
+        chart_jobs = [(
+            render_pie_chart,
+            ([{'original_estimate': epic['original_estimate']} for epic in epic_analysis], 'Epic Size Distribution')
+        )]
         
         # Generate estimate comparison charts for non-zero epics (split every 50 epics)
         filtered_epics = [epic for epic in epic_analysis if epic['original_estimate'] > 0 or epic['remaining_estimate'] > 0]
-        estimate_charts = []
         
         if filtered_epics:
             # Split epics into chunks of 50
@@ -474,32 +851,31 @@ def analyze_epics():
                 remaining_estimates = [epic['remaining_estimate'] for epic in chunk]
                 
                 chart_title = f'Epic Progress Comparison ({i+1}-{min(i+chunk_size, len(filtered_epics))})'
-                estimate_chart = viz_gen.create_bar_chart(
-                    epic_names,
-                    [original_estimates, remaining_estimates],
-                    chart_title,
-                    'Hours',
-                    ['Original Estimate', 'Remaining Estimate']
-                )
-                estimate_charts.append(estimate_chart)
-        else:
-            # Create an empty chart if no epics with estimates
-            plt.figure(figsize=(12, 8))
-            plt.text(0.5, 0.5, "No epics with estimates found", ha='center', va='center')
-            plt.axis('off')
-            estimate_chart = io.BytesIO()
-            plt.savefig(estimate_chart, format='png')
-            estimate_chart.seek(0)
-            plt.close()
-            estimate_charts.append(estimate_chart)
+                chart_jobs.append((render_estimate_chart, (epic_names, original_estimates, remaining_estimates, chart_title)))
+        
+        rendered_charts = render_charts(chart_jobs)
+        epic_pie_chart = rendered_charts[0]
+        estimate_charts = rendered_charts[1:]
+        
+        if not filtered_epics:
+            # Use the cached empty chart if no epics with estimates
+            estimate_charts.append(render_empty_estimate_chart())
         
         # Convert charts to base64 for embedding
-        estimate_charts_b64 = [base64.b64encode(chart.getvalue()).decode('utf-8') for chart in estimate_charts]
-        epic_pie_chart_b64 = base64.b64encode(epic_pie_chart.getvalue()).decode('utf-8')
+        estimate_charts_b64 = [base64.b64encode(chart).decode('utf-8') for chart in estimate_charts]
+        epic_pie_chart_b64 = base64.b64encode(epic_pie_chart).decode('utf-8')
+        
+        # Keep the raw PNG bytes server-side for PDF export
+        report_token = secrets.token_urlsafe(16)
+        report_cache.set(report_token, {
+            'estimate_charts': estimate_charts,
+            'epic_pie_chart': epic_pie_chart
+        })
         
         # Prepare response data
         response_data = {
             'success': True,
+            'report_token': report_token,
             'epic_analysis': epic_analysis,
             'visualizations': {
                 'estimate_charts': estimate_charts_b64,
@@ -555,11 +931,46 @@ def export_pdf():
         PDF file for download
     """
     try:
-        data = request.get_json()
+        data = get_request_json()
         epic_analysis = data.get('epic_analysis', [])
         visualizations = data.get('visualizations', {})
         jira_url = data.get('jira_url', '')
         
+        # Nothing to report: skip reportlab entirely
+        if not epic_analysis:
+            return jsonify({
+                'error': 'No epic analysis data to export',
+                'error_type': 'NoDataError',
+                'error_details': {
+                    'location': 'pdf_generation',
+                    'suggestion': 'Please run the analysis first before exporting'
+                }
+            }), 400
+        
+        # Prefer the PNG bytes rendered during analysis over re-uploaded base64
+        cached_charts = report_cache.get(data.get('report_token', ''))
+        if cached_charts is not None:
+            epic_pie_chart = cached_charts['epic_pie_chart']
+            estimate_charts = cached_charts['estimate_charts']
+        elif visualizations:
+            epic_pie_chart = base64.b64decode(visualizations['epic_pie_chart']) if visualizations.get('epic_pie_chart') else None
+            estimate_charts = [base64.b64decode(chart_b64) for chart_b64 in visualizations.get('estimate_charts', [])]
+        else:
+            return jsonify({
+                'error': 'Report charts have expired',
+                'error_type': 'ReportExpiredError',
+                'error_details': {
+                    'location': 'pdf_generation',
+                    'suggestion': 'Please run the analysis again before exporting'
+                }
+            }), 410
+        
+        # Deferred so empty or rejected exports never load reportlab
+        from epic_pdf_generator import PDFReportGenerator
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Table, TableStyle, Spacer, PageBreak
+        from reportlab.lib import colors
+        
         # Create PDF generator
         pdf_gen = PDFReportGenerator(jira_url)
         
@@ -568,14 +979,12 @@ def export_pdf():
         pdf_gen.add_timestamp()
         
         # Add visualizations
-        if visualizations.get('epic_pie_chart'):
-            pie_chart_data = base64.b64decode(visualizations['epic_pie_chart'])
-            pdf_gen.add_image(io.BytesIO(pie_chart_data), caption="Epic Size Distribution", height=5*inch)
+        if epic_pie_chart:
+            pdf_gen.add_image(io.BytesIO(epic_pie_chart), caption="Epic Size Distribution", height=5*inch)
             
-        if visualizations.get('estimate_charts'):
+        if estimate_charts:
             pdf_gen.add_heading("Epic Progress Comparison")
-            for i, chart_b64 in enumerate(visualizations['estimate_charts']):
-                chart_data = base64.b64decode(chart_b64)
+            for chart_data in estimate_charts:
                 pdf_gen.add_image(io.BytesIO(chart_data), caption="")
         
         # Filter out unestimated epics for PDF
@@ -594,9 +1003,6 @@ def export_pdf():
             ['Epics without Estimates or Children:', str(unestimated_count)]
         ]
         
-        from reportlab.platypus import Table, TableStyle, Spacer
-        from reportlab.lib import colors
-        
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
         summary_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
@@ -608,7 +1014,6 @@ def export_pdf():
         pdf_gen.elements.append(Spacer(1, 0.2*inch))
         
         # Add epic details only for estimated epics (continuous table)
-        from reportlab.platypus import PageBreak
         pdf_gen.elements.append(PageBreak())
         pdf_gen.add_heading("Epic Details (Estimated Only)")
         
@@ -651,8 +1056,13 @@ def export_csv():
         CSV file with epics that need estimate updates
     """
     try:
-        data = request.get_json()
+        data = get_request_json()
         epic_analysis = data.get('epic_analysis', [])
+        csv_headers = {'Content-Disposition': f'attachment; filename=epic_estimates_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'}
+        
+        # Nothing to export: header-only CSV
+        if not epic_analysis:
+            return Response(CSV_HEADER, mimetype='text/csv', headers=csv_headers)
         
         # Filter epics with 0 estimates but have children with estimates
         epics_to_update = []
@@ -660,9 +1070,8 @@ def export_csv():
             if (epic['original_estimate'] == 0 and epic['remaining_estimate'] == 0 and 
                 epic['num_children'] > 0 and len(epic['children']) > 0):
                 
-                # Calculate totals from children
-                child_original_total = sum(child['original_estimate'] for child in epic['children'])
-                child_remaining_total = sum(child['remaining_estimate'] for child in epic['children'])
+                # Totals from children, precomputed during analysis
+                child_original_total, child_remaining_total = get_child_totals(epic)
                 
                 if child_original_total > 0 or child_remaining_total > 0:
                     epics_to_update.append({
@@ -672,17 +1081,16 @@ def export_csv():
                     })
         
         # Create CSV content
-        csv_content = "Jira ID,Original Estimate (hours),Remaining Estimate (hours)\n"
-        for epic in epics_to_update:
-            csv_content += f"{epic['jira_id']},{epic['original_estimate_hours']:.2f},{epic['remaining_estimate_hours']:.2f}\n"
+        csv_buffer = io.StringIO()
+        csv_buffer.write(CSV_HEADER)
+        writer = csv.writer(csv_buffer, lineterminator='\n')
+        writer.writerows(
+            (epic['jira_id'], f"{epic['original_estimate_hours']:.2f}", f"{epic['remaining_estimate_hours']:.2f}")
+            for epic in epics_to_update
+        )
         
         # Create response
-        from flask import Response
-        return Response(
-            csv_content,
-            mimetype='text/csv',
-            headers={'Content-Disposition': f'attachment; filename=epic_estimates_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'}
-        )
+        return Response(csv_buffer.getvalue(), mimetype='text/csv', headers=csv_headers)
         
     except Exception as e:
         error_type = type(e).__name__
@@ -709,7 +1117,7 @@ def update_estimates():
         JSON response with update results
     """
     try:
-        data = request.get_json()
+        data = get_request_json()
         jira_url = data.get('jira_url')
         access_token = data.get('access_token')
         epic_analysis = data.get('epic_analysis', [])
@@ -726,7 +1134,8 @@ def update_estimates():
         
         # Filter epics that need updates with detailed logging
         epics_to_update = []
-        logger.info(f"🔍 Analyzing {len(epic_analysis)} epics for estimate updates...")
+        logger.info("🔍 Analyzing %d epics for estimate updates...", len(epic_analysis))
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         for epic in epic_analysis:
             epic_key = epic['key']
@@ -736,38 +1145,42 @@ def update_estimates():
             children_count = len(epic['children'])
             jira_has_zero = epic.get('jira_epic_has_zero_estimates', False)
             
-            logger.info(f"📋 Epic {epic_key}: display={epic_orig}h/{epic_rem}h, jira_zero={jira_has_zero}, children={num_children}/{children_count}")
+            if debug_enabled:
+                logger.debug("📋 Epic %s: display=%sh/%sh, jira_zero=%s, children=%s/%s",
+                             epic_key, epic_orig, epic_rem, jira_has_zero, num_children, children_count)
             
             # Check if epic has zero estimates in Jira (not calculated display values)
             if not jira_has_zero:
-                logger.info(f"  ❌ Skipped {epic_key}: Epic already has estimates in Jira")
+                logger.debug("  ❌ Skipped %s: Epic already has estimates in Jira", epic_key)
                 continue
                 
             if num_children == 0 or children_count == 0:
-                logger.info(f"  ❌ Skipped {epic_key}: No children (num_children={num_children}, children_count={children_count})")
+                logger.debug("  ❌ Skipped %s: No children (num_children=%s, children_count=%s)",
+                             epic_key, num_children, children_count)
                 continue
             
-            # Calculate child totals
-            child_original_total = sum(child['original_estimate'] for child in epic['children'])
-            child_remaining_total = sum(child['remaining_estimate'] for child in epic['children'])
-            
-            logger.info(f"  📊 {epic_key} children totals: orig={child_original_total}h, rem={child_remaining_total}h")
+            # Child totals, precomputed during analysis
+            child_original_total, child_remaining_total = get_child_totals(epic)
             
-            # Log each child's estimates
-            for child in epic['children']:
-                logger.info(f"    🔸 {child['key']}: {child['original_estimate']}h / {child['remaining_estimate']}h")
+            if debug_enabled:
+                logger.debug("  📊 %s children totals: orig=%sh, rem=%sh", epic_key, child_original_total, child_remaining_total)
+                
+                # Log each child's estimates
+                for child in epic['children']:
+                    logger.debug("    🔸 %s: %sh / %sh", child['key'], child['original_estimate'], child['remaining_estimate'])
             
             if child_original_total > 0 or child_remaining_total > 0:
-                logger.info(f"  ✅ {epic_key} qualifies for update: will set Jira to {child_original_total}h/{child_remaining_total}h")
+                logger.debug("  ✅ %s qualifies for update: will set Jira to %sh/%sh",
+                             epic_key, child_original_total, child_remaining_total)
                 epics_to_update.append({
                     'key': epic['key'],
                     'original_estimate': child_original_total,
                     'remaining_estimate': child_remaining_total
                 })
             else:
-                logger.info(f"  ❌ Skipped {epic_key}: Children have no estimates")
+                logger.debug("  ❌ Skipped %s: Children have no estimates", epic_key)
         
-        logger.info(f"📈 Found {len(epics_to_update)} epics that need estimate updates")
+        logger.info("📈 Found %d epics that need estimate updates", len(epics_to_update))
         
         if not epics_to_update:
             logger.warning("⚠️ No epics found that need estimate updates")
@@ -780,27 +1193,28 @@ def update_estimates():
                 }
             })
         
-        # Update estimates via API using JiraClient method
+        # Update estimates via API using JiraClient method, in parallel
         updated_count = 0
-        
-        for epic in epics_to_update:
-            try:
-                # Format estimates as Jira time strings
-                original_estimate_str = f"{epic['original_estimate']:.0f}h"
-                remaining_estimate_str = f"{epic['remaining_estimate']:.0f}h"
-                
-                # Use JiraClient's update method
-                success = jira_client.update_issue_estimates(
-                    epic['key'], 
-                    original_estimate_str, 
-                    remaining_estimate_str
-                )
-                
-                if success:
-                    updated_count += 1
-                    
-            except Exception as e:
-                logger.error(f"❌ Error updating {epic['key']}: {str(e)}")
+        max_workers = max(1, min(UPDATE_WORKERS, len(epics_to_update)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    call_jira_bounded,
+                    jira_client.update_issue_estimates,
+                    epic['key'],
+                    f"{epic['original_estimate']:.0f}h",  # Format estimates as Jira time strings
+                    f"{epic['remaining_estimate']:.0f}h"
+                ): epic
+                for epic in epics_to_update
+            }
+            for future in as_completed(futures):
+                epic = futures[future]
+                try:
+                    if future.result():
+                        updated_count += 1
+                except Exception as e:
+                    logger.error("❌ Error updating %s: %s", epic['key'], e)
         
         if updated_count > 0:
             return jsonify({
@@ -835,5 +1249,17 @@ def update_estimates():
         logger.error(f"Error in estimate update: {error_type} - {str(e)}", exc_info=True)
         return jsonify(error_response), 422
 
+@app.route('/admin/clear_cache', methods=['POST'])
+@rate_limit
+def clear_cache():
+    """
+    Clear cached epic children so the next analysis refetches from Jira.
+    
+    Returns:
+        JSON response with number of cleared entries
+    """
+    cleared = children_cache.clear()
+    return jsonify({'success': True, 'cleared_entries': cleared})
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5200)
@@ -0,0 +1,109 @@
+"""
+Analysis Jobs
+Runs long analyses on a background thread pool so web requests return a job ID immediately.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from flask import jsonify
+
+logger = logging.getLogger('AnalysisJobs')
+
+# Analyses are dominated by Jira I/O; finished results nobody collects expire after an hour
+JOB_WORKERS = int(os.environ.get('ANALYSIS_JOB_WORKERS', 4))
+JOB_TTL_SECONDS = int(os.environ.get('ANALYSIS_JOB_TTL', 3600))
+
+class AnalysisJobs:
+    """
+    Registry of background analyses keyed by job ID.
+    """
+
+    def __init__(self, max_workers: int = JOB_WORKERS, ttl_seconds: int = JOB_TTL_SECONDS):
+        """
+        Initialize the worker pool and the job registry.
+
+        Args:
+            max_workers (int): Analyses running at the same time
+            ttl_seconds (int): Time a job is kept after submission if its result is never collected
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='analysis-job')
+        self.ttl_seconds = ttl_seconds
+        self._jobs: Dict[str, tuple] = {}  # job ID -> (future, submitted at)
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable, *args, **kwargs) -> str:
+        """
+        Start func in the background.
+
+        Args:
+            func (Callable): Analysis to run
+            *args, **kwargs: Passed through to func
+
+        Returns:
+            str: Job ID to poll with get
+        """
+        job_id = uuid.uuid4().hex
+        future = self.executor.submit(func, *args, **kwargs)
+        now = time.monotonic()
+        with self._lock:
+            self._sweep(now)
+            self._jobs[job_id] = (future, now)
+        logger.info(f"🧵 Started analysis job {job_id}")
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Future]:
+        """
+        Look up a job, forgetting it once it is done so its result is handed out once.
+
+        Args:
+            job_id (str): Job ID returned by submit
+
+        Returns:
+            Optional[Future]: The job's future, or None for unknown or expired jobs
+        """
+        with self._lock:
+            self._sweep(time.monotonic())
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return None
+            if entry[0].done():
+                del self._jobs[job_id]
+            return entry[0]
+
+    def _sweep(self, now: float):
+        # Drop abandoned jobs; still-running ones keep their slot until they finish
+        expired = [job_id for job_id, (future, submitted) in self._jobs.items()
+                   if future.done() and now - submitted >= self.ttl_seconds]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+def job_status_response(jobs: AnalysisJobs, job_id: str):
+    """
+    Build the Flask response for polling a job.
+
+    The job function must return a (body, status code) pair.
+
+    Args:
+        jobs (AnalysisJobs): Registry holding the job
+        job_id (str): Job ID from the client
+
+    Returns:
+        Tuple: (JSON response, HTTP status) - 202 while running, 404 for unknown jobs
+    """
+    future = jobs.get(job_id)
+    if future is None:
+        return jsonify({'error': 'Unknown or expired analysis job'}), 404
+    if not future.done():
+        return jsonify({'status': 'running', 'job_id': job_id}), 202
+    try:
+        body, status = future.result()
+    except Exception as e:
+        logger.error(f"🚩 Analysis job {job_id} failed: {str(e)}")
+        return jsonify({'error': f'Analysis failed: {str(e)}', 'error_type': type(e).__name__}), 500
+    return jsonify(body), status
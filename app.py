@@ -10,22 +10,59 @@ from flask import Flask, render_template, request, jsonify, send_file
 import logging
 from datetime import datetime, timedelta
 import os
-import tempfile
 import base64
+import gzip
 from io import BytesIO
 
-from jira_client import JiraClient
+from jira_cache import CachedJiraClient, JiraIssueCache
+from json_provider import install_json_provider
 from data_analyzer import DataAnalyzer
 from visualization import VisualizationGenerator
 from pdf_generator import PDFReportGenerator
 
+try:
+    from waitress import serve
+except ImportError:  # waitress is optional; fall back to the threaded Werkzeug server
+    serve = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('JiraApp')
 
-app = Flask(__name__)
+app = install_json_provider(Flask(__name__))
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
 
+# Worker threads serving requests; analysis is dominated by Jira I/O, so one
+# slow query should never block other users.
+SERVER_THREADS = int(os.environ.get('JIRA_APP_THREADS', 16))
+
+# Stateless components shared by all requests. DataAnalyzer stays per request
+# because analyze_issues rewrites its status mappings from each data set.
+viz_generator = VisualizationGenerator()
+issue_cache = JiraIssueCache()
+
+# JSON responses carry base64 charts, which shrink well under gzip
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 6
+
+@app.after_request
+def compress_json_response(response):
+    """Gzip JSON responses for clients that accept it."""
+    if (response.mimetype != 'application/json'
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+    
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/')
 def index():
     """Main page with input form for Jira connection details."""
@@ -51,13 +88,12 @@ def analyze():
             return jsonify({'error': 'Missing required fields'}), 400
         
         # Initialize components
-        jira_client = JiraClient(jira_url, access_token)
+        jira_client = CachedJiraClient(jira_url, access_token, cache=issue_cache)
         data_analyzer = DataAnalyzer()
-        viz_generator = VisualizationGenerator()
         
         # Fetch and analyze data
         logger.info(f"🔗 Fetching data from Jira: {jira_url}")
-        issues = jira_client.fetch_issues(jql_query)
+        issues = jira_client.fetch_issues_parallel(jql_query)
         
         if not issues:
             return jsonify({'error': 'No issues found for the given query'}), 404
@@ -68,15 +104,18 @@ def analyze():
         # Generate visualizations
         charts = viz_generator.generate_all_charts(analysis_results)
         
-        return jsonify({
+        response = jsonify({
             'success': True,
             'total_issues': len(issues),
             'analysis_period': f"{time_period} months",
             'charts': charts,
             'jql_query': jql_query,  # Add this line
             'jira_url': jira_url,    # Add this line  
+            'cache_status': jira_client.cache_status,
             'metrics': analysis_results['metrics']
         })
+        response.headers['X-Cache-Status'] = jira_client.cache_status
+        return response
         
     except Exception as e:
         logger.error(f"🚩 Analysis error: {str(e)}")
@@ -110,9 +149,8 @@ def analyze_csv():
             return jsonify({'error': 'No file selected'}), 400
         
         # Initialize components
-        jira_client = JiraClient(jira_url, access_token)
+        jira_client = CachedJiraClient(jira_url, access_token, cache=issue_cache)
         data_analyzer = DataAnalyzer()
-        viz_generator = VisualizationGenerator()
         
         # Test connection first
         if not jira_client.test_connection():
@@ -137,7 +175,7 @@ def analyze_csv():
         # Generate visualizations
         charts = viz_generator.generate_all_charts(analysis_results)
         
-        return jsonify({
+        response = jsonify({
             'success': True,
             'total_issues': len(issues),
             'csv_issues_found': len(issue_keys),
@@ -145,8 +183,11 @@ def analyze_csv():
             'jql_query': f"key in ({', '.join(issue_keys[:10])}{'...' if len(issue_keys) > 10 else ''})",
             'jira_url': jira_url,
             'charts': charts,
+            'cache_status': jira_client.cache_status,
             'metrics': analysis_results['metrics']
         })
+        response.headers['X-Cache-Status'] = jira_client.cache_status
+        return response
         
     except Exception as e:
         logger.error(f"🚩 CSV Analysis error: {str(e)}")
@@ -159,18 +200,25 @@ def generate_report():
         data = request.get_json()
         pdf_generator = PDFReportGenerator()
         
-        # Generate PDF in temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            pdf_generator.generate_report(data, tmp_file.name)
-            return send_file(
-                tmp_file.name,
-                as_attachment=True,
-                download_name=f'jira_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf',
-                mimetype='application/pdf'
-            )
+        # Build the PDF in memory and stream it back
+        buffer = BytesIO()
+        pdf_generator.generate_report(data, buffer)
+        buffer.seek(0)
+        return send_file(
+            buffer,
+            as_attachment=True,
+            download_name=f'jira_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf',
+            mimetype='application/pdf'
+        )
     except Exception as e:
         logger.error(f"🚩 PDF generation error: {str(e)}")
         return jsonify({'error': f'⚠️ PDF generation failed: {str(e)}'}), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5100)
\ No newline at end of file
+    port = int(os.environ.get('PORT', 5100))
+    if serve is not None:
+        logger.info(f"🚀 Serving with waitress on port {port} ({SERVER_THREADS} threads)")
+        serve(app, host='0.0.0.0', port=port, threads=SERVER_THREADS)
+    else:
+        logger.info(f"🚀 waitress not installed, using threaded development server on port {port}")
+        app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
\ No newline at end of file
@@ -9,26 +9,47 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
 import json
 import os
 import logging
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 
+# Optional fast JSON parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger('CustomSlideGenerator')
 
+@lru_cache(maxsize=512)
+def text_width(text: str, font_name: str, font_size: float) -> float:
+    """Width of text in points; titles and footers repeat across slides, so widths are memoized."""
+    return stringWidth(text, font_name, font_size)
+
 class CustomSlideGenerator:
     """
     Generates custom PDF presentations from JSON configuration.
     """
     
+    # Parsed configs by path as (mtime, config), shared because a generator is built per request
+    _config_cache = {}
+    
     def __init__(self):
         """Initialize the custom slide generator."""
         self.page_width, self.page_height = landscape(A4)
         self.doc_folder = os.path.join(os.path.dirname(__file__), 'doc')
         self.images_folder = os.path.join(self.doc_folder, 'images')
         
+        # Decoded background images by path, None when the file is missing
+        self._image_cache = {}
+        self._fallback_color = colors.HexColor('#2c3e50')
+        
         # Create styles
         self.styles = getSampleStyleSheet()
         self.title_style = ParagraphStyle(
@@ -80,8 +101,15 @@ class CustomSlideGenerator:
         config_path = os.path.join(self.doc_folder, config_file)
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            mtime = os.path.getmtime(config_path)
+            cached = CustomSlideGenerator._config_cache.get(config_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            
+            with open(config_path, 'rb') as f:
+                raw = f.read()
+            config = orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
+            CustomSlideGenerator._config_cache[config_path] = (mtime, config)
             logger.info(f"📋 Loaded configuration from {config_path}")
             return config
         except Exception as e:
@@ -129,8 +157,11 @@ class CustomSlideGenerator:
         slides = config.get('slides', [])
         logger.info(f"📊 Generating presentation with {len(slides)} slides")
         
+        # Every slide shows the same date, so format it once per deck
+        today_str = datetime.now().strftime('%Y-%m-%d')
+        
         for slide_data in slides:
-            self._create_slide(c, slide_data)
+            self._create_slide(c, slide_data, today_str)
             c.showPage()
         
         c.save()
@@ -139,13 +170,14 @@ class CustomSlideGenerator:
         logger.info("✅ Custom presentation generated successfully")
         return buffer
     
-    def _create_slide(self, canvas_obj, slide_data: dict):
+    def _create_slide(self, canvas_obj, slide_data: dict, today_str: str):
         """
         Create a single slide with background and content.
         
         Args:
             canvas_obj: ReportLab canvas object
             slide_data (dict): Slide configuration data
+            today_str (str): Formatted date substituted for {current_date}
         """
         # Add background image
         self._add_background(canvas_obj, slide_data.get('background_image', 'slide_1.png'))
@@ -159,16 +191,14 @@ class CustomSlideGenerator:
         if title:
             canvas_obj.setFont("Helvetica-Bold", 36)
             canvas_obj.setFillColor(text_color)
-            text_width = canvas_obj.stringWidth(title, "Helvetica-Bold", 36)
-            canvas_obj.drawString((self.page_width - text_width) / 2, self.page_height - 150, title)
+            canvas_obj.drawString(self._centered_x(title, "Helvetica-Bold", 36), self.page_height - 150, title)
         
         # Add subtitle
         subtitle = slide_data.get('subtitle', '')
         if subtitle:
             canvas_obj.setFont("Helvetica", 24)
             canvas_obj.setFillColor(text_color)
-            text_width = canvas_obj.stringWidth(subtitle, "Helvetica", 24)
-            canvas_obj.drawString((self.page_width - text_width) / 2, self.page_height - 200, subtitle)
+            canvas_obj.drawString(self._centered_x(subtitle, "Helvetica", 24), self.page_height - 200, subtitle)
         
         # Add content
         content = slide_data.get('content', [])
@@ -179,18 +209,23 @@ class CustomSlideGenerator:
             y_position = self.page_height - 280
             for item in content:
                 # Replace placeholders
-                item = item.replace('{current_date}', datetime.now().strftime('%Y-%m-%d'))
+                if '{current_date}' in item:
+                    item = item.replace('{current_date}', today_str)
                 canvas_obj.drawString(100, y_position, item)
                 y_position -= 30
         
         # Add footer
         footer = slide_data.get('footer', '')
         if footer:
-            footer = footer.replace('{current_date}', datetime.now().strftime('%Y-%m-%d'))
+            if '{current_date}' in footer:
+                footer = footer.replace('{current_date}', today_str)
             canvas_obj.setFont("Helvetica", 12)
             canvas_obj.setFillColor(text_color)
-            text_width = canvas_obj.stringWidth(footer, "Helvetica", 12)
-            canvas_obj.drawString((self.page_width - text_width) / 2, 50, footer)
+            canvas_obj.drawString(self._centered_x(footer, "Helvetica", 12), 50, footer)
+    
+    def _centered_x(self, text: str, font_name: str, font_size: float) -> float:
+        """X position that horizontally centers text on the page."""
+        return (self.page_width - text_width(text, font_name, font_size)) / 2
     
     def _add_background(self, canvas_obj, background_image: str):
         """
@@ -203,9 +238,13 @@ class CustomSlideGenerator:
         try:
             image_path = os.path.join(self.images_folder, background_image)
             
-            if os.path.exists(image_path):
+            if image_path not in self._image_cache:
+                self._image_cache[image_path] = ImageReader(image_path) if os.path.exists(image_path) else None
+            reader = self._image_cache[image_path]
+            
+            if reader is not None:
                 canvas_obj.drawImage(
-                    image_path,
+                    reader,
                     0, 0,
                     width=self.page_width,
                     height=self.page_height,
@@ -213,13 +252,13 @@ class CustomSlideGenerator:
                 )
             else:
                 # Fallback: solid color background
-                canvas_obj.setFillColor(colors.HexColor('#2c3e50'))
+                canvas_obj.setFillColor(self._fallback_color)
                 canvas_obj.rect(0, 0, self.page_width, self.page_height, fill=1)
                 logger.warning(f"⚠️ Background image not found: {image_path}")
         
         except Exception as e:
             # Fallback: solid color background
-            canvas_obj.setFillColor(colors.HexColor('#2c3e50'))
+            canvas_obj.setFillColor(self._fallback_color)
             canvas_obj.rect(0, 0, self.page_width, self.page_height, fill=1)
             logger.warning(f"⚠️ Failed to load background: {str(e)}")
     
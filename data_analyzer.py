@@ -8,6 +8,8 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple
 import logging
+from collections import namedtuple
+from operator import attrgetter
 from dateutil import parser
 from scipy import stats
 import pytz
@@ -16,6 +18,48 @@ import pytz
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('JiraAnalyzer')
 
+# Transition dates are kept as UTC epoch nanoseconds; durations divide by this
+NS_PER_DAY = 86_400_000_000_000
+
+# Status categories measured for cycle time, in the column order of duration matrices
+STATUS_DURATION_TYPES = ('in_progress', 'testing', 'waiting', 'validation')
+
+# One status change of an issue; changed is in UTC epoch nanoseconds
+Transition = namedtuple('Transition', ['from_status', 'to_status', 'changed'])
+
+def accumulate_status_durations(offsets: np.ndarray, changed_ns: np.ndarray, codes: np.ndarray,
+                                end_ns: np.ndarray, n_types: int) -> np.ndarray:
+    """
+    Sum the days each issue spent in each status category.
+    
+    Transitions of issue i are changed_ns[offsets[i]:offsets[i + 1]]. Each status
+    lasts until the next transition of the same issue, and the final one until
+    end_ns[i]. Transitions must already be ordered by date within each issue.
+    
+    Args:
+        offsets (np.ndarray): int64 CSR offsets, one more than the number of issues
+        changed_ns (np.ndarray): int64 transition times in UTC epoch nanoseconds
+        codes (np.ndarray): int8 category code of each transition's target status, -1 if not measured
+        end_ns (np.ndarray): int64 end time per issue in UTC epoch nanoseconds
+        n_types (int): Number of category codes
+        
+    Returns:
+        np.ndarray: Days per issue (rows) and category code (columns)
+    """
+    n_issues = len(offsets) - 1
+    issue_idx = np.repeat(np.arange(n_issues), np.diff(offsets))
+    
+    next_ns = np.empty_like(changed_ns)
+    next_ns[:-1] = changed_ns[1:]
+    is_last = np.ones(len(issue_idx), dtype=bool)
+    is_last[:-1] = issue_idx[1:] != issue_idx[:-1]
+    next_ns[is_last] = end_ns[issue_idx[is_last]]
+    
+    mapped = codes >= 0
+    days = (next_ns[mapped] - changed_ns[mapped]) / NS_PER_DAY
+    totals = np.bincount(issue_idx[mapped] * n_types + codes[mapped], weights=days, minlength=n_issues * n_types)
+    return totals.reshape(n_issues, n_types)
+
 class DataAnalyzer:
     """
     Analyzes Jira issue data to calculate agile metrics.
@@ -40,6 +84,23 @@ class DataAnalyzer:
         }
         # Store discovered statuses for debugging
         self.discovered_statuses = set()
+        # Transitions to Done seen by the last lead time calculation, for logging
+        self._last_done_count = 0
+        # Malformed issues dropped by the last _create_dataframe call
+        self._skipped_count = 0
+        self._index_status_mappings()
+    
+    def _index_status_mappings(self):
+        """
+        Build the status name -> category lookup from status_mappings.
+        
+        Must be called whenever status_mappings is replaced. The first category
+        listing a status wins, matching the order the mappings are scanned in.
+        """
+        self._status_to_type = {}
+        for status_type, status_names in self.status_mappings.items():
+            for status_name in status_names:
+                self._status_to_type.setdefault(status_name, status_type)
     
     def _discover_and_map_statuses(self, df: pd.DataFrame) -> Dict[str, List[str]]:
         """
@@ -53,77 +114,115 @@ class DataAnalyzer:
             Dict[str, List[str]]: Enhanced status mappings
         """
         # Collect all unique status names from the data
-        all_statuses = set()
-        
-        for _, issue in df.iterrows():
-            if issue['current_status']:
-                all_statuses.add(issue['current_status'])
-            
-            for transition in issue['status_transitions']:
-                if transition.get('from_status'):
-                    all_statuses.add(transition['from_status'])
-                if transition.get('to_status'):
-                    all_statuses.add(transition['to_status'])
+        transitions = [transition for issue_transitions in df['status_transitions'].tolist() for transition in issue_transitions]
+        all_statuses = set(df['current_status'].tolist())
+        all_statuses.update(transition.from_status for transition in transitions)
+        all_statuses.update(transition.to_status for transition in transitions)
+        all_statuses = {status for status in all_statuses if status}
         
         self.discovered_statuses = all_statuses
         logger.info(f"🔍 Discovered statuses in data: {sorted(all_statuses)}")
         
         # Create enhanced mappings with fuzzy matching
         enhanced_mappings = {k: list(v) for k, v in self.status_mappings.items()}
+        self._build_known_status_index(enhanced_mappings)
         
         # Auto-map unmapped statuses using fuzzy matching against existing mappings
+        all_mapped = {status for status_list in enhanced_mappings.values() for status in status_list}
         for status in all_statuses:
-            already_mapped = any(status in mapping for mapping in enhanced_mappings.values())
-            
-            if not already_mapped:
-                best_match = self._find_best_status_match(status, enhanced_mappings)
+            if status not in all_mapped:
+                best_match = self._find_best_status_match(status)
                 if best_match:
                     enhanced_mappings[best_match].append(status)
+                    all_mapped.add(status)
+                    self._add_known_status(best_match, status)
                     logger.info(f"🔗 Auto-mapped '{status}' to '{best_match}'")
         
         return enhanced_mappings
     
-    def _find_best_status_match(self, status: str, mappings: Dict[str, List[str]]) -> str:
+    def _build_known_status_index(self, mappings: Dict[str, List[str]]):
+        """
+        Precompute lowercased names and word sets of the known statuses for fuzzy matching.
+        
+        Args:
+            mappings (Dict[str, List[str]]): Status mappings to match against
+        """
+        self._known_index = {
+            category: [(known.lower(), set(known.lower().split())) for known in known_statuses]
+            for category, known_statuses in mappings.items()
+        }
+        # First category listing a name wins, as in the fuzzy scan order
+        self._exact_lookup = {}
+        for category, entries in self._known_index.items():
+            for known_lower, _ in entries:
+                self._exact_lookup.setdefault(known_lower, category)
+        self._known_flat = None
+        self._match_cache = {}
+    
+    def _add_known_status(self, category: str, status: str):
+        """Add an auto-mapped status to the fuzzy matching index."""
+        status_lower = status.lower()
+        self._known_index[category].append((status_lower, set(status_lower.split())))
+        self._exact_lookup.setdefault(status_lower, category)
+        # A new known status can change the best match of any status
+        self._known_flat = None
+        self._match_cache.clear()
+    
+    def _find_best_status_match(self, status: str) -> str:
         """
         Find the best matching status category using fuzzy matching.
         
+        Matches against the index from _build_known_status_index. Results are
+        cached by lowercased name until the index changes.
+        
         Args:
             status (str): Status to match
-            mappings (Dict[str, List[str]]): Current status mappings
             
         Returns:
             str: Best matching category or None
         """
         status_lower = status.lower()
+        
+        # Exact match
+        if status_lower in self._exact_lookup:
+            return self._exact_lookup[status_lower]
+        
+        if status_lower in self._match_cache:
+            return self._match_cache[status_lower]
+        
+        # One flat list in category order, rebuilt only after the index changes
+        if self._known_flat is None:
+            self._known_flat = [
+                (known_lower, known_words, len(known_lower), len(known_words), category)
+                for category, entries in self._known_index.items()
+                for known_lower, known_words in entries
+            ]
+        
+        status_words = set(status_lower.split())
+        status_len = len(status_lower)
+        status_word_count = len(status_words)
         best_score = 0
         best_category = None
         
-        for category, known_statuses in mappings.items():
-            for known_status in known_statuses:
-                known_lower = known_status.lower()
-                
-                # Exact match
-                if status_lower == known_lower:
-                    return category
-                
-                # Substring match
-                if status_lower in known_lower or known_lower in status_lower:
-                    score = min(len(status_lower), len(known_lower)) / max(len(status_lower), len(known_lower))
-                    if score > best_score:
-                        best_score = score
-                        best_category = category
-                
-                # Word overlap
-                status_words = set(status_lower.split())
-                known_words = set(known_lower.split())
-                overlap = len(status_words & known_words)
-                if overlap > 0:
-                    score = overlap / max(len(status_words), len(known_words))
-                    if score > best_score:
-                        best_score = score
-                        best_category = category
-        
-        return best_category if best_score > 0.3 else None
+        for known_lower, known_words, known_len, known_word_count, category in self._known_flat:
+            # Substring match
+            if status_lower in known_lower or known_lower in status_lower:
+                score = min(status_len, known_len) / max(status_len, known_len)
+                if score > best_score:
+                    best_score = score
+                    best_category = category
+            
+            # Word overlap
+            overlap = len(status_words & known_words)
+            if overlap > 0:
+                score = overlap / max(status_word_count, known_word_count)
+                if score > best_score:
+                    best_score = score
+                    best_category = category
+        
+        result = best_category if best_score > 0.3 else None
+        self._match_cache[status_lower] = result
+        return result
     
     def analyze_issues(self, issues: List[Dict], months_back: int = 3) -> Dict:
         """
@@ -144,6 +243,7 @@ class DataAnalyzer:
         # Discover and map statuses from actual data
         if not df.empty:
             self.status_mappings = self._discover_and_map_statuses(df)
+            self._index_status_mappings()
         
         if df.empty:
             return self._empty_analysis_result()
@@ -159,8 +259,7 @@ class DataAnalyzer:
         
         # Calculate metrics
         lead_times = self._calculate_lead_times(df_filtered)
-        cycle_times = self._calculate_cycle_times(df_filtered)
-        status_durations = self._calculate_status_durations(df_filtered)
+        cycle_times, status_durations = self._compute_all_durations(df_filtered)
         
         # Generate distributions
         distributions = self._calculate_distributions(lead_times, cycle_times, status_durations)
@@ -184,21 +283,11 @@ class DataAnalyzer:
             avg_duration = np.mean(durations) if durations else 0
             logger.info(f"  📊 {status_type}: {count} measurements, avg {avg_duration:.1f} days")
 
-        # Check for Done transitions
-        done_transitions = 0
-        for _, issue in df_filtered.iterrows():
-            for transition in issue['status_transitions']:
-                if self._is_status_type(transition.get('to_status', ''), 'done'):
-                    done_transitions += 1
-
-        logger.info(f"✅ Issues with transitions to Done status: {done_transitions}")
-
-        # Log unmapped statuses
-        mapped_statuses = set()
-        for status_list in self.status_mappings.values():
-            mapped_statuses.update(status_list)
+        # Done transitions were counted while calculating lead times
+        logger.info(f"✅ Issues with transitions to Done status: {self._last_done_count}")
 
-        unmapped = self.discovered_statuses - mapped_statuses
+        # Log unmapped statuses; every mapped status is a key of the status lookup
+        unmapped = self.discovered_statuses - self._status_to_type.keys()
         if unmapped:
             logger.warning(f"⚠️ Unmapped statuses found: {sorted(list(unmapped))}")
         else:
@@ -230,6 +319,11 @@ class DataAnalyzer:
             # Fallback to UTC timezone
             return pd.Timestamp.now(tz=pytz.UTC) - pd.DateOffset(months=months_back)
         
+        # Typed columns carry their timezone even when every date is missing
+        column_tz = getattr(df['created'].dtype, 'tz', None)
+        if column_tz is not None:
+            return pd.Timestamp.now(tz=column_tz) - pd.DateOffset(months=months_back)
+        
         # Get the timezone from the first valid created date
         first_date = df['created'].dropna().iloc[0] if not df['created'].dropna().empty else None
         
@@ -251,46 +345,91 @@ class DataAnalyzer:
         Returns:
             pd.DataFrame: DataFrame with parsed dates and status transitions
         """
-        data = []
+        # First pass: validate issues and collect every date string so each kind is parsed in one vectorized call
+        valid_issues = []
+        created_raw = []
+        resolution_raw = []
+        changed_raw = []
+        skipped = 0
         
         for issue in issues:
-            try:
-                # Parse dates with timezone handling
-                created = self._parse_date_safe(issue.get('created'))
-                resolution_date = self._parse_date_safe(issue.get('resolution_date'))
-                
-                # Process status history
-                status_transitions = []
-                for transition in issue.get('status_history', []):
-                    try:
-                        changed_date = self._parse_date_safe(transition.get('changed'))
-                        if changed_date:
-                            status_transitions.append({
-                                'from_status': transition.get('from_status', ''),
-                                'to_status': transition.get('to_status', ''),
-                                'changed': changed_date
-                            })
-                    except Exception as e:
-                        logger.warning(f"⚠️ Failed to parse transition date for {issue.get('key', 'unknown')}: {str(e)}")
-                        continue
-                
-                data.append({
-                    'key': issue.get('key', ''),
-                    'summary': issue.get('summary', ''),
-                    'current_status': issue.get('status', ''),
-                    'issue_type': issue.get('issue_type', ''),
-                    'priority': issue.get('priority', ''),
-                    'created': created,
-                    'resolution_date': resolution_date,
-                    'assignee': issue.get('assignee', ''),
-                    'status_transitions': status_transitions
-                })
-                
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to process issue {issue.get('key', 'unknown')}: {str(e)}")
+            if not isinstance(issue, dict) or not issue.get('key'):
+                skipped += 1
                 continue
+            history = [transition for transition in issue.get('status_history') or [] if isinstance(transition, dict)]
+            created_raw.append(issue.get('created'))
+            resolution_raw.append(issue.get('resolution_date'))
+            changed_raw.extend(transition.get('changed') for transition in history)
+            valid_issues.append((issue, history))
+        
+        # Later stages assume well-formed issues, so report what was dropped once
+        self._skipped_count = skipped
+        if skipped:
+            logger.warning(f"⚠️ Skipped {skipped} malformed issues without a key")
+        
+        created_dates = self._parse_dates_utc(created_raw)
+        resolution_dates = self._parse_dates_utc(resolution_raw)
+        changed_dates = self._parse_dates_utc(changed_raw)
+        changed_ns = changed_dates.array.asi8.tolist()  # UTC epoch nanoseconds
+        changed_valid = changed_dates.notna().to_numpy().tolist()
+        
+        # Second pass: rebuild issues with parsed transitions
+        records = []
+        changed_pos = 0
+        
+        for issue, history in valid_issues:
+            # Process status history, dropping transitions whose date did not parse
+            status_transitions = []
+            for transition in history:
+                if changed_valid[changed_pos]:
+                    status_transitions.append(Transition(
+                        transition.get('from_status', ''),
+                        transition.get('to_status', ''),
+                        changed_ns[changed_pos]
+                    ))
+                changed_pos += 1
+            # Transitions are read in date order from here on, so sort them once
+            status_transitions.sort(key=attrgetter('changed'))
+            
+            records.append((
+                issue.get('key', ''),
+                issue.get('summary', ''),
+                issue.get('status', ''),
+                issue.get('issue_type', ''),
+                issue.get('priority', ''),
+                issue.get('assignee', ''),
+                status_transitions
+            ))
+        
+        df = pd.DataFrame.from_records(records, columns=[
+            'key', 'summary', 'current_status', 'issue_type', 'priority', 'assignee', 'status_transitions'
+        ])
+        # Dates keep their datetime64[ns, UTC] dtype from parsing
+        df.insert(5, 'created', created_dates.array)
+        df.insert(6, 'resolution_date', resolution_dates.array)
+        return df
+    
+    def _parse_dates_utc(self, date_strs: List[str]) -> pd.Series:
+        """
+        Parse many date strings at once into UTC timestamps.
+        
+        Jira's ISO 8601 dates go through pandas' vectorized parser; naive dates
+        are taken as UTC. Anything it rejects falls back to _parse_date_safe.
+        
+        Args:
+            date_strs (List[str]): Date strings, possibly empty or None
+            
+        Returns:
+            pd.Series: datetime64[ns, UTC] values, NaT where parsing failed
+        """
+        parsed = pd.to_datetime(pd.Series(date_strs, dtype=object), utc=True, errors='coerce', format='ISO8601')
+        
+        for i in np.flatnonzero(parsed.isna().to_numpy()):
+            fallback = self._parse_date_safe(date_strs[i]) if date_strs[i] else None
+            if fallback is not None:
+                parsed.iat[i] = fallback.tz_convert('UTC') if fallback.tz else fallback.tz_localize('UTC')
         
-        return pd.DataFrame(data)
+        return parsed
     
     def _parse_date_safe(self, date_str: str) -> pd.Timestamp:
         """
@@ -320,6 +459,8 @@ class DataAnalyzer:
         """
         Calculate lead times from first 'In Progress' to 'Done'.
         
+        Transitions to Done are counted on the way and left in self._last_done_count.
+        
         Args:
             df (pd.DataFrame): DataFrame with issue data
             
@@ -327,82 +468,88 @@ class DataAnalyzer:
             List[float]: List of lead times in days
         """
         lead_times = []
+        done_transitions = 0
         
-        for _, issue in df.iterrows():
-            try:
-                in_progress_date = None
-                done_date = None
-                
-                # Find first 'In Progress' transition
-                for transition in issue['status_transitions']:
-                    if self._is_status_type(transition['to_status'], 'in_progress'):
-                        in_progress_date = transition['changed']
-                        break
-                
-                # Find last 'Done' transition
-                for transition in reversed(issue['status_transitions']):
-                    if self._is_status_type(transition['to_status'], 'done'):
-                        done_date = transition['changed']
-                        break
+        for transitions in df['status_transitions'].tolist():
+            in_progress_date = None
+            done_date = None
+            
+            # Find first 'In Progress' and last 'Done' transition in one pass
+            for transition in transitions:
+                status_type = self._status_to_type.get(transition.to_status)
+                if status_type == 'in_progress':
+                    if in_progress_date is None:
+                        in_progress_date = transition.changed
+                elif status_type == 'done':
+                    done_date = transition.changed
+                    done_transitions += 1
+            
+            # Calculate lead time if both dates found
+            if in_progress_date is not None and done_date is not None:
+                lead_time = (done_date - in_progress_date) / NS_PER_DAY
                 
-                # Calculate lead time if both dates found
-                if in_progress_date and done_date and pd.notna(in_progress_date) and pd.notna(done_date):
-                    # Convert to timezone-naive for calculation if needed
-                    if hasattr(in_progress_date, 'tz') and hasattr(done_date, 'tz'):
-                        if in_progress_date.tz != done_date.tz:
-                            # Convert both to UTC for comparison
-                            in_progress_date = in_progress_date.tz_convert('UTC') if in_progress_date.tz else in_progress_date.tz_localize('UTC')
-                            done_date = done_date.tz_convert('UTC') if done_date.tz else done_date.tz_localize('UTC')
-                    
-                    lead_time_delta = done_date - in_progress_date
-                    lead_time = lead_time_delta.total_seconds() / (24 * 3600)
-                    
-                    if lead_time > 0:  # Only positive lead times
-                        lead_times.append(lead_time)
-                        
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to calculate lead time for {issue['key']}: {str(e)}")
-                continue
+                if lead_time > 0:  # Only positive lead times
+                    lead_times.append(lead_time)
         
+        self._last_done_count = done_transitions
         logger.info(f"✅ Calculated {len(lead_times)} lead times")
         return lead_times
     
-    def _calculate_cycle_times(self, df: pd.DataFrame) -> Dict[str, List[float]]:
+    def _compute_all_durations(self, df: pd.DataFrame) -> Tuple[Dict[str, List[float]], Dict[str, List[float]]]:
         """
-        Calculate time spent in each status category.
+        Calculate cycle times and status durations from one status duration matrix.
+        
+        Both share the same per-issue durations; cycle times add each issue's total.
         
         Args:
             df (pd.DataFrame): DataFrame with issue data
             
         Returns:
-            Dict[str, List[float]]: Dictionary with cycle times for each status
+            Tuple[Dict[str, List[float]], Dict[str, List[float]]]: Cycle times and status durations
         """
-        cycle_times = {
+        status_durations = {
             'in_progress': [],
             'testing': [],
-            'validation': [],
             'waiting': [],
-            'total': []
+            'validation': []
         }
         
-        for _, issue in df.iterrows():
-            try:
-                status_durations = self._calculate_issue_status_durations(issue)
-                
-                for status_type, duration in status_durations.items():
-                    if duration > 0:
-                        cycle_times[status_type].append(duration)
-                
-                # Calculate total cycle time
-                total_cycle = sum(status_durations.values())
-                if total_cycle > 0:
-                    cycle_times['total'].append(total_cycle)
-                    
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to calculate cycle times for {issue['key']}: {str(e)}")
-                continue
+        durations = self._status_duration_matrix(df)
+        for column, status_type in enumerate(STATUS_DURATION_TYPES):
+            values = durations[:, column]
+            status_durations[status_type] = values[values > 0].tolist()
+        
+        # Calculate total cycle time, summed in category order like the per-issue dicts
+        total_cycle = durations[:, 0] + durations[:, 1] + durations[:, 2] + durations[:, 3]
+        
+        cycle_times = {
+            'in_progress': list(status_durations['in_progress']),
+            'testing': list(status_durations['testing']),
+            'validation': list(status_durations['validation']),
+            'waiting': list(status_durations['waiting']),
+            'total': total_cycle[total_cycle > 0].tolist()
+        }
+        
+        return cycle_times, status_durations
+    
+    def _calculate_cycle_times(self, df: pd.DataFrame) -> Dict[str, List[float]]:
+        """
+        Calculate time spent in each status category.
         
-        return cycle_times
+        Args:
+            df (pd.DataFrame): DataFrame with issue data
+            
+        Returns:
+            Dict[str, List[float]]: Dictionary with cycle times for each status
+        """
+        return self._compute_all_durations(df)[0]
+    
+    @staticmethod
+    def _to_ns(value):
+        """Convert a timestamp to UTC epoch nanoseconds, None if missing. Naive values count as UTC."""
+        if value is None or pd.isna(value):
+            return None
+        return pd.Timestamp(value).value
     
     def _calculate_issue_status_durations(self, issue: pd.Series) -> Dict[str, float]:
         """
@@ -414,78 +561,75 @@ class DataAnalyzer:
         Returns:
             Dict[str, float]: Duration in days for each status type
         """
-        durations = {
-            'in_progress': 0.0,
-            'testing': 0.0,
-            'waiting': 0.0,
-            'validation': 0.0
-        }
-        
-        transitions = issue['status_transitions']
-        if not transitions:
-            return durations
-        
-        # Sort transitions by date
-        try:
-            transitions = sorted(transitions, key=lambda x: x['changed'])
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to sort transitions for {issue['key']}: {str(e)}")
-            return durations
+        # Validate the raw row the way _create_dataframe does: undated transitions are dropped
+        transitions = [
+            Transition(transition.get('from_status', ''), transition.get('to_status', ''), self._to_ns(transition.get('changed')))
+            for transition in issue['status_transitions']
+        ]
+        transitions = [transition for transition in transitions if transition.changed is not None]
+        return self._issue_status_durations(transitions, self._to_ns(issue['resolution_date']))
+    
+    def _issue_status_durations(self, transitions: List[Transition], resolution_ns) -> Dict[str, float]:
+        """
+        Calculate time spent in each status from one issue's transitions.
         
-        current_status = None
-        current_start = None
+        Args:
+            transitions (List[Transition]): Status transitions of the issue
+            resolution_ns: Resolution time in UTC epoch nanoseconds, or None if unresolved
+            
+        Returns:
+            Dict[str, float]: Duration in days for each status type
+        """
+        transitions = sorted(transitions, key=attrgetter('changed'))
+        end_ns = resolution_ns if resolution_ns is not None else pd.Timestamp.now(tz=pytz.UTC).value
+        row = self._duration_matrix([transitions], np.array([end_ns], dtype=np.int64))[0]
+        return dict(zip(STATUS_DURATION_TYPES, row.tolist()))
+    
+    def _status_duration_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Calculate time spent in each status category for every issue in the DataFrame.
         
-        for transition in transitions:
-            try:
-                # End previous status
-                if current_status and current_start and pd.notna(current_start):
-                    transition_date = transition['changed']
-                    if pd.notna(transition_date):
-                        # Handle timezone differences
-                        if hasattr(current_start, 'tz') and hasattr(transition_date, 'tz'):
-                            if current_start.tz != transition_date.tz:
-                                current_start = current_start.tz_convert('UTC') if current_start.tz else current_start.tz_localize('UTC')
-                                transition_date = transition_date.tz_convert('UTC') if transition_date.tz else transition_date.tz_localize('UTC')
-                        
-                        duration_delta = transition_date - current_start
-                        duration = duration_delta.total_seconds() / (24 * 3600)
-                        
-                        for status_type, status_names in self.status_mappings.items():
-                            if status_type in durations and current_status in status_names:
-                                durations[status_type] += duration
-                                break
-                
-                # Start new status
-                current_status = transition['to_status']
-                current_start = transition['changed']
-                
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to process transition for {issue['key']}: {str(e)}")
-                continue
+        Args:
+            df (pd.DataFrame): DataFrame with issue data
+            
+        Returns:
+            np.ndarray: Days per issue (rows) and STATUS_DURATION_TYPES category (columns)
+        """
+        # Unresolved issues are still accruing time in their current status
+        resolution_dates = pd.to_datetime(df['resolution_date'], utc=True)
+        end_ns = np.where(resolution_dates.isna().to_numpy(), pd.Timestamp.now(tz=pytz.UTC).value,
+                          resolution_dates.array.asi8)
+        return self._duration_matrix(df['status_transitions'].tolist(), end_ns)
+    
+    def _duration_matrix(self, transitions_per_issue: List[List[Transition]], end_ns: np.ndarray) -> np.ndarray:
+        """
+        Accumulate status durations for many issues.
         
-        # Handle final status if issue is still in progress
-        try:
-            if current_status and current_start and pd.notna(current_start):
-                end_time = issue['resolution_date'] if pd.notna(issue['resolution_date']) else pd.Timestamp.now(tz=current_start.tz if hasattr(current_start, 'tz') else None)
-                
-                if pd.notna(end_time):
-                    # Handle timezone differences
-                    if hasattr(current_start, 'tz') and hasattr(end_time, 'tz'):
-                        if current_start.tz != end_time.tz:
-                            current_start = current_start.tz_convert('UTC') if current_start.tz else current_start.tz_localize('UTC')
-                            end_time = end_time.tz_convert('UTC') if end_time.tz else end_time.tz_localize('UTC')
-                    
-                    duration_delta = end_time - current_start
-                    duration = duration_delta.total_seconds() / (24 * 3600)
-                    
-                    for status_type, status_names in self.status_mappings.items():
-                        if status_type in durations and current_status in status_names:
-                            durations[status_type] += duration
-                            break
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to calculate final status duration for {issue['key']}: {str(e)}")
+        Flattens the transitions into CSR arrays with status names pre-mapped to
+        integer category codes, then hands them to accumulate_status_durations.
         
-        return durations
+        Args:
+            transitions_per_issue (List[List[Transition]]): Per issue, date-ordered transitions
+            end_ns (np.ndarray): Per issue, resolution time (or now if unresolved) in UTC epoch nanoseconds
+            
+        Returns:
+            np.ndarray: Days per issue (rows) and STATUS_DURATION_TYPES category (columns)
+        """
+        n_issues = len(transitions_per_issue)
+        n_types = len(STATUS_DURATION_TYPES)
+        type_codes = {status_type: code for code, status_type in enumerate(STATUS_DURATION_TYPES)}
+        status_codes = {status: type_codes.get(status_type, -1) for status, status_type in self._status_to_type.items()}
+        
+        offsets = np.zeros(n_issues + 1, dtype=np.int64)
+        np.cumsum([len(transitions) for transitions in transitions_per_issue], out=offsets[1:])
+        changed_ns = np.fromiter(
+            (transition.changed for transitions in transitions_per_issue for transition in transitions),
+            dtype=np.int64, count=offsets[-1])
+        codes = np.fromiter(
+            (status_codes.get(transition.to_status, -1) for transitions in transitions_per_issue for transition in transitions),
+            dtype=np.int8, count=offsets[-1])
+        
+        return accumulate_status_durations(offsets, changed_ns, codes, end_ns, n_types)
     
     def _calculate_status_durations(self, df: pd.DataFrame) -> Dict[str, List[float]]:
         """
@@ -497,20 +641,7 @@ class DataAnalyzer:
         Returns:
             Dict[str, List[float]]: Status durations for each category
         """
-        all_durations = {
-            'in_progress': [],
-            'testing': [],
-            'waiting': [],
-            'validation': []
-        }
-        
-        for _, issue in df.iterrows():
-            durations = self._calculate_issue_status_durations(issue)
-            for status_type, duration in durations.items():
-                if duration > 0:
-                    all_durations[status_type].append(duration)
-        
-        return all_durations
+        return self._compute_all_durations(df)[1]
     
     def _calculate_distributions(self, lead_times: List[float], 
                                cycle_times: Dict[str, List[float]], 
@@ -557,18 +688,18 @@ class DataAnalyzer:
         if not data:
             return {}
         
-        data_array = np.array(data)
+        data_array = np.asarray(data, dtype=float)
         
         # Calculate basic statistics
-        mean = np.mean(data_array)
-        std = np.std(data_array)
+        mean = data_array.mean()
+        std = data_array.std()
         median = np.median(data_array)
         
-        # Fit normal distribution
-        params = stats.norm.fit(data_array)
+        # Fit normal distribution; the maximum likelihood fit is just the mean and population std
+        params = (mean, std)
         
-        # Perform normality test
-        if len(data_array) > 3:
+        # Perform normality test where Shapiro-Wilk is meaningful
+        if 8 <= len(data_array) <= 5000:
             try:
                 _, p_value = stats.shapiro(data_array)
             except Exception:
@@ -581,8 +712,8 @@ class DataAnalyzer:
             'std': std,
             'median': median,
             'count': len(data_array),
-            'min': np.min(data_array),
-            'max': np.max(data_array),
+            'min': data_array.min(),
+            'max': data_array.max(),
             'distribution_params': {
                 'loc': params[0],  # mean
                 'scale': params[1]  # std
@@ -609,25 +740,36 @@ class DataAnalyzer:
         
         # Lead time metrics
         if lead_times:
-            metrics['lead_time'] = {
-                'average': np.mean(lead_times),
-                'median': np.median(lead_times),
-                'p85': np.percentile(lead_times, 85),
-                'p95': np.percentile(lead_times, 95)
-            }
+            metrics['lead_time'] = self._summarize_durations(lead_times)
         
         # Cycle time metrics
         for status, times in cycle_times.items():
             if times:
-                metrics[f'cycle_time_{status}'] = {
-                    'average': np.mean(times),
-                    'median': np.median(times),
-                    'p85': np.percentile(times, 85),
-                    'p95': np.percentile(times, 95)
-                }
+                metrics[f'cycle_time_{status}'] = self._summarize_durations(times)
         
         return metrics
     
+    def _summarize_durations(self, values: List[float]) -> Dict:
+        """
+        Average, median and upper percentiles of a list of durations.
+        
+        All three percentiles come from one np.percentile call, which sorts the data once.
+        
+        Args:
+            values (List[float]): Durations in days
+            
+        Returns:
+            Dict: average, median, p85 and p95
+        """
+        values = np.asarray(values, dtype=float)
+        median, p85, p95 = np.percentile(values, [50, 85, 95])
+        return {
+            'average': values.mean(),
+            'median': median,
+            'p85': p85,
+            'p95': p95
+        }
+    
     def _is_status_type(self, status_name: str, status_type: str) -> bool:
         """
         Check if a status name belongs to a specific status type.
@@ -639,10 +781,7 @@ class DataAnalyzer:
         Returns:
             bool: True if status belongs to type
         """
-        if status_type not in self.status_mappings:
-            return False
-        
-        return status_name in self.status_mappings[status_type]
+        return self._status_to_type.get(status_name) == status_type
     
     def _empty_analysis_result(self) -> Dict:
         """
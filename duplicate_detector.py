@@ -7,11 +7,21 @@ Purpose: Detect duplicate stories to improve backlog quality
 """
 
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from typing import List, Dict, Tuple
 from difflib import SequenceMatcher
 import re
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+
+import numpy as np
+from scipy.spatial.distance import cdist
 
 from jira_client import JiraClient
 
@@ -19,6 +29,91 @@ from jira_client import JiraClient
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('DuplicateDetector')
 
+# Jira markup stripped before comparing texts: {code}, {quote}, etc. and [links]
+JIRA_MARKUP_PATTERN = re.compile(r'\{[^}]*\}|\[[^\]]*\]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Rows of the candidate bound computed per block, keeping memory at block x issues
+CANDIDATE_BLOCK_ROWS = 512
+
+# Issues requested per Jira search page
+SEARCH_BATCH_SIZE = 500
+
+# Candidate pairs are scored in worker processes once there are enough to pay for starting them
+SIMILARITY_WORKERS = int(os.environ.get('DUPLICATE_WORKERS', os.cpu_count() or 1))
+PARALLEL_MIN_PAIRS = int(os.environ.get('DUPLICATE_PARALLEL_MIN_PAIRS', 20000))
+
+# Optional word-set Jaccard floor applied before scoring; approximate, so off unless set
+TOKEN_OVERLAP_THRESHOLD = float(os.environ['DUPLICATE_TOKEN_OVERLAP']) if os.environ.get('DUPLICATE_TOKEN_OVERLAP') else None
+
+# Similarity process pool, created on first use and shared by all analyses
+similarity_pool = None
+similarity_pool_lock = threading.Lock()
+
+def get_similarity_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared similarity scoring process pool, creating it on first use.
+
+    Analyses run on threads of a multi-threaded server, and forking such a process can
+    copy locks held by other threads into the child, so workers are started from a
+    clean forkserver (spawn where forkserver is unavailable) instead.
+    """
+    global similarity_pool
+    with similarity_pool_lock:
+        if similarity_pool is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            similarity_pool = ProcessPoolExecutor(max_workers=SIMILARITY_WORKERS,
+                                                  mp_context=multiprocessing.get_context(start_method))
+        return similarity_pool
+
+@lru_cache(maxsize=4096)
+def clean_issue_text(summary: str, description: str) -> str:
+    """
+    Combine an issue's summary and description and strip Jira markup.
+
+    Cached, so issues seen by earlier analyses in this process are not cleaned again.
+
+    Args:
+        summary (str): Issue summary
+        description (str): Issue description, empty if the issue has none
+
+    Returns:
+        str: Combined text with markup removed and whitespace normalized
+    """
+    combined_text = f"{summary} {description}"
+    combined_text = JIRA_MARKUP_PATTERN.sub('', combined_text)  # Remove {code}, {quote}, [links], etc.
+    combined_text = WHITESPACE_PATTERN.sub(' ', combined_text)  # Normalize whitespace
+    return combined_text.strip()
+
+def score_candidate_pairs(texts: List[str], pairs: List[Tuple[int, int]], threshold: float) -> List[Tuple[int, int, float]]:
+    """
+    Score candidate pairs with SequenceMatcher, keeping those that reach the threshold.
+
+    Module-level so it can run in a worker process. Pairs are scored grouped by their
+    second text, so SequenceMatcher indexes each second text once (set_seq2) and
+    only swaps the first text (set_seq1) between pairs.
+
+    Args:
+        texts (List[str]): Cleaned, lowercased issue texts
+        pairs (List[Tuple[int, int]]): Candidate pairs (i, j) with i < j
+        threshold (float): Minimum similarity to keep a pair
+
+    Returns:
+        List[Tuple[int, int, float]]: (i, j, similarity) for pairs reaching the threshold
+    """
+    scored = []
+    matcher = SequenceMatcher(None)
+    current_j = None
+    for i, j in sorted(pairs, key=itemgetter(1)):
+        if j != current_j:
+            matcher.set_seq2(texts[j])
+            current_j = j
+        matcher.set_seq1(texts[i])
+        similarity = matcher.ratio()
+        if similarity >= threshold:
+            scored.append((i, j, similarity))
+    return scored
+
 class DuplicateDetector:
     """
     Detects potential duplicate stories in Jira based on text similarity.
@@ -33,6 +128,7 @@ class DuplicateDetector:
         """
         self.jira_client = jira_client
         self.similarity_threshold = 0.6  # Minimum similarity to consider as potential duplicate
+        self.token_overlap_threshold = TOKEN_OVERLAP_THRESHOLD  # Word overlap prefilter, None to score every candidate
         
     def analyze_duplicates(self, jql_query: str) -> Dict:
         """
@@ -47,7 +143,7 @@ class DuplicateDetector:
         logger.info(f"🔍 Starting duplicate analysis with JQL: {jql_query}")
         
         # Fetch issues
-        issues = self.jira_client.fetch_issues(jql_query, max_results=1000)
+        issues = self.jira_client.fetch_issues(jql_query, max_results=1000, batch_size=SEARCH_BATCH_SIZE)
         
         if not issues:
             return {'error': 'No issues found for the given query'}
@@ -74,54 +170,57 @@ class DuplicateDetector:
             List[Dict]: List of duplicate groups
         """
         duplicate_groups = []
-        processed_issues = set()
         
-        for i, issue1 in enumerate(issues):
-            if issue1['key'] in processed_issues:
-                continue
-                
-            # Find similar issues
-            similar_issues = []
-            
-            for j, issue2 in enumerate(issues):
-                if i != j and issue2['key'] not in processed_issues:
-                    similarity = self._calculate_similarity(issue1, issue2)
-                    
-                    if similarity >= self.similarity_threshold:
-                        similar_issues.append({
-                            'issue': issue2,
-                            'similarity': similarity
-                        })
-            
-            # If we found similar issues, create a group
-            if similar_issues:
+        # Clean every issue's text once instead of once per compared pair
+        texts = [self._extract_text_content(issue).lower() for issue in issues]
+        similarities = self._pairwise_similarities(texts)
+        
+        # Union-Find over similar pairs, so transitively similar issues share a group
+        # whatever order they come in
+        parents = list(range(len(issues)))
+        
+        def find(k: int) -> int:
+            while parents[k] != k:
+                parents[k] = parents[parents[k]]
+                k = parents[k]
+            return k
+        
+        for i, j in similarities:
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parents[max(root_i, root_j)] = min(root_i, root_j)
+        
+        components = defaultdict(list)
+        for k in range(len(issues)):
+            components[find(k)].append(k)
+        
+        for group_indices in components.values():
+            if len(group_indices) > 1:
                 # Sort by creation date (oldest first)
-                all_issues = [issue1] + [item['issue'] for item in similar_issues]
-                all_issues.sort(key=lambda x: x.get('created', ''))
-                
-                # Mark all issues as processed
-                for issue in all_issues:
-                    processed_issues.add(issue['key'])
+                group_indices.sort(key=lambda k: issues[k].get('created', ''))
                 
                 # Create group with oldest as primary
-                primary_issue = all_issues[0]
+                primary = group_indices[0]
                 duplicates = []
                 
-                for issue in all_issues[1:]:
-                    # Recalculate similarity with primary issue
-                    similarity = self._calculate_similarity(primary_issue, issue)
+                for k in group_indices[1:]:
+                    # Reuse the similarity with the primary issue; members joined only through
+                    # another issue are scored against the primary here
+                    pair = (min(primary, k), max(primary, k))
+                    if pair not in similarities:
+                        similarities[pair] = self._calculate_similarity(texts[pair[0]], texts[pair[1]])
                     duplicates.append({
-                        'issue': issue,
-                        'similarity': similarity
+                        'issue': issues[k],
+                        'similarity': similarities[pair]
                     })
                 
                 # Sort duplicates by similarity (highest first)
                 duplicates.sort(key=lambda x: x['similarity'], reverse=True)
                 
                 duplicate_groups.append({
-                    'primary_issue': primary_issue,
+                    'primary_issue': issues[primary],
                     'duplicates': duplicates,
-                    'group_size': len(all_issues)
+                    'group_size': len(group_indices)
                 })
         
         # Sort groups by group size (largest first)
@@ -129,25 +228,131 @@ class DuplicateDetector:
         
         return duplicate_groups
     
-    def _calculate_similarity(self, issue1: Dict, issue2: Dict) -> float:
+    def _pairwise_similarities(self, texts: List[str]) -> Dict[Tuple[int, int], float]:
         """
-        Calculate similarity between two issues based on summary and description.
+        Find the pairs of texts that reach the similarity threshold.
         
         Args:
-            issue1 (Dict): First issue
-            issue2 (Dict): Second issue
+            texts (List[str]): Cleaned, lowercased issue texts
             
         Returns:
-            float: Similarity score between 0 and 1
+            Dict[Tuple[int, int], float]: Similarity of each pair (i, j), i < j, that reaches the threshold
         """
-        # Get text content
-        text1 = self._extract_text_content(issue1)
-        text2 = self._extract_text_content(issue2)
+        # Candidates already pass quick_ratio's bound, so only the full match remains per pair
+        pairs = self._candidate_pairs(texts)
+        if self.token_overlap_threshold:
+            pairs = self._filter_by_token_overlap(texts, pairs)
+        workers = min(SIMILARITY_WORKERS, len(pairs) // max(PARALLEL_MIN_PAIRS, 1) + 1)
+        if workers <= 1:
+            scored = score_candidate_pairs(texts, pairs, self.similarity_threshold)
+        else:
+            logger.info(f"⚡ Scoring {len(pairs)} candidate pairs in {workers} processes")
+            # Keep pairs sharing a second text together so workers reuse its index
+            pairs.sort(key=itemgetter(1))
+            chunk_size = -(-len(pairs) // workers)
+            chunks = [pairs[start:start + chunk_size] for start in range(0, len(pairs), chunk_size)]
+            try:
+                scored = [result
+                          for chunk_results in get_similarity_pool().map(score_candidate_pairs, [texts] * len(chunks),
+                                                                         chunks, [self.similarity_threshold] * len(chunks))
+                          for result in chunk_results]
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"⚠️ Similarity process pool unavailable, scoring in-process: {str(e)}")
+                global similarity_pool
+                with similarity_pool_lock:
+                    similarity_pool = None
+                scored = score_candidate_pairs(texts, pairs, self.similarity_threshold)
+        return {(i, j): similarity for i, j, similarity in scored}
+    
+    def _filter_by_token_overlap(self, texts: List[str], pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Drop candidate pairs whose word sets overlap less than token_overlap_threshold.
         
-        # Calculate similarity using SequenceMatcher
-        similarity = SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        Word Jaccard is not a bound on SequenceMatcher.ratio(), so this trades some
+        recall for speed: pairs that share characters across different words are lost.
+        
+        Args:
+            texts (List[str]): Cleaned, lowercased issue texts
+            pairs (List[Tuple[int, int]]): Candidate pairs (i, j) with i < j
+            
+        Returns:
+            List[Tuple[int, int]]: Pairs whose word-set Jaccard reaches the threshold
+        """
+        token_sets = [frozenset(text.split()) for text in texts]
+        kept = []
+        for i, j in pairs:
+            union = len(token_sets[i] | token_sets[j])
+            # Two texts without words have nothing to compare and stay candidates
+            if not union or len(token_sets[i] & token_sets[j]) >= self.token_overlap_threshold * union:
+                kept.append((i, j))
+        logger.info(f"🔎 Token overlap kept {len(kept)} of {len(pairs)} candidate pairs")
+        return kept
+    
+    def _candidate_pairs(self, texts: List[str]) -> List[Tuple[int, int]]:
+        """
+        Find text pairs whose similarity can reach the threshold.
+        
+        SequenceMatcher.ratio() never exceeds 2 * shared characters / total length,
+        counting characters as multisets (its quick_ratio). That bound is evaluated
+        for all pairs from character count vectors in native code, so only
+        candidates go through the expensive matching. Texts are sorted by length
+        so each block is only compared against the band of lengths that can reach
+        the threshold: 2 * l1 / (l1 + l2) >= threshold means l2 <= l1 * (2 - threshold) / threshold.
+        
+        Args:
+            texts (List[str]): Cleaned, lowercased issue texts
+            
+        Returns:
+            List[Tuple[int, int]]: Candidate pairs (i, j) with i < j
+        """
+        if len(texts) < 2:
+            return []
+        
+        codepoints = [np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32) for text in texts]
+        alphabet = np.unique(np.concatenate(codepoints))
+        counts = np.zeros((len(texts), max(len(alphabet), 1)), dtype=np.int32)
+        for i, text_codepoints in enumerate(codepoints):
+            counts[i] = np.bincount(np.searchsorted(alphabet, text_codepoints), minlength=counts.shape[1])
+        
+        order = np.argsort(counts.sum(axis=1), kind='stable')
+        counts = counts[order]
+        lengths = counts.sum(axis=1)
+        if self.similarity_threshold > 0:
+            max_length_factor = (2 - self.similarity_threshold) / self.similarity_threshold
+        else:
+            max_length_factor = np.inf
         
-        return similarity
+        # shared = (total length - L1 distance of the count vectors) / 2, so the bound
+        # for a block of rows against its length band is one native cityblock cdist call
+        pairs = []
+        for start in range(0, len(texts), CANDIDATE_BLOCK_ROWS):
+            stop = min(start + CANDIDATE_BLOCK_ROWS, len(texts))
+            # Rows are sorted, so the longest text of the block sets the end of the band
+            band_end = np.searchsorted(lengths, lengths[stop - 1] * max_length_factor + 1e-9, side='right')
+            total = lengths[start:stop, None] + lengths[None, start:band_end]
+            matched = total - cdist(counts[start:stop], counts[start:band_end], 'cityblock')
+            # Two empty texts count as identical, like SequenceMatcher does
+            bound = np.divide(matched, total, out=np.ones(total.shape), where=total > 0)
+            block_i, block_j = np.nonzero(bound >= self.similarity_threshold)
+            upper = block_j > block_i
+            first = order[block_i[upper] + start]
+            second = order[block_j[upper] + start]
+            pairs.extend(zip(np.minimum(first, second).tolist(), np.maximum(first, second).tolist()))
+        return pairs
+    
+    def _calculate_similarity(self, text1: str, text2: str) -> float:
+        """
+        Calculate similarity between two issues' cleaned text content.
+        
+        Args:
+            text1 (str): Lowercased text of the first issue, from _extract_text_content
+            text2 (str): Lowercased text of the second issue
+            
+        Returns:
+            float: Similarity score between 0 and 1
+        """
+        # Calculate similarity using SequenceMatcher
+        return SequenceMatcher(None, text1, text2).ratio()
     
     def _extract_text_content(self, issue: Dict) -> str:
         """
@@ -168,15 +373,8 @@ class DuplicateDetector:
         if fields and 'description' in fields and fields['description']:
             description = fields['description']
         
-        # Combine and clean text
-        combined_text = f"{summary} {description}"
-        
-        # Remove common Jira markup and normalize
-        combined_text = re.sub(r'\{[^}]*\}', '', combined_text)  # Remove {code}, {quote}, etc.
-        combined_text = re.sub(r'\[[^\]]*\]', '', combined_text)  # Remove [links]
-        combined_text = re.sub(r'\s+', ' ', combined_text)  # Normalize whitespace
-        
-        return combined_text.strip()
+        # Combine and clean text, as strings so any field value can be a cache key
+        return clean_issue_text(str(summary), str(description))
     
     def _create_analysis_report(self, issues: List[Dict], duplicate_groups: List[Dict], jql_query: str) -> Dict:
         """
@@ -190,30 +388,39 @@ class DuplicateDetector:
         Returns:
             Dict: Complete analysis report
         """
-        # Calculate statistics
+        # Group and similarity totals in one pass over the groups
         total_issues = len(issues)
-        issues_in_groups = sum(group['group_size'] for group in duplicate_groups)
+        issues_in_groups = 0
+        largest_group_size = 0
+        similarity_count = 0
+        similarity_sum = 0.0
+        max_similarity = float('-inf')
+        min_similarity = float('inf')
+        for group in duplicate_groups:
+            issues_in_groups += group['group_size']
+            largest_group_size = max(largest_group_size, group['group_size'])
+            for duplicate in group['duplicates']:
+                similarity = duplicate['similarity']
+                similarity_count += 1
+                similarity_sum += similarity
+                max_similarity = max(max_similarity, similarity)
+                min_similarity = min(min_similarity, similarity)
         potential_duplicates = issues_in_groups - len(duplicate_groups)  # Exclude primary issues
         
         # Group statistics
         group_stats = {
             'total_groups': len(duplicate_groups),
-            'largest_group_size': max([group['group_size'] for group in duplicate_groups]) if duplicate_groups else 0,
-            'average_group_size': sum([group['group_size'] for group in duplicate_groups]) / len(duplicate_groups) if duplicate_groups else 0
+            'largest_group_size': largest_group_size,
+            'average_group_size': issues_in_groups / len(duplicate_groups) if duplicate_groups else 0
         }
         
         # Similarity statistics
-        all_similarities = []
-        for group in duplicate_groups:
-            for duplicate in group['duplicates']:
-                all_similarities.append(duplicate['similarity'])
-        
         similarity_stats = {}
-        if all_similarities:
+        if similarity_count:
             similarity_stats = {
-                'average_similarity': sum(all_similarities) / len(all_similarities),
-                'max_similarity': max(all_similarities),
-                'min_similarity': min(all_similarities)
+                'average_similarity': similarity_sum / similarity_count,
+                'max_similarity': max_similarity,
+                'min_similarity': min_similarity
             }
         
         return {
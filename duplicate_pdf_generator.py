@@ -13,7 +13,7 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from datetime import datetime
 import logging
-from typing import Dict
+from typing import BinaryIO, Dict, Union
 
 # Configure logger
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -56,13 +56,13 @@ class DuplicatePDFReportGenerator:
             textColor=colors.red
         )
     
-    def generate_report(self, analysis_data: Dict, output_path: str):
+    def generate_report(self, analysis_data: Dict, output_path: Union[str, BinaryIO]):
         """
         Generate complete PDF report.
         
         Args:
             analysis_data (Dict): Analysis results
-            output_path (str): Path to save the PDF report
+            output_path (Union[str, BinaryIO]): Path or binary buffer to write the PDF report to
         """
         try:
             # Create PDF document
@@ -106,7 +106,8 @@ class DuplicatePDFReportGenerator:
                 canvas.restoreState()
             
             doc.build(story, onFirstPage=add_page_elements, onLaterPages=add_page_elements)
-            logger.info(f"✅ PDF report generated successfully: {output_path}")
+            destination = output_path if isinstance(output_path, str) else 'in memory'
+            logger.info(f"✅ PDF report generated successfully: {destination}")
             
         except Exception as e:
             logger.error(f"🚩 PDF generation failed: {str(e)}")
@@ -9,20 +9,33 @@ Purpose: Web interface for duplicate story detection
 from flask import Flask, render_template, request, jsonify, send_file
 import logging
 from datetime import datetime
+import io
 import os
-import tempfile
 
 from jira_client import JiraClient
 from duplicate_detector import DuplicateDetector
 from duplicate_pdf_generator import DuplicatePDFReportGenerator
+from json_provider import install_json_provider
+from analysis_jobs import AnalysisJobs, job_status_response
+
+try:
+    from waitress import serve
+except ImportError:  # waitress is optional; fall back to the threaded Werkzeug server
+    serve = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('DuplicateWebApp')
 
-app = Flask(__name__)
+app = install_json_provider(Flask(__name__))
 app.secret_key = os.environ.get('SECRET_KEY', 'duplicate-detector-key-change-in-production')
 
+# Worker threads serving requests, so one long analysis does not block other users
+SERVER_THREADS = int(os.environ.get('DUPLICATE_APP_THREADS', 16))
+
+# Analyses run in the background; the page polls /result/<job_id>
+analysis_jobs = AnalysisJobs()
+
 @app.route('/')
 def index():
     """Main page with duplicate detection form."""
@@ -31,10 +44,10 @@ def index():
 @app.route('/analyze_duplicates', methods=['POST'])
 def analyze_duplicates():
     """
-    Process duplicate detection request.
+    Start a duplicate detection job.
     
     Returns:
-        JSON response with duplicate analysis results
+        JSON response with the job ID to poll at /result/<job_id>
     """
     try:
         # Extract form data
@@ -57,29 +70,55 @@ def analyze_duplicates():
         
         logger.info("✅ Connected to Jira successfully")
         
-        # Analyze duplicates
-        detector = DuplicateDetector(jira_client)
-        results = detector.analyze_duplicates(jql_query)
-        
-        if 'error' in results:
-            return jsonify({'error': results['error']}), 404
-        
-        # Add request parameters for PDF generation
-        results.update({
-            'jira_url': jira_url,
-            'request_date': datetime.now().isoformat()
-        })
-        
-        logger.info("✅ Duplicate analysis completed successfully")
-        return jsonify({
-            'success': True,
-            'analysis_results': results
-        })
+        # Fetching and grouping can take minutes, so the request only starts the analysis
+        job_id = analysis_jobs.submit(run_duplicate_analysis, jira_client, jql_query, jira_url)
+        return jsonify({'job_id': job_id, 'status': 'running'}), 202
         
     except Exception as e:
         logger.error(f"🚩 Duplicate analysis error: {str(e)}")
         return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
 
+def run_duplicate_analysis(jira_client: JiraClient, jql_query: str, jira_url: str):
+    """
+    Run a duplicate analysis in a background job.
+    
+    Args:
+        jira_client (JiraClient): Connected Jira client
+        jql_query (str): JQL selecting the issues to compare
+        jira_url (str): Jira server URL, kept for PDF generation
+        
+    Returns:
+        Tuple[Dict, int]: Response body and HTTP status
+    """
+    # Analyze duplicates
+    detector = DuplicateDetector(jira_client)
+    results = detector.analyze_duplicates(jql_query)
+    
+    if 'error' in results:
+        return {'error': results['error']}, 404
+    
+    # Add request parameters for PDF generation
+    results.update({
+        'jira_url': jira_url,
+        'request_date': datetime.now().isoformat()
+    })
+    
+    logger.info("✅ Duplicate analysis completed successfully")
+    return {
+        'success': True,
+        'analysis_results': results
+    }, 200
+
+@app.route('/result/<job_id>')
+def analysis_result(job_id):
+    """
+    Poll a duplicate analysis job.
+    
+    Returns:
+        202 while the analysis runs, then its JSON results or error
+    """
+    return job_status_response(analysis_jobs, job_id)
+
 @app.route('/generate_duplicate_report', methods=['POST'])
 def generate_duplicate_report():
     """Generate and download duplicate analysis PDF report."""
@@ -87,20 +126,21 @@ def generate_duplicate_report():
         data = request.get_json()
         pdf_generator = DuplicatePDFReportGenerator()
         
-        # Generate PDF in temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            pdf_generator.generate_report(data, tmp_file.name)
-            
-            # Create filename with timestamp
-            filename = f'duplicate_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
-            
-            return send_file(
-                tmp_file.name,
-                as_attachment=True,
-                download_name=filename,
-                mimetype='application/pdf'
-            )
-            
+        # Generate PDF in memory
+        pdf_buffer = io.BytesIO()
+        pdf_generator.generate_report(data, pdf_buffer)
+        pdf_buffer.seek(0)
+        
+        # Create filename with timestamp
+        filename = f'duplicate_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
+        
+        return send_file(
+            pdf_buffer,
+            as_attachment=True,
+            download_name=filename,
+            mimetype='application/pdf'
+        )
+        
     except Exception as e:
         logger.error(f"🚩 PDF generation error: {str(e)}")
         return jsonify({'error': f'PDF generation failed: {str(e)}'}), 500
@@ -116,4 +156,13 @@ def health_check():
 
 if __name__ == '__main__':
     logger.info("🚀 Starting Duplicate Story Detector Web Application...")
-    app.run(debug=True, host='0.0.0.0', port=5400)
\ No newline at end of file
+    # 5400 belongs to the Epic Fix Version Analyzer
+    port = int(os.environ.get('PORT', 5600))
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(debug=True, host='0.0.0.0', port=port)
+    elif serve is not None:
+        logger.info(f"🚀 Serving with waitress on port {port} ({SERVER_THREADS} threads)")
+        serve(app, host='0.0.0.0', port=port, threads=SERVER_THREADS)
+    else:
+        logger.info(f"🚀 waitress not installed, using threaded development server on port {port}")
+        app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
\ No newline at end of file
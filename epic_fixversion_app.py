@@ -8,15 +8,31 @@ Purpose: Analyze which epics are assigned to specific fix versions across initia
 
 from flask import Flask, render_template, request, jsonify, send_file
 import logging
+import os
 from datetime import datetime
 from typing import List, Dict, Set
 from collections import defaultdict
 import json
+import re
 from pathlib import Path
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from jira_client import JiraClient
 from epic_fixversion_pdf_generator import EpicFixVersionPDFGenerator
+from json_provider import install_json_provider
+from analysis_jobs import AnalysisJobs, job_status_response
+
+try:
+    from waitress import serve
+except ImportError:  # waitress is optional; fall back to the threaded Werkzeug server
+    serve = None
+
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -29,13 +45,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger('EpicFixVersionApp')
 
-app = Flask(__name__)
+app = install_json_provider(Flask(__name__))
 app.secret_key = 'epic-fixversion-key-change-in-production'
 
 # Results directory for persistence
 RESULTS_DIR = Path(__file__).parent / 'epic_fixversion_results'
 RESULTS_DIR.mkdir(exist_ok=True)
 
+# Worker threads serving requests, so one long analysis does not block other users
+SERVER_THREADS = int(os.environ.get('EPIC_FIXVERSION_THREADS', 16))
+
+# Analyses run in the background; the page polls /result/<job_id>
+analysis_jobs = AnalysisJobs()
+
+# Epic queries run concurrently, kept low to respect Jira rate limits
+HIERARCHY_WORKERS = int(os.environ.get('EPIC_FIXVERSION_WORKERS', 8))
+# Initiatives covered by one childIssuesOf probe query
+INITIATIVE_BATCH_SIZE = int(os.environ.get('EPIC_FIXVERSION_BATCH_SIZE', 10))
+# Fields read from initiatives and epics; nothing here needs the changelog
+INITIATIVE_FIELDS = ['summary']
+EPIC_FIELDS = [
+    'summary', 'status', 'fixVersions', 'comment', 'assignee', 'project',
+    'customfield_10037', 'customfield_10095', 'customfield_10096', 'customfield_10097'
+]
+SEARCH_BATCH_SIZE = 500  # issues per Jira search page
+
+# Comment keywords searched case-insensitively, also inside longer words ("platforms", "delayed")
+PLATFORM_COMMENT_PATTERN = re.compile(r'platform', re.IGNORECASE)
+IMPACT_COMMENT_PATTERN = re.compile(r'impact|delay|risk', re.IGNORECASE)
+
 class EpicFixVersionAnalyzer:
     """Analyzes epics by fix version across initiatives"""
     
@@ -75,6 +113,8 @@ class EpicFixVersionAnalyzer:
             logger.info(f"✅ Found {len(initiatives)} initiatives")
             
             # Step 2: For each initiative, get epics through hierarchy
+            epic_filter = self._build_epic_filter(fix_version, excluded_statuses)
+            epics_by_initiative = self._fetch_epics_by_initiative(initiatives, epic_filter)
             results = []
             total_epics = 0
             
@@ -84,8 +124,8 @@ class EpicFixVersionAnalyzer:
                 
                 logger.info(f"🔍 Analyzing initiative: {initiative_key}")
                 
-                # Get all child epics through hierarchy
-                epics = self._get_initiative_epics_via_hierarchy(initiative_key, fix_version, excluded_statuses)
+                # All child epics found through hierarchy
+                epics = epics_by_initiative.get(initiative_key, [])
                 
                 if epics:
                     logger.info(f"  ✅ Found {len(epics)} epics")
@@ -121,67 +161,122 @@ class EpicFixVersionAnalyzer:
         """Fetch initiatives using JQL"""
         try:
             logger.info(f"📥 Fetching initiatives...")
-            initiatives = self.jira_client.fetch_issues(jql_query, max_results=1000)
+            initiatives = self.jira_client.fetch_issues(jql_query, max_results=1000, fields=INITIATIVE_FIELDS,
+                                                        expand=None, batch_size=SEARCH_BATCH_SIZE)
             logger.info(f"📊 Fetched {len(initiatives)} initiatives")
             return initiatives
         except Exception as e:
             logger.error(f"❌ Failed to fetch initiatives: {str(e)}")
             raise
     
-    def _get_initiative_epics_via_hierarchy(self, initiative_key: str, fix_version: str = None, excluded_statuses: List[str] = None) -> List[Dict]:
-        """Get all epics for an initiative through hierarchy traversal"""
-        try:
-            # Build status exclusion clause
-            status_exclusion = ''
-            if excluded_statuses:
-                status_list = ' AND '.join([f'status != "{status}"' for status in excluded_statuses])
-                status_exclusion = f' AND {status_list}'
-            
-            # Use childIssuesOf to get all descendants including epics
-            # This traverses: Initiative -> Feature -> Sub-Feature -> Epic
-            if fix_version:
-                jql = (f'issuekey in childIssuesOf("{initiative_key}") '
-                       f'AND type = Epic '
-                       f'AND fixVersion = "{fix_version}"'
-                       f'{status_exclusion}')
-            else:
-                jql = (f'issuekey in childIssuesOf("{initiative_key}") '
-                       f'AND type = Epic'
-                       f'{status_exclusion}')
-            
-            logger.debug(f"  🔍 JQL: {jql}")
-            
-            # Fetch epics - note: fetch_issues includes fixVersions in fields
-            epics = self.jira_client.fetch_issues(jql, max_results=2000)
+    def _build_epic_filter(self, fix_version: str = None, excluded_statuses: List[str] = None) -> str:
+        """Build the JQL conditions every epic query adds after its childIssuesOf clause"""
+        # Build status exclusion clause
+        status_exclusion = ''
+        if excluded_statuses:
+            status_list = ' AND '.join([f'status != "{status}"' for status in excluded_statuses])
+            status_exclusion = f' AND {status_list}'
+        
+        if fix_version:
+            return (f' AND type = Epic '
+                    f'AND fixVersion = "{fix_version}"'
+                    f'{status_exclusion}')
+        return (f' AND type = Epic'
+                f'{status_exclusion}')
+    
+    def _fetch_epics_by_initiative(self, initiatives: List[Dict], epic_filter: str) -> Dict[str, List[Dict]]:
+        """
+        Fetch the epics of all initiatives concurrently, keyed by initiative key
+        
+        JQL does not tell which initiative an epic descends from, so epics are fetched per
+        initiative. Each batch is first probed with one cheap query, and only initiatives of
+        batches with matching epics are queried for their epics.
+        """
+        initiative_keys = [initiative['key'] for initiative in initiatives]
+        batches = [initiative_keys[start:start + INITIATIVE_BATCH_SIZE]
+                   for start in range(0, len(initiative_keys), INITIATIVE_BATCH_SIZE)]
+        epics_by_initiative = {}
+        max_workers = max(1, min(HIERARCHY_WORKERS, len(initiative_keys)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            queries = {}
+            # A single initiative gains nothing from a probe
+            probes = {}
+            for batch in batches:
+                if len(batch) == 1:
+                    queries[executor.submit(self._query_initiative_epics, batch, epic_filter)] = batch[0]
+                else:
+                    probes[executor.submit(self._batch_has_epics, batch, epic_filter)] = batch
             
-            # Extract relevant epic information including fix version
-            epic_list = []
-            for epic in epics:
-                # Get fix versions from epic
-                fix_versions = self._extract_fix_versions(epic)
-                fields = epic.get('fields', {})
-                
-                epic_data = {
-                    'key': epic['key'],
-                    'summary': epic.get('summary', 'No summary'),
-                    'status': epic.get('status', 'Unknown'),
-                    'project': self._extract_project_key(epic),
-                    'fix_versions': fix_versions,
-                    'complexity': self._extract_custom_field(fields, 'customfield_10037'),
-                    'requesting_customer': self._extract_custom_field(fields, 'customfield_10095'),
-                    'assignee': epic.get('assignee', 'Unassigned'),
-                    'target_start': self._extract_custom_field(fields, 'customfield_10096'),
-                    'solution': self._extract_custom_field(fields, 'customfield_10097'),
-                    'comments': self._extract_comments(fields)
-                }
-                epic_list.append(epic_data)
-                logger.debug(f"    📌 {epic_data['key']}: {epic_data['summary'][:50]}...")
+            for probe in as_completed(probes):
+                batch = probes[probe]
+                try:
+                    has_epics = probe.result()
+                except Exception as e:
+                    logger.warning(f"  ⚠️ Batch query failed, querying {len(batch)} initiatives one by one: {str(e)}")
+                    has_epics = True
+                if has_epics:
+                    for initiative_key in batch:
+                        queries[executor.submit(self._query_initiative_epics, [initiative_key], epic_filter)] = initiative_key
             
-            return epic_list
+            for future in as_completed(queries):
+                initiative_key = queries[future]
+                try:
+                    epics_by_initiative[initiative_key] = future.result()
+                except Exception as e:
+                    logger.warning(f"  ⚠️ Failed to get epics for {initiative_key}: {str(e)}")
+        
+        return epics_by_initiative
+    
+    def _hierarchy_jql(self, initiative_keys: List[str], epic_filter: str) -> str:
+        """Build the childIssuesOf query for all epics below the given initiatives"""
+        # Use childIssuesOf to get all descendants including epics
+        # This traverses: Initiative -> Feature -> Sub-Feature -> Epic
+        hierarchy = ' OR '.join(f'issuekey in childIssuesOf("{initiative_key}")' for initiative_key in initiative_keys)
+        if len(initiative_keys) > 1:
+            hierarchy = f'({hierarchy})'
+        return f'{hierarchy}{epic_filter}'
+    
+    def _batch_has_epics(self, initiative_keys: List[str], epic_filter: str) -> bool:
+        """Check whether any initiative of the batch has matching epics, fetching at most one epic key"""
+        jql = self._hierarchy_jql(initiative_keys, epic_filter)
+        logger.debug(f"  🔍 Probe JQL: {jql}")
+        return bool(self.jira_client.fetch_issues(jql, max_results=1, fields=['key'], expand=None, batch_size=1))
+    
+    def _query_initiative_epics(self, initiative_keys: List[str], epic_filter: str) -> List[Dict]:
+        """Run one childIssuesOf query for all epics below the given initiatives"""
+        jql = self._hierarchy_jql(initiative_keys, epic_filter)
+        
+        logger.debug(f"  🔍 JQL: {jql}")
+        
+        # Fetch epics with only the fields read below
+        epics = self.jira_client.fetch_issues(jql, max_results=2000, fields=EPIC_FIELDS, expand=None,
+                                              batch_size=SEARCH_BATCH_SIZE)
+        
+        # Extract relevant epic information including fix version
+        epic_list = []
+        for epic in epics:
+            # Get fix versions from epic
+            fix_versions = self._extract_fix_versions(epic)
+            fields = epic.get('fields', {})
             
-        except Exception as e:
-            logger.warning(f"  ⚠️ Failed to get epics for {initiative_key}: {str(e)}")
-            return []
+            epic_data = {
+                'key': epic['key'],
+                'summary': epic.get('summary', 'No summary'),
+                'status': epic.get('status', 'Unknown'),
+                'project': self._extract_project_key(epic),
+                'fix_versions': fix_versions,
+                'complexity': self._extract_custom_field(fields, 'customfield_10037'),
+                'requesting_customer': self._extract_custom_field(fields, 'customfield_10095'),
+                'assignee': epic.get('assignee', 'Unassigned'),
+                'target_start': self._extract_custom_field(fields, 'customfield_10096'),
+                'solution': self._extract_custom_field(fields, 'customfield_10097'),
+                'comments': self._extract_comments(fields)
+            }
+            epic_list.append(epic_data)
+            logger.debug(f"    📌 {epic_data['key']}: {epic_data['summary'][:50]}...")
+        
+        return epic_list
     
     def _extract_project_key(self, issue: Dict) -> str:
         """Extract project key from issue"""
@@ -247,16 +342,18 @@ class EpicFixVersionAnalyzer:
         result = {'platform': '', 'impacts': ''}
         
         for comment in comment_list:
-            body = comment.get('body', '').lower()
             comment_text = comment.get('body', '')
             
             # Look for platform mentions
-            if 'platform' in body and not result['platform']:
+            if not result['platform'] and PLATFORM_COMMENT_PATTERN.search(comment_text):
                 result['platform'] = comment_text[:200]
             
             # Look for impact/delay mentions
-            if any(word in body for word in ['impact', 'delay', 'risk']) and not result['impacts']:
+            if not result['impacts'] and IMPACT_COMMENT_PATTERN.search(comment_text):
                 result['impacts'] = comment_text[:200]
+            
+            if result['platform'] and result['impacts']:
+                break
         
         return result
 
@@ -269,8 +366,12 @@ def save_results_to_file(fix_version: str, results: Dict) -> bool:
         filename = f"{safe_version}_{timestamp}.json"
         filepath = RESULTS_DIR / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Compact JSON: indentation roughly doubles the size of large epic dumps
+        if orjson is not None:
+            filepath.write_bytes(orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, separators=(',', ':'))
         
         logger.info(f"💾 Results saved to {filepath}")
         return True
@@ -285,7 +386,7 @@ def index():
 
 @app.route('/analyze', methods=['POST'])
 def analyze():
-    """Process analysis request"""
+    """Start an analysis job and return its ID to poll at /result/<job_id>"""
     try:
         # Extract form data
         jira_url = request.form.get('jira_url', '').strip()
@@ -328,22 +429,9 @@ def analyze():
         
         logger.info("✅ Jira connection successful")
         
-        # Perform analysis
-        analyzer = EpicFixVersionAnalyzer(jira_client)
-        results = analyzer.analyze(initiative_jql, fix_version, excluded_statuses)
-        
-        if 'error' in results:
-            logger.error(f"❌ Analysis error: {results['error']}")
-            return jsonify({
-                'error': results['error'],
-                'error_type': 'AnalysisError'
-            }), 404
-        
-        # Save results to file
-        save_results_to_file(fix_version, results)
-        
-        logger.info("✅ Analysis completed successfully")
-        return jsonify(results)
+        # Hierarchy traversal can take minutes, so the request only starts the analysis
+        job_id = analysis_jobs.submit(run_analysis, jira_client, initiative_jql, fix_version, excluded_statuses)
+        return jsonify({'job_id': job_id, 'status': 'running'}), 202
         
     except Exception as e:
         logger.error(f"❌ Unexpected error: {str(e)}", exc_info=True)
@@ -352,6 +440,31 @@ def analyze():
             'error_type': type(e).__name__
         }), 500
 
+def run_analysis(jira_client: JiraClient, initiative_jql: str, fix_version: str = None,
+                 excluded_statuses: List[str] = None):
+    """Run an analysis in a background job, returning the response body and HTTP status"""
+    # Perform analysis
+    analyzer = EpicFixVersionAnalyzer(jira_client)
+    results = analyzer.analyze(initiative_jql, fix_version, excluded_statuses)
+    
+    if 'error' in results:
+        logger.error(f"❌ Analysis error: {results['error']}")
+        return {
+            'error': results['error'],
+            'error_type': 'AnalysisError'
+        }, 404
+    
+    # Save results to file
+    save_results_to_file(fix_version, results)
+    
+    logger.info("✅ Analysis completed successfully")
+    return results, 200
+
+@app.route('/result/<job_id>')
+def analysis_result(job_id):
+    """Poll an analysis job: 202 while it runs, then its results or error"""
+    return job_status_response(analysis_jobs, job_id)
+
 @app.route('/export_pdf', methods=['POST'])
 def export_pdf():
     """Export analysis results to PDF"""
@@ -399,4 +512,12 @@ def health():
 if __name__ == '__main__':
     logger.info("🚀 Starting Epic Fix Version Analyzer")
     logger.info(f"📁 Results directory: {RESULTS_DIR}")
-    app.run(debug=True, host='0.0.0.0', port=5400)
+    port = int(os.environ.get('PORT', 5400))
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(debug=True, host='0.0.0.0', port=port)
+    elif serve is not None:
+        logger.info(f"🚀 Serving with waitress on port {port} ({SERVER_THREADS} threads)")
+        serve(app, host='0.0.0.0', port=port, threads=SERVER_THREADS)
+    else:
+        logger.info(f"🚀 waitress not installed, using threaded development server on port {port}")
+        app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
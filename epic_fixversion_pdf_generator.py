@@ -9,13 +9,82 @@ from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, PageTemplate, Frame
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from datetime import datetime
+from functools import lru_cache
 import io
 import logging
 import html
 
 logger = logging.getLogger('EpicFixVersionPDFGenerator')
 
+# Free text is cut before escaping so long fields do not get measured only to overflow their cell
+MAX_CELL_TEXT_CHARS = 300
+MAX_COMMENT_CHARS = 100
+
+# Epic table header labels; Paragraphs are still built per table since reportlab keeps layout state on them
+EPIC_TABLE_HEADERS = [
+    'Epic Key', 'Summary', 'Status', 'Magnitude', 'Who asked',
+    'CPO-APO', 'Start date', 'Fix Ver', 'What to deliver', 'Comments'
+]
+
+# Column widths for landscape letter (11 inches - margins) - Project column removed
+EPIC_TABLE_COL_WIDTHS = [0.7*inch, 1.3*inch, 0.6*inch, 0.7*inch, 1.0*inch, 0.9*inch, 0.7*inch, 0.7*inch, 1.3*inch, 1.6*inch]
+
+# Epic table style shared by every initiative table; setStyle copies the commands into each table
+EPIC_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#d4c5f9')),  # Light purple header
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 8),
+    # Plain string cells render like the Paragraph cells next to them (sample stylesheet's Normal style)
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('LEADING', (0, 1), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 0), (-1, 0), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+    ('TOPPADDING', (0, 1), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
+    # Alternating row colors (white and light yellow) as one command instead of one per row
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fffacd')]),
+])
+
+@lru_cache(maxsize=4096)
+def escape_cell_text(text: str) -> str:
+    """Escape text for a Paragraph, cached since status, assignee and fix version values repeat across epics"""
+    return html.escape(text)
+
+@lru_cache(maxsize=4096)
+def fits_on_one_line(text: str, width: float, font_name: str, font_size: float) -> bool:
+    """Check whether text fits a column without wrapping; cells have 4pt padding on each side"""
+    return '\n' not in text and stringWidth(text, font_name, font_size) <= width - 8
+
+class StreamedStory(list):
+    """
+    Story list that refills itself from an iterator of flowable chunks when reportlab drains it.
+
+    reportlab's build loop only checks len() and consumes the head of the story, so each
+    chunk is created just before it is laid out and released once it has been drawn.
+    """
+    
+    def __init__(self, flowables: list, pending):
+        super().__init__(flowables)
+        self._pending = pending
+    
+    def __len__(self):
+        while not list.__len__(self) and self._pending is not None:
+            chunk = next(self._pending, None)
+            if chunk is None:
+                self._pending = None
+            else:
+                self.extend(chunk)
+        return list.__len__(self)
+
 class EpicFixVersionPDFGenerator:
     """Generates PDF reports for epic distribution analysis"""
     
@@ -83,12 +152,11 @@ class EpicFixVersionPDFGenerator:
             rightMargin=0.75*inch,
             leftMargin=0.75*inch,
             topMargin=0.75*inch,
-            bottomMargin=0.75*inch
+            bottomMargin=0.75*inch,
+            # Deflate page content even if the reportlab config turns compression off; text tables shrink ~2.7x
+            pageCompression=1
         )
         
-        # Add page number footer
-        doc.build = self._build_with_page_numbers(doc)
-        
         story = []
         
         # Title
@@ -97,12 +165,12 @@ class EpicFixVersionPDFGenerator:
         story.append(Spacer(1, 0.3*inch))
         
         # Metadata - access data directly
-        timestamp = analysis_data.get('timestamp', datetime.now().isoformat())
+        report_time = self._format_timestamp(analysis_data.get('timestamp'))
         fix_version = analysis_data.get('fix_version', 'All')
         excluded_statuses = analysis_data.get('excluded_statuses', [])
         
         metadata = [
-            ['Report Generated:', datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M:%S')],
+            ['Report Generated:', report_time],
             ['Fix Version Filter:', fix_version],
             ['Excluded Statuses:', ', '.join(excluded_statuses) if excluded_statuses else 'None'],
         ]
@@ -163,15 +231,8 @@ class EpicFixVersionPDFGenerator:
         if not initiative_results:
             story.append(Paragraph("No epics found.", self.styles['Normal']))
         else:
-            for initiative in initiative_results:
-                # Initiative header with styling
-                init_header = f"{initiative['initiative_key']}: {initiative['initiative_summary']}"
-                story.append(Paragraph(init_header, self.styles['InitiativeHeader']))
-                story.append(Spacer(1, 0.1*inch))
-                
-                # Create table for all epics in this initiative
-                story.append(self._create_epics_table(initiative['epics']))
-                story.append(Spacer(1, 0.3*inch))
+            # Initiative tables are built while the PDF is laid out, so only one is held in memory at a time
+            story = StreamedStory(story, self._initiative_flowables(initiative_results))
         
         # Build PDF with page numbers
         doc.build(story, onFirstPage=self._add_page_number, onLaterPages=self._add_page_number)
@@ -182,14 +243,29 @@ class EpicFixVersionPDFGenerator:
         
         return None
     
-    def _build_with_page_numbers(self, doc):
-        """Wrapper to add page numbers to build method"""
-        original_build = doc.build
-        def build_wrapper(story, **kwargs):
-            kwargs['onFirstPage'] = self._add_page_number
-            kwargs['onLaterPages'] = self._add_page_number
-            return original_build(story, **kwargs)
-        return build_wrapper
+    def _initiative_flowables(self, initiative_results: list):
+        """Yield the header and epics table of each initiative as one chunk of flowables"""
+        for initiative in initiative_results:
+            # Initiative header with styling
+            init_header = f"{initiative['initiative_key']}: {initiative['initiative_summary']}"
+            yield [
+                Paragraph(init_header, self.styles['InitiativeHeader']),
+                Spacer(1, 0.1*inch),
+                # Create table for all epics in this initiative
+                self._create_epics_table(initiative['epics']),
+                Spacer(1, 0.3*inch),
+            ]
+    
+    def _format_timestamp(self, timestamp) -> str:
+        """Format the analysis timestamp for the report, falling back to the current time if it is missing or invalid"""
+        report_time = datetime.now()
+        if timestamp:
+            try:
+                # Older Pythons reject the 'Z' UTC suffix Jira and JavaScript produce
+                report_time = datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
+            except ValueError:
+                logger.warning(f"⚠️ Invalid report timestamp {timestamp!r}, using current time")
+        return report_time.strftime('%Y-%m-%d %H:%M:%S')
     
     def _add_page_number(self, canvas, doc):
         """Add page number to bottom right of each page"""
@@ -204,84 +280,66 @@ class EpicFixVersionPDFGenerator:
         """Sanitize text for PDF by escaping HTML/XML characters"""
         if not text:
             return 'N/A'
-        return html.escape(str(text))
+        return escape_cell_text(str(text))
+    
+    def _short_cell(self, text, width: float, style: ParagraphStyle):
+        """Return text as a plain string if it fits on one line of the column, else a wrapping Paragraph"""
+        text = str(text) if text else 'N/A'
+        if fits_on_one_line(text, width, style.fontName, style.fontSize):
+            return text
+        return Paragraph(escape_cell_text(text), style)
+    
+    def _text_cell(self, text, style: ParagraphStyle):
+        """Return free text as a wrapping Paragraph, or a plain 'N/A' when there is no text"""
+        if not text:
+            return 'N/A'
+        return Paragraph(self._sanitize_text(str(text)[:MAX_CELL_TEXT_CHARS]), style)
+    
+    def _create_epic_row(self, epic: dict, make_link, normal: ParagraphStyle) -> list:
+        """Create the table cells for one epic"""
+        # Combine comments
+        comments = epic.get('comments', {})
+        combined_comments = []
+        if comments.get('platform'):
+            combined_comments.append(f"Platform: {self._sanitize_text(comments['platform'][:MAX_COMMENT_CHARS])}")
+        if comments.get('impacts'):
+            combined_comments.append(f"Impacts: {self._sanitize_text(comments['impacts'][:MAX_COMMENT_CHARS])}")
+        # Empty comments stay a plain string rather than a Paragraph
+        comments_cell = Paragraph(' | '.join(combined_comments), normal) if combined_comments else 'N/A'
+        
+        # Free text keeps its Paragraph; empty and short values are plain strings
+        return [
+            Paragraph(make_link(epic['key']), normal),
+            self._text_cell(epic.get('summary'), normal),
+            self._short_cell(epic.get('status', 'N/A'), EPIC_TABLE_COL_WIDTHS[2], normal),
+            self._short_cell(epic.get('complexity', 'N/A'), EPIC_TABLE_COL_WIDTHS[3], normal),
+            self._short_cell(epic.get('requesting_customer', 'N/A'), EPIC_TABLE_COL_WIDTHS[4], normal),
+            self._short_cell(epic.get('assignee', 'Unassigned'), EPIC_TABLE_COL_WIDTHS[5], normal),
+            self._short_cell(epic.get('target_start', 'N/A'), EPIC_TABLE_COL_WIDTHS[6], normal),
+            self._short_cell(', '.join(epic.get('fix_versions', [])) or 'None', EPIC_TABLE_COL_WIDTHS[7], normal),
+            self._text_cell(epic.get('solution'), normal),
+            comments_cell
+        ]
     
     def _create_epics_table(self, epics: list) -> Table:
         """Create table with all epics (one row per epic)"""
-        # Table header
-        data = [[
-            Paragraph('<b>Epic Key</b>', self.styles['Normal']),
-            Paragraph('<b>Summary</b>', self.styles['Normal']),
-            Paragraph('<b>Status</b>', self.styles['Normal']),
-            Paragraph('<b>Magnitude</b>', self.styles['Normal']),
-            Paragraph('<b>Who asked</b>', self.styles['Normal']),
-            Paragraph('<b>CPO-APO</b>', self.styles['Normal']),
-            Paragraph('<b>Start date</b>', self.styles['Normal']),
-            Paragraph('<b>Fix Ver</b>', self.styles['Normal']),
-            Paragraph('<b>What to deliver</b>', self.styles['Normal']),
-            Paragraph('<b>Comments</b>', self.styles['Normal'])
-        ]]
-        
-        # Add epic rows
-        for epic in epics:
-            # Create clickable link
-            epic_key = epic['key']
-            if self.jira_url:
-                epic_link = f'<link href="{self.jira_url}/browse/{epic_key}" color="blue"><u>{epic_key}</u></link>'
-            else:
-                epic_link = self._sanitize_text(epic_key)
-            
-            # Combine comments
-            comments = epic.get('comments', {})
-            combined_comments = []
-            if comments.get('platform'):
-                combined_comments.append(f"Platform: {self._sanitize_text(comments['platform'][:100])}")
-            if comments.get('impacts'):
-                combined_comments.append(f"Impacts: {self._sanitize_text(comments['impacts'][:100])}")
-            comments_text = ' | '.join(combined_comments) if combined_comments else 'N/A'
-            
-            row = [
-                Paragraph(epic_link, self.styles['Normal']),
-                Paragraph(self._sanitize_text(epic.get('summary', 'N/A')), self.styles['Normal']),
-                Paragraph(self._sanitize_text(epic.get('status', 'N/A')), self.styles['Normal']),
-                Paragraph(self._sanitize_text(epic.get('complexity', 'N/A')), self.styles['Normal']),
-                Paragraph(self._sanitize_text(epic.get('requesting_customer', 'N/A')), self.styles['Normal']),
-                Paragraph(self._sanitize_text(epic.get('assignee', 'Unassigned')), self.styles['Normal']),
-                Paragraph(self._sanitize_text(epic.get('target_start', 'N/A')), self.styles['Normal']),
-                Paragraph(self._sanitize_text(', '.join(epic.get('fix_versions', [])) or 'None'), self.styles['Normal']),
-                Paragraph(self._sanitize_text(epic.get('solution', 'N/A')), self.styles['Normal']),
-                Paragraph(comments_text, self.styles['Normal'])
-            ]
-            data.append(row)
+        # Style looked up once instead of once per cell
+        normal = self.styles['Normal']
         
-        # Column widths for landscape letter (11 inches - margins) - Project column removed
-        table = Table(data, colWidths=[0.7*inch, 1.3*inch, 0.6*inch, 0.7*inch, 1.0*inch, 0.9*inch, 0.7*inch, 0.7*inch, 1.3*inch, 1.6*inch], repeatRows=1)
+        # Table header
+        data = [[Paragraph(f'<b>{header}</b>', normal) for header in EPIC_TABLE_HEADERS]]
         
-        # Build style with alternating row colors
-        style = [
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#d4c5f9')),  # Light purple header
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 8),
-            ('FONTSIZE', (0, 1), (-1, -1), 7),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 4),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-            ('TOPPADDING', (0, 1), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
-        ]
+        # Clickable links when a Jira URL is given, decided once for the whole table
+        if self.jira_url:
+            browse_url = f'{self.jira_url}/browse/'
+            make_link = lambda key: f'<link href="{browse_url}{key}" color="blue"><u>{key}</u></link>'
+        else:
+            make_link = self._sanitize_text
         
-        # Add alternating row colors (light yellow and white)
-        for i in range(1, len(data)):
-            if i % 2 == 0:
-                style.append(('BACKGROUND', (0, i), (-1, i), colors.HexColor('#fffacd')))  # Light yellow
-            else:
-                style.append(('BACKGROUND', (0, i), (-1, i), colors.white))
+        # Add epic rows
+        data.extend(self._create_epic_row(epic, make_link, normal) for epic in epics)
         
-        table.setStyle(TableStyle(style))
+        table = Table(data, colWidths=EPIC_TABLE_COL_WIDTHS, repeatRows=1)
+        table.setStyle(EPIC_TABLE_STYLE)
         
         return table
@@ -4,6 +4,8 @@ Analyzes epic distribution across projects with hierarchical traversal.
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Set
 from collections import defaultdict
@@ -15,6 +17,9 @@ from jira_client import JiraClient
 
 logger = logging.getLogger('EpicObeyaAnalyzer')
 
+# Child issue searches are I/O-bound, so they run concurrently on the shared connection pool
+CHILD_FETCH_WORKERS = int(os.environ.get('EPIC_CHILD_FETCH_WORKERS', 8))
+
 class EpicObeyaAnalyzer:
     """
     Enhanced Epic analyzer with hierarchical traversal and project distribution analysis.
@@ -349,10 +354,12 @@ class EpicObeyaAnalyzer:
             
             outdated_epics = []
             
+            # Get child issues for all epics up front instead of one search at a time
+            children_by_epic = self._get_children_for_epics([epic['key'] for epic in todo_backlog_epics])
+            
             for epic in todo_backlog_epics:
                 try:
-                    # Get child issues for this epic
-                    child_issues = self._get_epic_children(epic['key'])
+                    child_issues = children_by_epic[epic['key']]
                     
                     # Check if any child is in progress
                     in_progress_children = [
@@ -396,6 +403,22 @@ class EpicObeyaAnalyzer:
             logger.error(f"🚩 Epic status validation failed: {str(e)}")
             return {'error': f'Analysis failed: {str(e)}'}
     
+    def _get_children_for_epics(self, epic_keys: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Get child issues for many epics concurrently.
+        
+        Args:
+            epic_keys (List[str]): Keys of the epics
+            
+        Returns:
+            Dict[str, List[Dict]]: Child issues keyed by epic key, empty for epics that failed
+        """
+        if not epic_keys:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(CHILD_FETCH_WORKERS, len(epic_keys)))) as executor:
+            return dict(zip(epic_keys, executor.map(self._get_epic_children, epic_keys)))
+    
     def _get_epic_children(self, epic_key: str) -> List[Dict]:
         """Get all child issues for an epic."""
         jql_query = f'issuekey in childIssuesOf("{epic_key}")'
@@ -0,0 +1,227 @@
+"""
+Jira Issue Cache
+Persists fetched Jira issues on disk so repeated analyses skip the Jira round trip
+as long as the matching issues have not changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from jira_client import JiraClient
+
+logger = logging.getLogger('JiraCache')
+
+# Cached issues live next to the other analysis state; entries are revalidated against Jira
+# on every use, the TTL only bounds how long unused entries stay on disk
+CACHE_DIR = os.environ.get('JIRA_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'analysis_cache', 'jira_issues'))
+CACHE_TTL_SECONDS = int(os.environ.get('JIRA_CACHE_TTL', 86400))
+
+# Trailing ORDER BY clause, replaced by the freshness query's own ordering
+ORDER_BY_PATTERN = re.compile(r'\s+ORDER\s+BY\s+.*$', re.IGNORECASE | re.DOTALL)
+
+class JiraIssueCache:
+    """
+    On-disk cache of processed Jira issues, one JSON file per query.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, ttl_seconds: int = CACHE_TTL_SECONDS):
+        """
+        Initialize cache directory and TTL.
+
+        Args:
+            cache_dir (str): Directory holding cached query results
+            ttl_seconds (int): Time-to-live of a cached query in seconds
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(base_url: str, access_token: str, kind: str, query: str) -> str:
+        """
+        Build a cache key scoped to the Jira instance and credentials.
+
+        Args:
+            base_url (str): Jira server URL
+            access_token (str): Token used for the request, only its hash is kept
+            kind (str): Fetch method the result came from
+            query (str): Serialized query parameters
+
+        Returns:
+            str: Hex digest used as file name
+        """
+        token_fingerprint = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+        cache_data = f"{base_url}|{token_fingerprint}|{kind}|{query}"
+        return hashlib.sha256(cache_data.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Get cached issues if present and not expired.
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            Optional[List[Dict]]: Cached issues or None on miss
+        """
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl_seconds:
+                os.remove(path)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, issues: List[Dict]):
+        """
+        Store issues atomically so concurrent readers never see a partial file.
+
+        Args:
+            key (str): Cache key from make_key
+            issues (List[Dict]): Processed issues to cache
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(issues, f)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Could not cache issues: {str(e)}")
+
+    def clear(self) -> int:
+        """Remove every cached query and return how many were removed."""
+        removed = 0
+        if not os.path.isdir(self.cache_dir):
+            return removed
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                    removed += 1
+                except OSError:
+                    pass
+        logger.info(f"🗑️ Cleared {removed} cached Jira queries")
+        return removed
+
+class CachedJiraClient(JiraClient):
+    """
+    JiraClient that serves repeated searches from a JiraIssueCache.
+
+    Before a cached result is used, one single-issue search checks that the query still
+    matches as many issues and that none of them was updated since the result was cached.
+    The outcome of the last fetch is exposed as cache_status ('HIT' or 'MISS').
+    """
+
+    def __init__(self, base_url: str, access_token: str, cache: Optional[JiraIssueCache] = None, **kwargs):
+        """
+        Initialize client and attach the issue cache.
+
+        Args:
+            base_url (str): Jira server URL
+            access_token (str): API access token for authentication
+            cache (JiraIssueCache, optional): Cache to use, a default on-disk cache if omitted
+            **kwargs: Passed through to JiraClient
+        """
+        super().__init__(base_url, access_token, **kwargs)
+        self.cache = cache or JiraIssueCache()
+        self.cache_status = None
+        self._local = threading.local()  # Marks fetches nested inside a cached fetch
+
+    def _freshness_stamp(self, jql_query: str) -> Optional[str]:
+        """
+        Fingerprint the current state of a query's result with one single-issue search.
+
+        Every edit or transition of a matching issue changes the latest 'updated' value,
+        and issues entering or leaving the result change the total.
+
+        Args:
+            jql_query (str): JQL whose result is cached
+
+        Returns:
+            Optional[str]: Stamp to scope the cache entry with, None if Jira could not be asked
+        """
+        payload = {
+            'jql': f"{ORDER_BY_PATTERN.sub('', jql_query)} ORDER BY updated DESC",
+            'maxResults': 1,
+            'fields': ['updated'],
+            'validateQuery': 'warn'
+        }
+        try:
+            response = self.session.post(f'{self.base_url}/rest/api/2/search', json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"⚠️ Could not check cached issues are current, fetching fresh: {str(e)}")
+            return None
+
+        latest = (data.get('issues') or [{}])[0].get('fields', {}).get('updated', '')
+        return f"{data.get('total', 0)}|{latest}"
+
+    def _cached(self, kind: str, query: Dict, jql_query: str, loader: Callable[[], List[Dict]]) -> List[Dict]:
+        # fetch_issues_parallel falls back to fetch_issues per page; only cache the outer result
+        if getattr(self._local, 'active', False):
+            return loader()
+
+        # A changed result set gets a new key, so stale entries are never served
+        query = dict(query, freshness=self._freshness_stamp(jql_query))
+        if query['freshness'] is None:
+            self.cache_status = 'MISS'
+            return self._load(loader)
+
+        key = JiraIssueCache.make_key(self.base_url, self.access_token, kind, json.dumps(query, sort_keys=True))
+        issues = self.cache.get(key)
+        if issues is not None:
+            self.cache_status = 'HIT'
+            logger.info(f"📋 Cache HIT for {kind} ({len(issues)} issues)")
+            return issues
+
+        self.cache_status = 'MISS'
+        issues = self._load(loader)
+        # Empty results are usually errors or typos in the JQL, so keep asking Jira for them
+        if issues:
+            self.cache.set(key, issues)
+        return issues
+
+    def _load(self, loader: Callable[[], List[Dict]]) -> List[Dict]:
+        self._local.active = True
+        try:
+            return loader()
+        finally:
+            self._local.active = False
+
+    def fetch_issues(self, jql_query: str, max_results: int = 5000, start_at: int = 0,
+                     fields: Optional[List[str]] = None, expand: Optional[str] = 'changelog',
+                     batch_size: Optional[int] = None) -> List[Dict]:
+        # Page size only changes how issues are fetched, not which, so it stays out of the key
+        query = {'jql': jql_query, 'max_results': max_results, 'start_at': start_at, 'fields': fields, 'expand': expand}
+        return self._cached('fetch_issues', query, jql_query, lambda: super(CachedJiraClient, self).fetch_issues(
+            jql_query, max_results, start_at, fields, expand, batch_size))
+
+    def fetch_issues_parallel(self, jql_query: str, max_results: int = 5000,
+                              fields: Optional[List[str]] = None, expand: Optional[str] = 'changelog') -> List[Dict]:
+        # Same result set as fetch_issues, so both share one cache entry
+        query = {'jql': jql_query, 'max_results': max_results, 'start_at': 0, 'fields': fields, 'expand': expand}
+        return self._cached('fetch_issues', query, jql_query, lambda: super(CachedJiraClient, self).fetch_issues_parallel(
+            jql_query, max_results, fields, expand))
+
+    def fetch_issues_by_keys(self, issue_keys: List[str], include_subtasks: bool = False, **kwargs) -> List[Dict]:
+        # Chunking knobs only change how issues are fetched, not which, so they stay out of the key
+        query = {'keys': sorted(issue_keys), 'include_subtasks': include_subtasks}
+        keys_str = ','.join(issue_keys)
+        jql_query = f"key in ({keys_str})" + (f" OR parent in ({keys_str})" if include_subtasks else '')
+        return self._cached('fetch_issues_by_keys', query, jql_query, lambda: super(CachedJiraClient, self).fetch_issues_by_keys(
+            issue_keys, include_subtasks, **kwargs))
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import urllib3 with fallback
 try:
@@ -24,6 +26,39 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s')
 logger = logging.getLogger('JiraClient')
 
+# Connection pool shared by all JiraClient sessions
+HTTP_POOL_SIZE = 50
+
+def _build_http_adapter() -> requests.adapters.HTTPAdapter:
+    """
+    Build the pooled HTTP adapter shared by every JiraClient.
+    
+    Sharing one adapter keeps TLS connections alive across the short-lived
+    clients created per web request. Only throttling/gateway status codes are
+    retried here; timeouts and connection errors keep their manual retry loops.
+    """
+    max_retries = 0
+    if Retry:
+        max_retries = Retry(
+            total=3,
+            connect=0,
+            read=0,
+            status=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            # POST is only used for read-only searches, so it is as safe to retry as GET
+            allowed_methods=['GET', 'PUT', 'POST'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    return requests.adapters.HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=max_retries
+    )
+
+_shared_adapter = _build_http_adapter()
+
 class JiraClient:
     """
     Client for connecting to Jira API and retrieving issue data.
@@ -32,13 +67,25 @@ class JiraClient:
     for Jira issue analysis and Epic tracking.
     """
     
-    def __init__(self, base_url: str, access_token: str):
+    # Fields read from epic children by the estimate analysis
+    EPIC_CHILD_FIELDS = ['summary', 'status', 'timeoriginalestimate', 'timeestimate']
+    
+    # Fields requested by fetch_issues unless the caller narrows them
+    DEFAULT_SEARCH_FIELDS = [
+        'key', 'summary', 'status', 'created', 'resolutiondate', 'assignee', 'priority', 'issuetype',
+        'timeoriginalestimate', 'timeestimate', 'fixVersions', 'project', 'customfield_10037',
+        'customfield_10095', 'customfield_10096', 'customfield_10097', 'comment'
+    ]
+    
+    def __init__(self, base_url: str, access_token: str, batch_size: int = 200, async_workers: int = 5):
         """
         Initialize Jira client with connection details.
         
         Args:
             base_url (str): Jira server URL (e.g., https://company.atlassian.net)
             access_token (str): API access token for authentication
+            batch_size (int): Issues requested per search page
+            async_workers (int): Maximum concurrent page requests in fetch_issues_parallel
         """
         self.base_url = base_url.rstrip('/')
         self.access_token = access_token
@@ -54,18 +101,15 @@ class JiraClient:
         self.timeout = (15, 60)  # (connect, read) timeouts - increased for large queries
         self.max_retries = 3
         self.retry_delay = 2  # seconds
-        self.batch_size = 200  # Default batch size
+        self.batch_size = batch_size  # Default batch size
+        self.async_workers = max(1, async_workers)
+        self._page_slots = threading.BoundedSemaphore(self.async_workers)  # Caps concurrent page requests per client
         self.min_batch_size = 50  # Minimum batch size when reducing due to timeouts
+        self._epic_link_field = None  # Resolved lazily by _get_epic_link_field
         
-        # Configure session for better performance
-        if Retry:
-            self.session.mount('https://', requests.adapters.HTTPAdapter(
-                max_retries=Retry(
-                    total=0,  # We handle retries manually
-                    backoff_factor=0.3,
-                    status_forcelist=[500, 502, 503, 504]
-                )
-            ))
+        # Reuse pooled keep-alive connections across clients
+        self.session.mount('https://', _shared_adapter)
+        self.session.mount('http://', _shared_adapter)
     
     def configure_timeouts(self, connect_timeout: int = 15, read_timeout: int = 60, 
                           batch_size: int = 200, min_batch_size: int = 50):
@@ -115,58 +159,149 @@ class JiraClient:
                 
         return False
     
-    def get_epic_children(self, epic_key: str) -> List[Dict]:
+    def get_epic_children(self, epic_key: str, fields: Optional[List[str]] = None) -> Optional[List[Dict]]:
         """
         Fetch all issues linked to an epic.
         
         Args:
             epic_key (str): The key of the epic
+            fields (List[str], optional): Fields to request, defaults to EPIC_CHILD_FIELDS
             
         Returns:
-            List[Dict]: List of child issues
+            Optional[List[Dict]]: List of child issues, or None if they could not be fetched
         """
         logger.info(f"🔍 Fetching child issues for epic: {epic_key}")
         
         try:
-            # Get issues in the epic
+            # Get issues in the epic, page by page so large epics are not cut off at one page
             jql = f"'Epic Link' = {epic_key}"
-            params = {
-                'jql': jql,
-                'maxResults': 500,  # Adjust if needed
-                'fields': 'key,summary,status,timeoriginalestimate,timeestimate'
-            }
-            
-            response = self.session.get(
-                f'{self.base_url}/rest/api/2/search',
-                params=params
-            )
-            response.raise_for_status()
+            requested_fields = ','.join(fields or self.EPIC_CHILD_FIELDS)
+            children = []
             
-            return response.json().get('issues', [])
+            while True:
+                params = {
+                    'jql': jql,
+                    'startAt': len(children),
+                    'maxResults': 500,
+                    'fields': requested_fields
+                }
+                response = self.session.get(
+                    f'{self.base_url}/rest/api/2/search',
+                    params=params,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                
+                data = response.json()
+                batch_issues = data.get('issues', [])
+                children.extend(batch_issues)
+                if not batch_issues or len(children) >= data.get('total', 0):
+                    return children
             
         except Exception as e:
             logger.error(f"Error fetching epic children for {epic_key}: {str(e)}")
-            return []
+            return None
+        
+    def _get_epic_link_field(self) -> Optional[str]:
+        """
+        Resolve the custom field id of the 'Epic Link' field.
+        
+        Returns:
+            Optional[str]: Field id (e.g. customfield_10014) or None if not available
+        """
+        if self._epic_link_field is None:
+            self._epic_link_field = ''
+            try:
+                response = self.session.get(f'{self.base_url}/rest/api/2/field', timeout=self.timeout)
+                response.raise_for_status()
+                for field in response.json():
+                    schema = field.get('schema') or {}
+                    if schema.get('custom') == 'com.pyxis.greenhopper.jira:gh-epic-link' or field.get('name') == 'Epic Link':
+                        self._epic_link_field = field['id']
+                        break
+            except Exception as e:
+                logger.warning(f"⚠️ Could not resolve Epic Link field: {str(e)}")
+        
+        return self._epic_link_field or None
+    
+    def get_children_for_epics(self, epic_keys: List[str], keys_per_query: int = 50) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Fetch child issues for many epics with batched JQL queries.
         
+        Args:
+            epic_keys (List[str]): Keys of the epics
+            keys_per_query (int): Number of epic keys per JQL query
+            
+        Returns:
+            Optional[Dict[str, List[Dict]]]: Child issues grouped by epic key, or None
+            if children cannot be grouped (callers should fall back to get_epic_children)
+        """
+        epic_link_field = self._get_epic_link_field()
+        if not epic_link_field:
+            return None
+        
+        requested = set(epic_keys)
+        children_by_epic = {epic_key: [] for epic_key in epic_keys}
+        
+        for i in range(0, len(epic_keys), keys_per_query):
+            batch_keys = epic_keys[i:i + keys_per_query]
+            jql = f"'Epic Link' in ({','.join(batch_keys)})"
+            current_start = 0
+            logger.info(f"🔍 Fetching child issues for {len(batch_keys)} epics")
+            
+            while True:
+                params = {
+                    'jql': jql,
+                    'startAt': current_start,
+                    'maxResults': 500,
+                    'fields': ','.join(self.EPIC_CHILD_FIELDS + ['parent', epic_link_field])
+                }
+                response = self.session.get(
+                    f'{self.base_url}/rest/api/2/search',
+                    params=params,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                
+                data = response.json()
+                batch_issues = data.get('issues', [])
+                for issue in batch_issues:
+                    fields = issue.get('fields', {})
+                    epic_key = fields.get(epic_link_field) or (fields.get('parent') or {}).get('key')
+                    if epic_key in requested:
+                        children_by_epic[epic_key].append(issue)
+                
+                current_start += len(batch_issues)
+                if not batch_issues or current_start >= data.get('total', 0):
+                    break
+        
+        return children_by_epic
+    
     ## Fetch issues based on JQL query
     ## This method retrieves issues from Jira using a JQL query.
     ## It handles pagination and processes each issue to extract relevant data.
     ## max rows is set to 5000 by default, but can be adjusted.
     ## fetching is done in chunks of 200 to avoid hitting API limits.
-    def fetch_issues(self, jql_query: str, max_results: int = 5000, start_at: int = 0) -> List[Dict]:
+    def fetch_issues(self, jql_query: str, max_results: int = 5000, start_at: int = 0,
+                     fields: Optional[List[str]] = None, expand: Optional[str] = 'changelog',
+                     batch_size: Optional[int] = None) -> List[Dict]:
         """
         Fetch issues from Jira using JQL query with adaptive timeout handling.
         
         Args:
             jql_query (str): JQL query string
             max_results (int): Maximum number of results to fetch
+            fields (List[str], optional): Fields to request, defaults to DEFAULT_SEARCH_FIELDS
+            expand (str, optional): Expansions to request, None to skip the changelog
+            batch_size (int, optional): Issues requested per page, defaults to the client's batch size
             
         Returns:
             List[Dict]: List of issue dictionaries with relevant data
         """
         issues = []
         current_start = start_at
-        current_batch_size = self.batch_size
+        page_size = batch_size or self.batch_size
+        current_batch_size = page_size
         consecutive_timeouts = 0
         
         logger.info(f"🔍 Fetching issues with JQL: {jql_query}")
@@ -183,9 +318,10 @@ class JiraClient:
                         'jql': jql_query,
                         'startAt': current_start,
                         'maxResults': min(current_batch_size, max_results - len(issues)),
-                        'expand': 'changelog',
-                        'fields': 'key,summary,status,created,resolutiondate,assignee,priority,issuetype,timeoriginalestimate,timeestimate,fixVersions,project,customfield_10037,customfield_10095,customfield_10096,customfield_10097,comment'
+                        'fields': ','.join(fields or self.DEFAULT_SEARCH_FIELDS)
                     }
+                    if expand:
+                        params['expand'] = expand
                     
                     logger.info(f"🔄 Fetching batch starting at {current_start} (size: {params['maxResults']}, attempt {attempt + 1}/{self.max_retries})")
                     
@@ -244,6 +380,12 @@ class JiraClient:
                 if not batch_issues:
                     break
                 
+                # Jira may serve smaller pages than requested; keep asking for what it serves
+                served_size = data.get('maxResults')
+                if served_size and served_size < params['maxResults']:
+                    logger.info(f"📏 Jira caps pages at {served_size} issues, using that batch size")
+                    page_size = current_batch_size = served_size
+                
                 # Process each issue to extract relevant data
                 for issue in batch_issues:
                     processed_issue = self._process_issue(issue)
@@ -253,9 +395,9 @@ class JiraClient:
                 current_start += len(batch_issues)
                 
                 # Gradually increase batch size back to normal if we had reduced it
-                if current_batch_size < self.batch_size and consecutive_timeouts == 0:
-                    current_batch_size = min(self.batch_size, current_batch_size + 25)
-                    if current_batch_size < self.batch_size:
+                if current_batch_size < page_size and consecutive_timeouts == 0:
+                    current_batch_size = min(page_size, current_batch_size + 25)
+                    if current_batch_size < page_size:
                         logger.info(f"📈 Increasing batch size to {current_batch_size}")
                 
                 # Log progress
@@ -274,6 +416,104 @@ class JiraClient:
         
         return issues
     
+    def _fetch_search_page(self, jql_query: str, start_at: int, max_results: int,
+                           fields: Optional[List[str]] = None, expand: Optional[str] = 'changelog') -> Optional[Dict]:
+        """
+        Fetch one raw search page, retrying with the same backoff as fetch_issues.
+        
+        Args:
+            jql_query (str): JQL query string
+            start_at (int): Index of the first issue in the page
+            max_results (int): Page size
+            fields (List[str], optional): Fields to request, defaults to DEFAULT_SEARCH_FIELDS
+            expand (str, optional): Expansions to request, None to skip the changelog
+            
+        Returns:
+            Optional[Dict]: Raw search response, or None if every attempt failed
+        """
+        params = {
+            'jql': jql_query,
+            'startAt': start_at,
+            'maxResults': max_results,
+            'fields': ','.join(fields or self.DEFAULT_SEARCH_FIELDS)
+        }
+        if expand:
+            params['expand'] = expand
+        
+        for attempt in range(self.max_retries):
+            try:
+                with self._page_slots:
+                    response = self.session.get(
+                        f'{self.base_url}/rest/api/2/search',
+                        params=params,
+                        timeout=(self.timeout[0], self.timeout[1] * (attempt + 1))
+                    )
+                response.raise_for_status()
+                return response.json()
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"⚠️ Page at {start_at} failed on attempt {attempt + 1}/{self.max_retries}: {str(e)}")
+                if attempt < self.max_retries - 1:
+                    time.sleep(self.retry_delay * (2 ** attempt))
+        
+        return None
+    
+    def fetch_issues_parallel(self, jql_query: str, max_results: int = 5000,
+                              fields: Optional[List[str]] = None, expand: Optional[str] = 'changelog') -> List[Dict]:
+        """
+        Fetch issues from Jira requesting the search pages concurrently.
+        
+        A first page is fetched to learn the total, then the remaining pages are
+        requested with up to async_workers in flight. Pages that keep failing are
+        re-fetched through fetch_issues so they still get its adaptive batch sizing.
+        
+        Args:
+            jql_query (str): JQL query string
+            max_results (int): Maximum number of results to fetch
+            fields (List[str], optional): Fields to request, defaults to DEFAULT_SEARCH_FIELDS
+            expand (str, optional): Expansions to request, None to skip the changelog
+            
+        Returns:
+            List[Dict]: List of issue dictionaries in JQL order
+        """
+        logger.info(f"🔍 Fetching issues in parallel with JQL: {jql_query}")
+        
+        first_page = self._fetch_search_page(jql_query, 0, min(self.batch_size, max_results), fields, expand)
+        if first_page is None:
+            logger.warning("⚠️ First page failed, falling back to sequential fetching")
+            return self.fetch_issues(jql_query, max_results, fields=fields, expand=expand)
+        
+        first_issues = first_page.get('issues', [])
+        total = min(first_page.get('total', 0), max_results)
+        # Jira may cap the page size below what we asked for; page by what it returned
+        page_size = len(first_issues) or self.batch_size
+        starts = list(range(len(first_issues), total, page_size))
+        
+        pages = {0: self._process_issues(first_issues)}
+        if first_issues and starts:
+            logger.info(f"🔄 Fetching {len(starts)} more pages of {page_size} issues ({self.async_workers} workers)")
+            with ThreadPoolExecutor(max_workers=min(self.async_workers, len(starts))) as executor:
+                futures = {
+                    executor.submit(self._fetch_search_page, jql_query, start,
+                                    min(page_size, total - start), fields, expand): start
+                    for start in starts
+                }
+                for future in as_completed(futures):
+                    start = futures[future]
+                    data = future.result()
+                    if data is None:
+                        continue
+                    pages[start] = self._process_issues(data.get('issues', []))
+            
+            for start in starts:
+                if start not in pages:
+                    logger.warning(f"⏭️ Page at {start} failed, retrying sequentially")
+                    pages[start] = self.fetch_issues(jql_query, min(page_size, total - start),
+                                                     start_at=start, fields=fields, expand=expand)
+        
+        issues = [issue for start in sorted(pages) for issue in pages[start]]
+        logger.info(f"✅ Successfully fetched {len(issues)} issues from Jira")
+        return issues[:max_results]
+    
     def handle_timeout_recovery(self, jql_query: str, failed_start: int, max_results: int) -> List[Dict]:
         """
         Attempt to recover from timeout by using simpler queries.
@@ -312,6 +552,10 @@ class JiraClient:
             logger.error(f"🚩 Recovery attempt failed: {str(e)}")
             return []
     
+    def _process_issues(self, raw_issues: List[Dict]) -> List[Dict]:
+        """Process a page of raw issues, dropping any that fail to parse."""
+        return [processed for processed in map(self._process_issue, raw_issues) if processed]
+    
     def _process_issue(self, issue: Dict) -> Optional[Dict]:
         """
         Process raw issue data and extract relevant information.
@@ -413,38 +657,41 @@ class JiraClient:
         Returns:
             List[str]: List of valid Jira issue keys
         """
-        import csv
-        import re
+        import io
+        import pandas as pd
     
-        issue_keys = []
-        jira_key_pattern = re.compile(r'^[A-Z][A-Z0-9]*-\d+$')
+        jira_key_pattern = r'^[A-Z][A-Z0-9]*-\d+$'
     
         try:
-            # Read CSV content
-            csv_content = csv_file.read().decode('utf-8')
-            csv_reader = csv.DictReader(csv_content.splitlines())
+            # Read CSV content as plain strings so keys are never coerced to numbers or NaN.
+            # Only the header's columns are read, so rows with trailing commas or extra
+            # fields (common in spreadsheet-edited exports) neither shift nor reject data.
+            content = csv_file.read()
+            try:
+                header = pd.read_csv(io.BytesIO(content), nrows=0, encoding='utf-8').columns
+                df = pd.read_csv(io.BytesIO(content), dtype=str, keep_default_na=False, encoding='utf-8',
+                                 index_col=False, usecols=range(len(header)))
+            except pd.errors.EmptyDataError:
+                df = pd.DataFrame()
         
             # Look for columns that might contain issue keys
-            key_columns = []
-            if csv_reader.fieldnames:
-                for field in csv_reader.fieldnames:
-                    if any(keyword in field.lower() for keyword in ['key', 'issue', 'ticket', 'id']):
-                        key_columns.append(field)
+            key_columns = [field for field in df.columns
+                           if any(keyword in field.lower() for keyword in ['key', 'issue', 'ticket', 'id'])]
         
             if not key_columns:
                 logger.warning(f"⚠️ No key columns found, using first column")
-                key_columns = [csv_reader.fieldnames[0]] if csv_reader.fieldnames else []
+                key_columns = list(df.columns[:1])
         
             logger.info(f"📋 Using columns for issue keys: {key_columns}")
         
-            # Extract issue keys
-            for row in csv_reader:
-                for column in key_columns:
-                    value = row.get(column, '').strip().upper()
-                    if value and jira_key_pattern.match(value):
-                        if value not in issue_keys:  # Avoid duplicates
-                            issue_keys.append(value)
-                        break  # Found valid key in this row
+            # Per row, take the first key column holding a valid key
+            row_keys = pd.Series(index=df.index, dtype=object)
+            for column in key_columns:
+                values = df[column].str.strip().str.upper()
+                row_keys = row_keys.fillna(values.where(values.str.match(jira_key_pattern)))
+        
+            # Avoid duplicates, keeping first occurrence order
+            issue_keys = row_keys.dropna().drop_duplicates().tolist()
         
             logger.info(f"✅ Extracted {len(issue_keys)} unique issue keys from CSV")
             return issue_keys
@@ -453,60 +700,67 @@ class JiraClient:
             logger.error(f"🚩 Failed to parse CSV: {str(e)}")
             raise Exception(f"CSV parsing failed: {str(e)}")
 
-    def fetch_issues_by_keys(self, issue_keys: List[str], include_subtasks: bool = False) -> List[Dict]:
+    def fetch_issues_by_keys(self, issue_keys: List[str], include_subtasks: bool = False,
+                             keys_per_query: int = 500, max_workers: int = 8) -> List[Dict]:
         """
         Fetch specific issues by their keys.
     
+        Keys are split into chunks queried with one JQL each, and the chunks are
+        fetched concurrently. Subtasks are pulled in by the same query.
+    
         Args:
             issue_keys (List[str]): List of Jira issue keys
             include_subtasks (bool): Whether to include subtasks and linked issues
+            keys_per_query (int): Keys per JQL query
+            max_workers (int): Maximum chunks fetched concurrently, tune against Jira rate limits
         
         Returns:
             List[Dict]: List of issue dictionaries with relevant data
         """
-        all_issues = []
         logger.info(f"🔍 Attempting to fetch {len(issue_keys)} issue keys")
     
-        # Process in batches to avoid URL length limits
-        batch_size = 50  # Conservative batch size for key-based queries
+        chunks = [issue_keys[i:i + keys_per_query] for i in range(0, len(issue_keys), keys_per_query)]
     
-        batch_num = 1
-        for i in range(0, len(issue_keys), batch_size):
-            batch_keys = issue_keys[i:i + batch_size]
-        
-            try:
-                # Create JQL for this batch
-                keys_str = ','.join(batch_keys)
-                jql = f"key in ({keys_str})"
-            
-                logger.info(f"📦 Fetching batch {batch_num}: {len(batch_keys)} keys")
-                logger.info(f"🔍 JQL query: {jql}")
-            
-                # Fetch this batch directly
-                batch_issues = self._fetch_batch_directly(jql, len(batch_keys))
-                logger.info(f"✅ Fetched {len(batch_issues)} issues from batch {batch_num}")
-                all_issues.extend(batch_issues)
-            
-                # If including subtasks, fetch related issues
-                if include_subtasks:
-                    related_issues = self._fetch_related_issues(batch_keys)
-                    logger.info(f"🔗 Fetched {len(related_issues)} related issues for batch {batch_num}")
-                    all_issues.extend(related_issues)
-                
-                batch_num += 1
-                
-            except Exception as e:
-                logger.error(f"🚩 Failed to fetch batch {batch_num}: {str(e)}")
-                batch_num += 1
-                continue
+        def fetch_chunk(batch_num: int, batch_keys: List[str]) -> List[Dict]:
+            keys_str = ','.join(batch_keys)
+            jql = f"key in ({keys_str})"
+            max_results = len(batch_keys)
+            if include_subtasks:
+                jql += f" OR parent in ({keys_str})"
+                max_results += 1000  # Same subtask allowance per chunk as before
+        
+            logger.info(f"📦 Fetching batch {batch_num}: {len(batch_keys)} keys{' with subtasks' if include_subtasks else ''}")
+            logger.debug(f"🔍 JQL query: {jql}")
+            batch_issues = self._fetch_batch_directly(jql, max_results)
+            logger.info(f"✅ Fetched {len(batch_issues)} issues from batch {batch_num}")
+            return batch_issues
     
-        # Remove duplicates based on key
+        results = {}
+        if chunks:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+                futures = {executor.submit(fetch_chunk, num, chunk): num for num, chunk in enumerate(chunks, 1)}
+                for future in as_completed(futures):
+                    batch_num = futures[future]
+                    try:
+                        results[batch_num] = future.result()
+                    except Exception as e:
+                        logger.error(f"🚩 Failed to fetch batch {batch_num}: {str(e)}")
+    
+        # Remove duplicates based on key, keeping chunk order
         seen_keys = set()
         unique_issues = []
-        for issue in all_issues:
-            if issue['key'] not in seen_keys:
-                seen_keys.add(issue['key'])
-                unique_issues.append(issue)
+        for batch_num in sorted(results):
+            for issue in results[batch_num]:
+                if issue['key'] not in seen_keys:
+                    seen_keys.add(issue['key'])
+                    unique_issues.append(issue)
+    
+        # Deleted, moved or mistyped keys are skipped by Jira rather than failing their chunk
+        found_keys = {key.upper() for key in seen_keys}
+        missing_keys = [key for key in issue_keys if key.upper() not in found_keys]
+        if missing_keys:
+            shown = ', '.join(missing_keys[:20]) + (' ...' if len(missing_keys) > 20 else '')
+            logger.warning(f"⚠️ {len(missing_keys)} requested keys were not returned: {shown}")
     
         logger.info(f"✅ Final result: {len(unique_issues)} unique issues for {len(issue_keys)} requested keys")
         if len(unique_issues) == 0 and len(issue_keys) > 0:
@@ -517,40 +771,12 @@ class JiraClient:
         
         return unique_issues
 
-    def _fetch_related_issues(self, parent_keys: List[str]) -> List[Dict]:
-        """
-        Fetch subtasks and linked issues for given parent keys.
-    
-        Args:
-            parent_keys (List[str]): List of parent issue keys
-        
-        Returns:
-            List[Dict]: List of related issues
-        """
-        related_issues = []
-    
-        try:
-            # Fetch subtasks
-            keys_str = ','.join(parent_keys)
-            subtask_jql = f"parent in ({keys_str})"
-        
-            subtasks = self._fetch_batch_directly(subtask_jql, 1000)
-            related_issues.extend(subtasks)
-        
-            logger.info(f"🔗 Found {len(subtasks)} subtasks for parent issues")
-        
-            # Could also fetch linked issues here if needed
-            # linked_jql = f"issue in linkedIssues({keys_str})"
-        
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to fetch related issues: {str(e)}")
-    
-        return related_issues
-    
     def _fetch_batch_directly(self, jql_query: str, max_results: int) -> List[Dict]:
         """
         Fetch issues directly without duplicate logging.
         
+        The query is sent as a POST body so long key lists are not limited by URL length.
+        
         Args:
             jql_query (str): JQL query string
             max_results (int): Maximum number of results to fetch
@@ -563,23 +789,30 @@ class JiraClient:
         
         while True:
             try:
-                params = {
+                payload = {
                     'jql': jql_query,
                     'startAt': current_start,
                     'maxResults': min(200, max_results - len(issues)),
-                    'expand': 'changelog',
-                    'fields': 'key,summary,status,created,resolutiondate,assignee,priority,issuetype'
+                    # Unknown keys become warnings instead of a 400 for the whole query
+                    'validateQuery': 'warn',
+                    'expand': ['changelog'],
+                    'fields': ['key', 'summary', 'status', 'created', 'resolutiondate', 'assignee', 'priority', 'issuetype']
                 }
                 
-                response = self.session.get(
+                response = self.session.post(
                     f'{self.base_url}/rest/api/2/search',
-                    params=params
+                    json=payload,
+                    timeout=self.timeout
                 )
                 response.raise_for_status()
                 
                 data = response.json()
                 batch_issues = data.get('issues', [])
                 
+                if current_start == 0:
+                    for warning in data.get('warningMessages', []):
+                        logger.warning(f"⚠️ Jira: {warning}")
+                
                 if not batch_issues:
                     break
                 
@@ -0,0 +1,40 @@
+"""
+Fast JSON Provider
+orjson-backed Flask JSON provider shared by the web applications.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster jsonify and get_json."""
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string with orjson."""
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes with orjson."""
+        return orjson.loads(s)
+
+def install_json_provider(app):
+    """
+    Use the orjson provider for app when orjson is installed.
+    
+    Args:
+        app (Flask): Application whose jsonify/get_json should use orjson
+        
+    Returns:
+        Flask: The same application, for chaining
+    """
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
+    return app
@@ -47,7 +47,7 @@ def print_menu():
     print()
     print("6. 🔍 Duplicate Story Detector (Individual)")
     print("   └─ Identify potential duplicate stories")
-    print("   └─ Port: 5400")
+    print("   └─ Port: 5600")
     print()
     print("7. 🎯 Generate Presentation Only")
     print("   └─ Create PDF presentation without web interface")
@@ -116,7 +116,7 @@ def main():
                 run_application("lead_time_analyzer.py", "Epic Analyzer (via Lead Time App)", 5100)
                 
             elif choice == "6":
-                run_application("duplicate_web_app.py", "Duplicate Story Detector", 5400)
+                run_application("duplicate_web_app.py", "Duplicate Story Detector", 5600)
                 
             elif choice == "7":
                 generate_presentation()
@@ -7,6 +7,7 @@ Purpose: Unified dashboard for all Jira analytics applications
 """
 
 from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+import io
 import logging
 from datetime import datetime
 import os
@@ -663,18 +664,19 @@ def generate_duplicate_report():
         data = request.get_json()
         pdf_generator = DuplicatePDFReportGenerator()
         
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            pdf_generator.generate_report(data, tmp_file.name)
-            
-            filename = f'duplicate_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
-            
-            return send_file(
-                tmp_file.name,
-                as_attachment=True,
-                download_name=filename,
-                mimetype='application/pdf'
-            )
-            
+        pdf_buffer = io.BytesIO()
+        pdf_generator.generate_report(data, pdf_buffer)
+        pdf_buffer.seek(0)
+        
+        filename = f'duplicate_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
+        
+        return send_file(
+            pdf_buffer,
+            as_attachment=True,
+            download_name=filename,
+            mimetype='application/pdf'
+        )
+        
     except Exception as e:
         logger.error(f"🚩 PDF generation error: {str(e)}")
         return jsonify({'error': f'PDF generation failed: {str(e)}'}), 500
@@ -85,13 +85,13 @@ class PDFReportGenerator:
             textColor=colors.blue
         )
     
-    def generate_report(self, analysis_data: Dict, output_path: str):
+    def generate_report(self, analysis_data: Dict, output_path):
         """
         Generate complete PDF report.
         
         Args:
             analysis_data (Dict): Analysis results and charts
-            output_path (str): Path to save the PDF report
+            output_path (str or file-like): Path or binary buffer to write the PDF report to
         """
         try:
             # Create PDF document with custom canvas for page numbers and footer
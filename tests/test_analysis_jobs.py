@@ -0,0 +1,65 @@
+"""
+Tests for background analysis jobs
+"""
+
+import os
+import sys
+import threading
+
+from flask import Flask
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analysis_jobs import AnalysisJobs, job_status_response
+
+
+class TestAnalysisJobs:
+    """Test suite for AnalysisJobs."""
+
+    def setup_method(self):
+        self.app = Flask(__name__)
+        self.jobs = AnalysisJobs(max_workers=1)
+
+    def test_running_job_reports_202_then_result(self):
+        """Test a job is reported as running until it finishes."""
+        release = threading.Event()
+
+        def analysis():
+            release.wait(5)
+            return {'done': True}, 200
+
+        job_id = self.jobs.submit(analysis)
+
+        with self.app.app_context():
+            response, status = job_status_response(self.jobs, job_id)
+            assert status == 202
+            assert response.get_json()['status'] == 'running'
+
+            release.set()
+            self.jobs._jobs[job_id][0].result(timeout=5)
+            response, status = job_status_response(self.jobs, job_id)
+            assert status == 200
+            assert response.get_json() == {'done': True}
+
+    def test_failed_job_reports_500(self):
+        """Test an exception inside the job becomes an error response."""
+        def failing():
+            raise ValueError('boom')
+
+        job_id = self.jobs.submit(failing)
+        self.jobs._jobs[job_id][0].exception(timeout=5)
+
+        with self.app.app_context():
+            response, status = job_status_response(self.jobs, job_id)
+        assert status == 500
+        assert 'boom' in response.get_json()['error']
+
+    def test_uncollected_results_expire(self):
+        """Test finished jobs nobody polled are dropped after the TTL."""
+        jobs = AnalysisJobs(max_workers=1, ttl_seconds=0)
+        job_id = jobs.submit(lambda: ({}, 200))
+        jobs._jobs[job_id][0].result(timeout=5)
+
+        jobs.submit(lambda: ({}, 200))
+
+        assert jobs.get(job_id) is None
@@ -32,4 +32,48 @@ def test_analyze_missing_data(client):
     
     data = json.loads(response.data)
     assert 'error' in data
-    assert 'Missing required fields' in data['error']
\ No newline at end of file
+    assert 'Missing required fields' in data['error']
+
+def test_generate_report_streams_pdf(client):
+    """Test the PDF report is returned from memory as an attachment."""
+    response = client.post('/generate_report', json={
+        'total_issues': 0,
+        'analysis_period': '3 months',
+        'charts': {},
+        'metrics': {},
+        'jql_query': 'project = TEST',
+        'jira_url': 'https://test.atlassian.net'
+    })
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert response.data.startswith(b'%PDF')
+
+
+def test_app_uses_orjson_provider():
+    """Test jsonify responses are encoded by the orjson provider when available."""
+    pytest.importorskip('orjson')
+    from json_provider import ORJSONProvider
+
+    assert isinstance(app.json, ORJSONProvider)
+
+
+def test_large_json_responses_are_gzipped(client):
+    """Test JSON responses above the size threshold are gzip-encoded on request."""
+    import gzip
+    from flask import jsonify
+
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip, deflate'}):
+        payload = {'charts': {'lead_time': 'A' * 5000}}
+        response = app.process_response(jsonify(payload))
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert json.loads(gzip.decompress(response.get_data())) == payload
+
+
+def test_small_json_responses_are_not_gzipped(client):
+    """Test short error payloads are sent uncompressed."""
+    response = client.post('/analyze', data={}, headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in response.headers
+    assert 'Missing required fields' in json.loads(response.data)['error']
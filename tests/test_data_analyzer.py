@@ -12,7 +12,9 @@ import pytz
 # Add the parent directory to the path so we can import our modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from data_analyzer import DataAnalyzer
+import numpy as np
+
+from data_analyzer import DataAnalyzer, NS_PER_DAY, accumulate_status_durations
 
 class TestDataAnalyzer:
     """Test suite for DataAnalyzer class."""
@@ -291,4 +293,62 @@ class TestDataAnalyzer:
         assert pd.isna(df.iloc[0]['created'])
         assert pd.isna(df.iloc[0]['resolution_date'])
         # Status transitions with malformed dates should be filtered out
-        assert len(df.iloc[0]['status_transitions']) == 0
\ No newline at end of file
+        assert len(df.iloc[0]['status_transitions']) == 0
+    
+    def test_accumulate_status_durations_per_issue(self):
+        """Test the batched duration kernel on the date-ordered transitions of two issues."""
+        offsets = np.array([0, 3, 4], dtype=np.int64)
+        # Issue 0 goes 0 -> 1 -> unmeasured; issue 1 stays in 0
+        changed_ns = np.array([0, 2, 5, 1], dtype=np.int64) * NS_PER_DAY
+        codes = np.array([0, 1, -1, 0], dtype=np.int8)
+        end_ns = np.array([10, 4], dtype=np.int64) * NS_PER_DAY
+        
+        totals = accumulate_status_durations(offsets, changed_ns, codes, end_ns, 2)
+        
+        assert totals.tolist() == [[2.0, 3.0], [3.0, 0.0]]
+    
+    def test_status_discovery_matches_case_insensitively_and_learns(self):
+        """Test exact lookups ignore case and auto-mapped statuses become exact hits."""
+        df = pd.DataFrame({
+            'current_status': ['in progress', 'Waiting For Customer'],
+            'status_transitions': [[], []]
+        })
+        
+        mappings = self.analyzer._discover_and_map_statuses(df)
+        
+        assert 'in progress' in mappings['in_progress']
+        assert 'Waiting For Customer' in mappings['waiting']
+        assert self.analyzer._find_best_status_match('WAITING FOR CUSTOMER') == 'waiting'
+    
+    def test_create_dataframe_transitions_are_ordered_nanoseconds(self):
+        """Test ingest leaves only parsed, date-ordered transitions for the duration loops."""
+        issues = [{
+            'key': 'TEST-ORDER',
+            'created': '2023-01-01T09:00:00.000+0000',
+            'resolution_date': None,
+            'status_history': [
+                {'from_status': 'In Progress', 'to_status': 'Done', 'changed': '2023-01-03T09:00:00.000+0000'},
+                {'from_status': 'To Do', 'to_status': 'In Progress', 'changed': '2023-01-02T10:00:00.000+0100'},
+                {'from_status': 'Done', 'to_status': 'Reopened', 'changed': 'not-a-date'}
+            ]
+        }]
+        
+        transitions = self.analyzer._create_dataframe(issues).iloc[0]['status_transitions']
+        
+        assert [t.to_status for t in transitions] == ['In Progress', 'Done']
+        assert all(isinstance(t.changed, int) for t in transitions)
+        assert transitions[1].changed - transitions[0].changed == pd.Timedelta(days=1).value
+    
+    def test_create_dataframe_skips_malformed_issues(self):
+        """Test issues without a key and non-dict entries are dropped up front."""
+        issues = [
+            {'key': 'TEST-OK', 'created': '2023-01-01T09:00:00.000+0000', 'status_history': ['bad', None]},
+            {'summary': 'no key'},
+            'not-an-issue'
+        ]
+        
+        df = self.analyzer._create_dataframe(issues)
+        
+        assert df['key'].tolist() == ['TEST-OK']
+        assert df.iloc[0]['status_transitions'] == []
+        assert self.analyzer._skipped_count == 2
\ No newline at end of file
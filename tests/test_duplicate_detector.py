@@ -0,0 +1,167 @@
+"""
+Tests for the duplicate story detector
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import duplicate_detector
+from duplicate_detector import DuplicateDetector
+
+
+def make_issue(key, summary, created, description=None):
+    return {'key': key, 'summary': summary, 'status': 'To Do', 'created': created, 'fields': {'description': description}}
+
+
+class StubJiraClient:
+    """Returns a fixed issue list instead of querying Jira."""
+
+    def __init__(self, issues):
+        self.issues = issues
+
+    def fetch_issues(self, jql_query, max_results=1000, **kwargs):
+        return self.issues
+
+
+class TestDuplicateDetector:
+    """Test suite for DuplicateDetector."""
+
+    def setup_method(self):
+        self.issues = [
+            make_issue('T-3', 'Login page shows error after saving the form', '2024-01-03'),
+            make_issue('T-1', 'Login page shows an error after saving form', '2024-01-01'),
+            make_issue('T-2', 'Export the sprint report as PDF', '2024-01-02'),
+            make_issue('T-4', 'Login page shows error after saving the form {code}x = 1{code}', '2024-01-04'),
+        ]
+
+    def test_groups_similar_issues_with_oldest_as_primary(self):
+        """Test near-identical summaries form one group headed by the oldest issue."""
+        groups = DuplicateDetector(StubJiraClient(self.issues))._find_duplicate_groups(self.issues)
+
+        assert len(groups) == 1
+        assert groups[0]['primary_issue']['key'] == 'T-1'
+        assert sorted(d['issue']['key'] for d in groups[0]['duplicates']) == ['T-3', 'T-4']
+        assert all(d['similarity'] >= 0.6 for d in groups[0]['duplicates'])
+
+    def test_analyze_duplicates_reports_statistics(self):
+        """Test the report counts duplicates excluding primary issues."""
+        report = DuplicateDetector(StubJiraClient(self.issues)).analyze_duplicates('project = T')
+
+        assert report['total_issues_analyzed'] == 4
+        assert report['statistics']['potential_duplicates'] == 2
+        assert report['statistics']['largest_group_size'] == 3
+
+    def test_groups_transitively_similar_issues_together(self):
+        """Test issues linked only through a shared neighbour end up in one group."""
+        issues = [
+            make_issue('T-1', 'Login page shows error after saving the form', '2024-01-01'),
+            make_issue('T-2', 'Login page shows error when exporting the sprint report', '2024-01-02'),
+            make_issue('T-3', 'Board view crashes when exporting the sprint report', '2024-01-03'),
+        ]
+        detector = DuplicateDetector(StubJiraClient(issues))
+
+        groups = detector._find_duplicate_groups(issues)
+
+        assert len(groups) == 1
+        assert groups[0]['primary_issue']['key'] == 'T-1'
+        assert groups[0]['group_size'] == 3
+        similarities = {d['issue']['key']: d['similarity'] for d in groups[0]['duplicates']}
+        assert similarities['T-2'] >= 0.6
+        assert similarities['T-3'] < 0.6
+
+    def test_parallel_scoring_matches_serial(self, monkeypatch):
+        """Test scoring candidates in worker processes finds the same pairs and scores."""
+        detector = DuplicateDetector(StubJiraClient(self.issues))
+        texts = [detector._extract_text_content(issue).lower() for issue in self.issues]
+        serial = detector._pairwise_similarities(texts)
+
+        monkeypatch.setattr(duplicate_detector, 'SIMILARITY_WORKERS', 2)
+        monkeypatch.setattr(duplicate_detector, 'PARALLEL_MIN_PAIRS', 0)
+        monkeypatch.setattr(duplicate_detector, 'similarity_pool', None)
+
+        assert detector._pairwise_similarities(texts) == serial
+        pool = duplicate_detector.similarity_pool
+        assert pool is not None and duplicate_detector.get_similarity_pool() is pool
+        pool.shutdown()
+
+    def test_pdf_report_is_sent_from_memory(self):
+        """Test the web app streams the generated PDF without a temporary file."""
+        from duplicate_web_app import app
+
+        report = DuplicateDetector(StubJiraClient(self.issues)).analyze_duplicates('project = T')
+        response = app.test_client().post('/generate_duplicate_report',
+                                          json={'analysis_results': report, 'jira_url': 'https://jira.example.com'})
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/pdf'
+        assert response.data.startswith(b'%PDF')
+
+    def test_web_app_uses_orjson_provider(self):
+        """Test duplicate analysis responses are encoded by the orjson provider when available."""
+        pytest.importorskip('orjson')
+        from duplicate_web_app import app
+        from json_provider import ORJSONProvider
+
+        assert isinstance(app.json, ORJSONProvider)
+
+    def test_extract_text_content_reuses_cleaned_text(self):
+        """Test markup is stripped and repeated issues are served from the cleaning cache."""
+        issue = make_issue('T-9', 'Crash  on {code}x{code} save', '2024-01-09', description='See [link] now')
+        detector = DuplicateDetector(StubJiraClient([issue]))
+        duplicate_detector.clean_issue_text.cache_clear()
+
+        assert detector._extract_text_content(issue) == 'Crash on x save See now'
+        assert detector._extract_text_content(issue) == 'Crash on x save See now'
+        assert duplicate_detector.clean_issue_text.cache_info().hits == 1
+
+    def test_token_overlap_prefilter_is_opt_in(self):
+        """Test the word-overlap prefilter only drops pairs once a threshold is set."""
+        texts = ['login page shows error', 'login page shows error', 'loginpage showserror']
+        detector = DuplicateDetector(StubJiraClient([]))
+
+        assert (0, 2) in detector._pairwise_similarities(texts)
+
+        detector.token_overlap_threshold = 0.3
+        assert sorted(detector._pairwise_similarities(texts)) == [(0, 1)]
+
+    def test_token_overlap_threshold_defaults_to_module_setting(self, monkeypatch):
+        """Test new detectors pick up the DUPLICATE_TOKEN_OVERLAP setting."""
+        assert DuplicateDetector(StubJiraClient([])).token_overlap_threshold is None
+
+        monkeypatch.setattr(duplicate_detector, 'TOKEN_OVERLAP_THRESHOLD', 0.3)
+        detector = DuplicateDetector(StubJiraClient([]))
+
+        assert detector.token_overlap_threshold == 0.3
+        texts = ['login page shows error', 'login page shows error', 'loginpage showserror']
+        assert sorted(detector._pairwise_similarities(texts)) == [(0, 1)]
+
+    def test_web_analysis_runs_as_background_job(self, monkeypatch):
+        """Test the analyze endpoint returns a job ID and the result is collected once by polling."""
+        import duplicate_web_app
+
+        issues = self.issues
+
+        class ConnectedJiraClient(StubJiraClient):
+            def __init__(self, base_url, access_token):
+                super().__init__(issues)
+
+            def test_connection(self):
+                return True
+
+        monkeypatch.setattr(duplicate_web_app, 'JiraClient', ConnectedJiraClient)
+        client = duplicate_web_app.app.test_client()
+
+        response = client.post('/analyze_duplicates', data={
+            'jira_url': 'https://jira.example.com', 'access_token': 'token', 'jql_query': 'project = T'})
+        assert response.status_code == 202
+        job_id = response.get_json()['job_id']
+
+        duplicate_web_app.analysis_jobs.get(job_id).result(timeout=30)
+        result = client.get(f'/result/{job_id}')
+        assert result.status_code == 200
+        assert result.get_json()['analysis_results']['statistics']['potential_duplicates'] == 2
+        assert client.get(f'/result/{job_id}').status_code == 404
@@ -0,0 +1,173 @@
+"""
+Tests for the Epic Fix Version analyzer
+"""
+
+import json
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import epic_fixversion_app
+from epic_fixversion_app import EpicFixVersionAnalyzer, save_results_to_file
+
+
+def make_epic(key, fix_versions=()):
+    """Build a processed epic as returned by JiraClient.fetch_issues."""
+    return {
+        'key': key,
+        'summary': f'Epic {key}',
+        'status': 'In Progress',
+        'assignee': 'Unassigned',
+        'fields': {'fixVersions': [{'name': name} for name in fix_versions]}
+    }
+
+
+class FakeJiraClient:
+    """Answers initiative queries and childIssuesOf queries from canned data."""
+
+    def __init__(self, initiatives, epics_by_initiative, failing=()):
+        self.initiatives = initiatives
+        self.epics_by_initiative = epics_by_initiative
+        self.failing = set(failing)
+        self.queries = []
+        self.requested_fields = []
+        self.max_results = []
+
+    def fetch_issues(self, jql_query, max_results=5000, fields=None, expand='changelog', batch_size=None):
+        self.queries.append(jql_query)
+        self.requested_fields.append((fields, expand))
+        self.max_results.append(max_results)
+        parents = re.findall(r'childIssuesOf\("([^"]+)"\)', jql_query)
+        if not parents:
+            return self.initiatives
+        if self.failing.intersection(parents):
+            raise RuntimeError('Jira unavailable')
+        epics = [epic for parent in parents for epic in self.epics_by_initiative.get(parent, [])]
+        return epics[:max_results]
+
+
+class TestEpicFixVersionAnalyzer:
+    """Test suite for EpicFixVersionAnalyzer."""
+
+    def setup_method(self):
+        self.initiatives = [
+            {'key': 'INIT-1', 'summary': 'First initiative'},
+            {'key': 'INIT-2', 'summary': 'Second initiative'},
+            {'key': 'INIT-3', 'summary': 'Third initiative'},
+        ]
+        self.epics = {
+            'INIT-1': [make_epic('EP-1', ['R1']), make_epic('EP-2', ['R1', 'R2'])],
+            'INIT-3': [make_epic('EP-3')],
+        }
+
+    def test_analyze_groups_epics_by_initiative_in_order(self):
+        """Test each initiative keeps its own epics and the initiative order."""
+        client = FakeJiraClient(self.initiatives, self.epics)
+
+        results = EpicFixVersionAnalyzer(client).analyze('type = Initiative')
+
+        assert results['success'] is True
+        assert results['total_initiatives'] == 3
+        assert results['total_epics'] == 3
+        assert [r['initiative_key'] for r in results['results']] == ['INIT-1', 'INIT-3']
+        assert [e['key'] for e in results['results'][0]['epics']] == ['EP-1', 'EP-2']
+        assert results['results'][0]['epics'][1]['fix_versions'] == ['R1', 'R2']
+
+    def test_analyze_skips_initiatives_whose_fetch_fails(self):
+        """Test a failing initiative query does not fail the whole analysis."""
+        client = FakeJiraClient(self.initiatives, self.epics, failing=['INIT-1'])
+
+        results = EpicFixVersionAnalyzer(client).analyze('type = Initiative')
+
+        assert results['success'] is True
+        assert [r['initiative_key'] for r in results['results']] == ['INIT-3']
+
+    def test_initiatives_without_epics_share_one_query(self):
+        """Test a batch whose query finds no epics is not queried per initiative."""
+        client = FakeJiraClient(self.initiatives, {})
+
+        results = EpicFixVersionAnalyzer(client).analyze('type = Initiative', fix_version='R1')
+
+        assert results['total_epics'] == 0
+        assert len(client.queries) == 2
+        assert client.queries[1].count('childIssuesOf') == 3
+        assert 'fixVersion = "R1"' in client.queries[1]
+
+    def test_batch_with_epics_is_probed_once_then_queried_per_initiative(self):
+        """Test every epic is downloaded once when every initiative of a batch has epics."""
+        initiatives = [{'key': f'INIT-{i}', 'summary': f'Initiative {i}'} for i in range(10)]
+        epics = {f'INIT-{i}': [make_epic(f'EP-{i}')] for i in range(10)}
+        client = FakeJiraClient(initiatives, epics)
+
+        results = EpicFixVersionAnalyzer(client).analyze('type = Initiative')
+
+        assert results['total_epics'] == 10
+        assert [r['epics'][0]['key'] for r in results['results']] == [f'EP-{i}' for i in range(10)]
+        # Initiative query, one probe for the batch, one query per initiative
+        assert len(client.queries) == 12
+        assert client.queries[1].count('childIssuesOf') == 10
+        assert client.max_results[1] == 1
+        assert client.requested_fields[1] == (['key'], None)
+        assert all(query.count('childIssuesOf') == 1 for query in client.queries[2:])
+
+    def test_queries_request_only_needed_fields(self):
+        """Test initiative and epic queries narrow the fields and skip the changelog."""
+        client = FakeJiraClient(self.initiatives, self.epics)
+
+        EpicFixVersionAnalyzer(client).analyze('type = Initiative')
+
+        initiative_fields, initiative_expand = client.requested_fields[0]
+        assert initiative_fields == ['summary']
+        assert initiative_expand is None
+        probe_fields, probe_expand = client.requested_fields[1]
+        assert probe_fields == ['key']
+        assert probe_expand is None
+        for fields, expand in client.requested_fields[2:]:
+            assert 'fixVersions' in fields and 'customfield_10097' in fields
+            assert expand is None
+
+    def test_extract_comments_takes_first_matching_comment_per_topic(self):
+        """Test keywords match case-insensitively inside words and the first match wins."""
+        fields = {'comment': {'comments': [
+            {'body': 'Kickoff done'},
+            {'body': 'Rollout DELAYED on the new Platforms'},
+            {'body': 'Platform team agreed'},
+        ]}}
+
+        comments = EpicFixVersionAnalyzer(FakeJiraClient([], {}))._extract_comments(fields)
+
+        assert comments == {
+            'platform': 'Rollout DELAYED on the new Platforms',
+            'impacts': 'Rollout DELAYED on the new Platforms',
+        }
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_save_results_to_file_writes_compact_json(tmp_path, monkeypatch, use_orjson):
+    """Test saved results round-trip as compact JSON with and without orjson."""
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(epic_fixversion_app, 'orjson', None)
+    monkeypatch.setattr(epic_fixversion_app, 'RESULTS_DIR', tmp_path)
+    results = {'fix_version': 'R1/2', 'results': [{'initiative_key': 'INIT-1', 'epics': [{'summary': 'Épic'}]}]}
+
+    assert save_results_to_file('R1/2', results) is True
+
+    saved = list(tmp_path.glob('R1_2_*.json'))
+    assert len(saved) == 1
+    raw = saved[0].read_text(encoding='utf-8')
+    assert json.loads(raw) == results
+    assert '\n' not in raw and 'Épic' in raw
+
+
+def test_app_uses_orjson_provider():
+    """Test analysis responses are encoded by the orjson provider when available."""
+    pytest.importorskip('orjson')
+    from json_provider import ORJSONProvider
+
+    assert isinstance(epic_fixversion_app.app.json, ORJSONProvider)
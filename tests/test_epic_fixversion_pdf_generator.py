@@ -0,0 +1,117 @@
+"""
+Tests for the Epic Fix Version PDF report generator
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from epic_fixversion_pdf_generator import EpicFixVersionPDFGenerator, StreamedStory
+
+
+def make_analysis(epic_count=3):
+    """Build analysis results shaped like EpicFixVersionAnalyzer.analyze output."""
+    epics = [{
+        'key': f'EP-{i}',
+        'summary': f'Epic <{i}> & friends',
+        'status': 'In Progress',
+        'fix_versions': ['R1'],
+        'complexity': 'M',
+        'requesting_customer': '',
+        'assignee': 'Ann',
+        'target_start': '',
+        'solution': 'Ship it',
+        'comments': {'platform': 'Platform ready', 'impacts': ''},
+    } for i in range(epic_count)]
+    return {
+        'fix_version': 'R1',
+        'excluded_statuses': ['Done'],
+        'total_initiatives': 1,
+        'initiatives_with_epics': 1,
+        'total_epics': epic_count,
+        'results': [{'initiative_key': 'INIT-1', 'initiative_summary': 'First initiative',
+                     'epic_count': epic_count, 'epics': epics}],
+        'timestamp': '2024-05-01T10:00:00',
+    }
+
+
+class TestEpicFixVersionPDFGenerator:
+    """Test suite for EpicFixVersionPDFGenerator."""
+
+    def test_generate_report_returns_pdf_buffer(self):
+        """Test the report is rendered into an in-memory PDF."""
+        buffer = EpicFixVersionPDFGenerator().generate_report(make_analysis(), jira_url='https://jira.example.com')
+
+        assert buffer.getvalue().startswith(b'%PDF')
+
+    def test_epic_keys_link_to_jira(self):
+        """Test epic keys become links to the Jira issue when a Jira URL is given."""
+        generator = EpicFixVersionPDFGenerator()
+        generator.jira_url = 'https://jira.example.com'
+
+        epics_table = generator._create_epics_table(make_analysis()['results'][0]['epics'])
+
+        assert len(epics_table._cellvalues) == 4
+        assert 'https://jira.example.com/browse/EP-0' in epics_table._cellvalues[1][0].text
+
+    def test_short_and_empty_values_are_plain_strings_unless_they_wrap(self):
+        """Test short and empty values skip Paragraph but long ones still wrap."""
+        epics = make_analysis(epic_count=1)['results'][0]['epics']
+        epics[0]['status'] = 'Waiting for a very long external approval'
+        epics[0]['solution'] = ''
+        epics[0]['comments'] = {'platform': '', 'impacts': ''}
+
+        generator = EpicFixVersionPDFGenerator()
+        generator.jira_url = None
+
+        row = generator._create_epics_table(epics)._cellvalues[1]
+
+        assert row[3] == 'M'
+        assert row[4] == 'N/A'
+        assert row[5] == 'Ann'
+        assert not isinstance(row[2], str)
+        assert row[8] == 'N/A'
+        assert row[9] == 'N/A'
+
+    def test_streamed_story_refills_from_chunks_when_drained(self):
+        """Test the story pulls the next non-empty chunk only once it runs empty."""
+        story = StreamedStory(['title'], iter([['a', 'b'], [], ['c']]))
+
+        consumed = []
+        while len(story):
+            consumed.append(story[0])
+            del story[0]
+
+        assert consumed == ['title', 'a', 'b', 'c']
+
+    def test_long_summary_is_cut_before_escaping(self):
+        """Test long free text is truncated on the raw value, keeping escapes whole."""
+        epics = make_analysis(epic_count=1)['results'][0]['epics']
+        epics[0]['summary'] = 'a' * 299 + '&' * 50
+        generator = EpicFixVersionPDFGenerator()
+        generator.jira_url = None
+
+        summary_cell = generator._create_epics_table(epics)._cellvalues[1][1]
+
+        assert summary_cell.text == 'a' * 299 + '&amp;'
+
+    def test_report_timestamp_accepts_utc_suffix_and_survives_bad_values(self):
+        """Test 'Z' timestamps are formatted and invalid ones fall back instead of failing the report."""
+        generator = EpicFixVersionPDFGenerator()
+
+        assert generator._format_timestamp('2024-05-01T10:00:00Z') == '2024-05-01 10:00:00'
+        assert len(generator._format_timestamp('yesterday')) == 19
+
+        analysis = make_analysis()
+        analysis['timestamp'] = 'yesterday'
+        assert generator.generate_report(analysis).getvalue().startswith(b'%PDF')
+
+    def test_page_content_is_compressed_regardless_of_reportlab_config(self, monkeypatch):
+        """Test page streams are deflated even when compression is off globally."""
+        from reportlab import rl_config
+        monkeypatch.setattr(rl_config, 'pageCompression', 0)
+
+        pdf = EpicFixVersionPDFGenerator().generate_report(make_analysis()).getvalue()
+
+        assert b'/FlateDecode' in pdf
@@ -0,0 +1,108 @@
+"""
+Tests for the on-disk Jira issue cache
+"""
+
+import json
+import os
+import sys
+import pytest
+import responses
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jira_cache import JiraIssueCache, CachedJiraClient
+from jira_client import JiraClient
+
+
+class CountingJiraClient(CachedJiraClient):
+    """CachedJiraClient whose underlying Jira fetches are counted instead of sent."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+        self.stamp = '1|2024-05-01T10:00:00.000+0000'
+
+    def _freshness_stamp(self, jql_query):
+        return self.stamp
+
+    def _search(self):
+        self.calls += 1
+        return [{'key': 'T-1', 'status': 'Done', 'status_history': []}]
+
+
+class TestJiraIssueCache:
+    """Test suite for JiraIssueCache and CachedJiraClient."""
+
+    @pytest.fixture(autouse=True)
+    def stub_jira(self, monkeypatch):
+        monkeypatch.setattr(JiraClient, 'fetch_issues_parallel', lambda client, *args, **kwargs: client._search())
+
+    def test_second_fetch_is_served_from_disk(self, tmp_path):
+        """Test a repeated query hits the cache and skips Jira."""
+        cache = JiraIssueCache(str(tmp_path))
+        client = CountingJiraClient("https://test.atlassian.net", "token", cache=cache)
+
+        first = client.fetch_issues_parallel("project = T")
+        assert client.cache_status == 'MISS'
+        second = client.fetch_issues_parallel("project = T")
+
+        assert client.cache_status == 'HIT'
+        assert first == second
+        assert client.calls == 1
+
+    def test_cache_is_scoped_to_token(self, tmp_path):
+        """Test a different token never reads another user's cached issues."""
+        cache = JiraIssueCache(str(tmp_path))
+        CountingJiraClient("https://test.atlassian.net", "token-a", cache=cache).fetch_issues_parallel("project = T")
+        other = CountingJiraClient("https://test.atlassian.net", "token-b", cache=cache)
+
+        other.fetch_issues_parallel("project = T")
+
+        assert other.cache_status == 'MISS'
+        assert other.calls == 1
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Test entries older than the TTL are treated as misses."""
+        cache = JiraIssueCache(str(tmp_path), ttl_seconds=0)
+        key = JiraIssueCache.make_key("https://test.atlassian.net", "token", "fetch_issues", "q")
+        cache.set(key, [{'key': 'T-1'}])
+
+        assert cache.get(key) is None
+        assert cache.clear() == 0
+
+    def test_changed_issues_are_fetched_again(self, tmp_path):
+        """Test an update to a matching issue invalidates the cached result."""
+        client = CountingJiraClient("https://test.atlassian.net", "token", cache=JiraIssueCache(str(tmp_path)))
+        client.fetch_issues_parallel("project = T")
+
+        client.stamp = '1|2024-05-02T09:00:00.000+0000'
+        client.fetch_issues_parallel("project = T")
+
+        assert client.cache_status == 'MISS'
+        assert client.calls == 2
+
+    def test_cache_is_bypassed_when_freshness_is_unknown(self, tmp_path):
+        """Test results are never served unchecked when the freshness query fails."""
+        client = CountingJiraClient("https://test.atlassian.net", "token", cache=JiraIssueCache(str(tmp_path)))
+        client.stamp = None
+
+        client.fetch_issues_parallel("project = T")
+        client.fetch_issues_parallel("project = T")
+
+        assert client.cache_status == 'MISS'
+        assert client.calls == 2
+
+    @responses.activate
+    def test_freshness_stamp_uses_latest_update_and_total(self):
+        """Test the freshness query replaces the ordering and reads one issue's updated field."""
+        responses.add(responses.POST, "https://test.atlassian.net/rest/api/2/search", json={
+            "total": 42, "issues": [{"key": "T-9", "fields": {"updated": "2024-05-01T10:00:00.000+0000"}}]
+        })
+        client = CachedJiraClient("https://test.atlassian.net", "token")
+
+        stamp = client._freshness_stamp("project = T ORDER BY created ASC")
+
+        assert stamp == '42|2024-05-01T10:00:00.000+0000'
+        payload = json.loads(responses.calls[0].request.body)
+        assert payload['jql'] == 'project = T ORDER BY updated DESC'
+        assert payload['maxResults'] == 1
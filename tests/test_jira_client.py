@@ -90,6 +90,226 @@ class TestJiraClient:
         assert issues[0]["summary"] == "Test issue"
         assert len(issues[0]["status_history"]) == 1
 
+    @responses.activate
+    def test_get_children_for_epics_groups_by_epic_link(self):
+        """Test batched child fetching groups children by their epic."""
+        responses.add(
+            responses.GET,
+            f"{self.base_url}/rest/api/2/field",
+            json=[
+                {"id": "summary", "name": "Summary"},
+                {"id": "customfield_10014", "name": "Epic Link",
+                 "schema": {"custom": "com.pyxis.greenhopper.jira:gh-epic-link"}}
+            ],
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            f"{self.base_url}/rest/api/2/search",
+            json={
+                "total": 3,
+                "issues": [
+                    {"key": "T-1", "fields": {"customfield_10014": "EPIC-1", "timeoriginalestimate": 3600}},
+                    {"key": "T-2", "fields": {"customfield_10014": "EPIC-2", "timeoriginalestimate": 7200}},
+                    {"key": "T-3", "fields": {"customfield_10014": "EPIC-1", "timeoriginalestimate": None}}
+                ]
+            },
+            status=200
+        )
+        
+        children = self.client.get_children_for_epics(["EPIC-1", "EPIC-2", "EPIC-3"])
+        
+        assert [issue["key"] for issue in children["EPIC-1"]] == ["T-1", "T-3"]
+        assert [issue["key"] for issue in children["EPIC-2"]] == ["T-2"]
+        assert children["EPIC-3"] == []
+        search_call = responses.calls[1].request
+        assert "EPIC-1%2CEPIC-2%2CEPIC-3" in search_call.url
+    
+    @responses.activate
+    def test_get_children_for_epics_without_epic_link_field(self):
+        """Test batched fetching reports unavailability when Epic Link is unknown."""
+        responses.add(
+            responses.GET,
+            f"{self.base_url}/rest/api/2/field",
+            json=[{"id": "summary", "name": "Summary"}],
+            status=200
+        )
+        
+        assert self.client.get_children_for_epics(["EPIC-1"]) is None
+
+    @responses.activate
+    def test_fetch_issues_with_narrowed_fields(self):
+        """Test callers can restrict requested fields and skip the changelog."""
+        responses.add(
+            responses.GET,
+            f"{self.base_url}/rest/api/2/search",
+            json={"total": 1, "issues": [{"key": "EPIC-1", "fields": {"summary": "Epic", "status": {"name": "Open"}}}]},
+            status=200
+        )
+        
+        issues = self.client.fetch_issues("issuetype = Epic", fields=["summary", "status"], expand=None)
+        
+        assert issues[0]["key"] == "EPIC-1"
+        request_url = responses.calls[0].request.url
+        assert "fields=summary%2Cstatus" in request_url
+        assert "expand" not in request_url
+
+    def _register_paged_search(self, total, failing_starts=()):
+        """Serve search pages sliced by startAt/maxResults from a fake result set."""
+        from urllib.parse import urlparse, parse_qs
+        attempts = {}
+        
+        def callback(request):
+            query = parse_qs(urlparse(request.url).query)
+            start = int(query['startAt'][0])
+            size = int(query['maxResults'][0])
+            attempts[start] = attempts.get(start, 0) + 1
+            if start in failing_starts and attempts[start] <= self.client.max_retries:
+                return (500, {}, '')
+            issues = [{"key": f"T-{i}", "fields": {"summary": f"Issue {i}"}}
+                      for i in range(start, min(start + size, total))]
+            return (200, {}, json.dumps({"total": total, "issues": issues}))
+        
+        responses.add_callback(responses.GET, f"{self.base_url}/rest/api/2/search", callback=callback)
+        return attempts
+    
+    @responses.activate
+    def test_fetch_issues_follows_server_page_cap(self):
+        """Test a requested batch size above the server cap continues with the served page size."""
+        from urllib.parse import urlparse, parse_qs
+        requested_sizes = []
+        
+        def callback(request):
+            query = parse_qs(urlparse(request.url).query)
+            start = int(query['startAt'][0])
+            requested_sizes.append(int(query['maxResults'][0]))
+            issues = [{"key": f"T-{i}", "fields": {"summary": f"Issue {i}"}} for i in range(start, min(start + 3, 7))]
+            return (200, {}, json.dumps({"total": 7, "maxResults": 3, "issues": issues}))
+        
+        responses.add_callback(responses.GET, f"{self.base_url}/rest/api/2/search", callback=callback)
+        
+        issues = self.client.fetch_issues("project = T", batch_size=500)
+        
+        assert [issue["key"] for issue in issues] == [f"T-{i}" for i in range(7)]
+        assert requested_sizes == [500, 3, 3]
+    
+    @responses.activate
+    def test_get_epic_children_pages_past_first_response(self):
+        """Test child issues beyond the first page of an epic are fetched."""
+        from urllib.parse import urlparse, parse_qs
+        
+        def callback(request):
+            start = int(parse_qs(urlparse(request.url).query)['startAt'][0])
+            issues = [{"key": f"T-{i}", "fields": {}} for i in range(start, min(start + 2, 5))]
+            return (200, {}, json.dumps({"total": 5, "issues": issues}))
+        
+        responses.add_callback(responses.GET, f"{self.base_url}/rest/api/2/search", callback=callback)
+        
+        children = self.client.get_epic_children("EPIC-1")
+        
+        assert [issue["key"] for issue in children] == [f"T-{i}" for i in range(5)]
+        assert len(responses.calls) == 3
+    
+    @responses.activate
+    def test_fetch_issues_parallel_keeps_jql_order(self):
+        """Test pages fetched concurrently are reassembled in JQL order."""
+        client = JiraClient(self.base_url, self.access_token, batch_size=2, async_workers=3)
+        self.client = client
+        attempts = self._register_paged_search(total=7)
+        
+        issues = client.fetch_issues_parallel("project = T")
+        
+        assert [issue["key"] for issue in issues] == [f"T-{i}" for i in range(7)]
+        assert sorted(attempts) == [0, 2, 4, 6]
+    
+    @responses.activate
+    def test_fetch_issues_parallel_retries_failed_page_sequentially(self):
+        """Test a page that keeps failing is recovered through fetch_issues."""
+        client = JiraClient(self.base_url, self.access_token, batch_size=2, async_workers=2)
+        client.retry_delay = 0
+        self.client = client
+        self._register_paged_search(total=5, failing_starts={2})
+        
+        issues = client.fetch_issues_parallel("project = T")
+        
+        assert [issue["key"] for issue in issues] == [f"T-{i}" for i in range(5)]
+
+    def test_parse_csv_for_issue_keys_uses_first_valid_key_column(self):
+        """Test CSV parsing picks one key per row from the key-like columns."""
+        import io
+        csv_file = io.BytesIO(
+            b"Summary,Issue key,Issue id,Parent id\n"
+            b"A, proj-1 ,1001,\n"
+            b"B,PROJ-2,1002,PROJ-1\n"
+            b"C,,1003,PROJ-9\n"
+            b"D,PROJ-2,1004,\n"
+        )
+        
+        assert self.client.parse_csv_for_issue_keys(csv_file) == ["PROJ-1", "PROJ-2", "PROJ-9"]
+
+    def test_parse_csv_for_issue_keys_tolerates_ragged_rows(self):
+        """Test trailing commas and extra fields on data rows do not lose or reject keys."""
+        import io
+        trailing_commas = io.BytesIO(b"Issue key\nPROJ-1,\nPROJ-2,\n")
+        extra_fields = io.BytesIO(b"Issue key,Summary\nPROJ-1,a\nPROJ-2,b,x,y\n")
+        
+        assert self.client.parse_csv_for_issue_keys(trailing_commas) == ["PROJ-1", "PROJ-2"]
+        assert self.client.parse_csv_for_issue_keys(extra_fields) == ["PROJ-1", "PROJ-2"]
+
+    @responses.activate
+    def test_fetch_issues_by_keys_chunks_queries_with_subtasks(self):
+        """Test key lookups are chunked and pull subtasks in the same query."""
+        def callback(request):
+            body = json.loads(request.body)
+            keys = body["jql"].split("(")[1].split(")")[0].split(",")
+            issues = [{"key": key, "fields": {"summary": key}} for key in keys]
+            if "parent in" in body["jql"]:
+                issues.append({"key": f"{keys[0]}-SUB", "fields": {"summary": "subtask"}})
+            return (200, {}, json.dumps({"total": len(issues), "issues": issues}))
+        
+        responses.add_callback(responses.POST, f"{self.base_url}/rest/api/2/search", callback=callback)
+        keys = [f"T-{i}" for i in range(5)]
+        
+        issues = self.client.fetch_issues_by_keys(keys, include_subtasks=True, keys_per_query=2)
+        
+        assert [issue["key"] for issue in issues] == ["T-0", "T-1", "T-0-SUB", "T-2", "T-3", "T-2-SUB", "T-4", "T-4-SUB"]
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_fetch_issues_by_keys_reports_keys_jira_skips(self, caplog):
+        """Test unknown keys are validated leniently and reported instead of dropping their chunk."""
+        payloads = []
+        
+        def callback(request):
+            body = json.loads(request.body)
+            payloads.append(body)
+            issues = [{"key": "T-1", "fields": {"summary": "T-1"}}]
+            return (200, {}, json.dumps({"total": 1, "issues": issues,
+                                         "warningMessages": ["An issue with key 'T-404' does not exist."]}))
+        
+        responses.add_callback(responses.POST, f"{self.base_url}/rest/api/2/search", callback=callback)
+        
+        issues = self.client.fetch_issues_by_keys(["T-1", "T-404"])
+        
+        assert [issue["key"] for issue in issues] == ["T-1"]
+        assert payloads[0]["validateQuery"] == "warn"
+        assert "1 requested keys were not returned: T-404" in caplog.text
+    
+    def test_search_posts_are_retried_on_throttling(self):
+        """Test the shared adapter retries POST searches like GETs."""
+        retry = self.client.session.get_adapter(self.base_url).max_retries
+        
+        assert "POST" in retry.allowed_methods
+        assert 429 in retry.status_forcelist
+    
+    def test_clients_share_connection_pool(self):
+        """Test separate clients reuse the same pooled HTTP adapter."""
+        other = JiraClient("https://other.atlassian.net", "other_token")
+        
+        adapter = self.client.session.get_adapter(self.base_url)
+        assert adapter is other.session.get_adapter("https://other.atlassian.net")
+        assert adapter is other.session.get_adapter("http://plain.example.com")
+
     # NEW TIMEZONE-SPECIFIC TESTS
     
     def test_process_issue_with_multiple_timezones(self):
@@ -0,0 +1,441 @@
+"""
+Tests for Obeya Epic analysis module
+"""
+
+import pytest
+import responses
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the parent directory to the path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import ObeyaEpic
+from jira_client import JiraClient
+from ObeyaEpic import EpicAnalyzer, children_cache, sanitize_jql, validate_jira_url
+
+
+class FakeJiraClient:
+    """Minimal stand-in for JiraClient returning canned epic children."""
+
+    def __init__(self, children, base_url='https://test.atlassian.net', access_token='test_token'):
+        self.base_url = base_url
+        self.access_token = access_token
+        self.children = children
+        self.requested = []
+
+    def get_epic_children(self, epic_key):
+        self.requested.append(epic_key)
+        return self.children.get(epic_key, [])
+
+
+def make_child(key, original, remaining, status='In Progress'):
+    """Build a raw Jira child issue payload."""
+    return {
+        'key': key,
+        'fields': {
+            'summary': f'Child {key}',
+            'status': {'name': status},
+            'timeoriginalestimate': original,
+            'timeestimate': remaining
+        }
+    }
+
+
+def make_epic(key, original=None, remaining=None):
+    """Build a processed epic as returned by JiraClient.fetch_issues."""
+    return {
+        'key': key,
+        'summary': f'Epic {key}',
+        'status': 'In Progress',
+        'fields': {'timeoriginalestimate': original, 'timeestimate': remaining}
+    }
+
+
+class TestEpicAnalyzer:
+    """Test suite for EpicAnalyzer class."""
+
+    def setup_method(self):
+        """Start every test with an empty children cache."""
+        children_cache.clear()
+
+    def test_analyze_epics_sums_child_estimates(self):
+        """Test epic totals include child estimates."""
+        client = FakeJiraClient({
+            'EPIC-1': [make_child('T-1', 3600, 1800), make_child('T-2', 7200, None)],
+        })
+
+        result = EpicAnalyzer(client).analyze_epics([make_epic('EPIC-1')])
+
+        assert len(result) == 1
+        epic = result[0]
+        assert epic['original_estimate'] == pytest.approx(3.0)
+        assert epic['remaining_estimate'] == pytest.approx(0.5)
+        assert epic['num_children'] == 2
+        assert epic['jira_epic_has_zero_estimates'] is True
+        assert epic['child_original_hours'] == pytest.approx(3.0)
+        assert epic['child_remaining_hours'] == pytest.approx(0.5)
+        assert [child['key'] for child in epic['children']] == ['T-1', 'T-2']
+
+    def test_analyze_epics_preserves_input_order(self):
+        """Test results follow the input epic order regardless of fetch completion."""
+        epics = [make_epic(f'EPIC-{i}', original=3600 * i) for i in range(1, 21)]
+        client = FakeJiraClient({f'EPIC-{i}': [make_child(f'T-{i}', 3600, 0)] for i in range(1, 21)})
+
+        result = EpicAnalyzer(client).analyze_epics(epics)
+
+        assert [epic['key'] for epic in result] == [epic['key'] for epic in epics]
+        assert sorted(client.requested) == sorted(epic['key'] for epic in epics)
+
+    def test_analyze_epics_empty(self):
+        """Test analysis with no epics."""
+        assert EpicAnalyzer(FakeJiraClient({})).analyze_epics([]) == []
+
+    def test_analyze_epics_reuses_cached_children(self):
+        """Test repeat analyses are served from the children cache."""
+        client = FakeJiraClient({'EPIC-1': [make_child('T-1', 3600, 3600)]})
+        analyzer = EpicAnalyzer(client)
+
+        analyzer.analyze_epics([make_epic('EPIC-1')])
+        result = analyzer.analyze_epics([make_epic('EPIC-1')])
+
+        assert client.requested == ['EPIC-1']
+        assert result[0]['num_children'] == 1
+
+    def test_analyze_epics_uses_batched_fetch(self):
+        """Test clients with batched child fetching avoid per-epic requests."""
+        class BatchedJiraClient(FakeJiraClient):
+            def get_children_for_epics(self, epic_keys):
+                self.batched = list(epic_keys)
+                return {key: self.children.get(key, []) for key in epic_keys}
+
+        client = BatchedJiraClient({'EPIC-1': [make_child('T-1', 3600, 0)], 'EPIC-2': []})
+
+        result = EpicAnalyzer(client).analyze_epics([make_epic('EPIC-1'), make_epic('EPIC-2')])
+
+        assert client.batched == ['EPIC-1', 'EPIC-2']
+        assert client.requested == []
+        assert [epic['num_children'] for epic in result] == [1, 0]
+
+    def test_analyze_epics_falls_back_when_batching_unavailable(self):
+        """Test per-epic fetching is used when batched grouping is unavailable."""
+        class UnbatchableJiraClient(FakeJiraClient):
+            def get_children_for_epics(self, epic_keys):
+                return None
+
+        client = UnbatchableJiraClient({'EPIC-1': [make_child('T-1', 3600, 0)]})
+
+        result = EpicAnalyzer(client).analyze_epics([make_epic('EPIC-1')])
+
+        assert client.requested == ['EPIC-1']
+        assert result[0]['num_children'] == 1
+
+    def test_children_cache_is_scoped_per_token(self):
+        """Test cached children are not shared between different tokens."""
+        first = FakeJiraClient({'EPIC-1': [make_child('T-1', 3600, 3600)]}, access_token='token-a')
+        second = FakeJiraClient({'EPIC-1': []}, access_token='token-b')
+
+        EpicAnalyzer(first).analyze_epics([make_epic('EPIC-1')])
+        result = EpicAnalyzer(second).analyze_epics([make_epic('EPIC-1')])
+
+        assert second.requested == ['EPIC-1']
+        assert result[0]['num_children'] == 0
+
+    @responses.activate
+    def test_failed_child_fetch_is_not_cached(self):
+        """Test a Jira error on the per-epic path is retried instead of cached as no children."""
+        client = JiraClient('https://test.atlassian.net', 'test_token')
+        search_url = 'https://test.atlassian.net/rest/api/2/search'
+        responses.add(responses.GET, 'https://test.atlassian.net/rest/api/2/field', json=[])
+        responses.add(responses.GET, search_url, status=500)
+
+        EpicAnalyzer(client).analyze_epics([make_epic('EPIC-1')])
+
+        responses.replace(responses.GET, search_url,
+                          json={'total': 1, 'issues': [make_child('T-1', 3600, 0)]})
+        result = EpicAnalyzer(client).analyze_epics([make_epic('EPIC-1')])
+
+        assert result[0]['num_children'] == 1
+
+
+def test_segment_sums_handles_empty_segments():
+    """Test per-epic totals from flat child arrays, including epics without children."""
+    import numpy as np
+
+    values = np.array([3600, 1800, 7200], dtype=np.int64)
+    offsets = np.array([0, 2, 2, 3], dtype=np.int64)
+
+    assert ObeyaEpic.segment_sums(values, offsets).tolist() == [5400, 0, 7200]
+
+
+def test_empty_estimate_chart_is_rendered_once():
+    """Test the placeholder chart is a cached PNG."""
+    first = ObeyaEpic.render_empty_estimate_chart()
+
+    assert first.startswith(b'\x89PNG')
+    assert ObeyaEpic.render_empty_estimate_chart() is first
+
+
+def test_json_provider_matches_flask_output():
+    """Test the orjson-backed provider keeps Flask's JSON conventions."""
+    pytest.importorskip('orjson')
+    from datetime import datetime
+    from flask.json.provider import DefaultJSONProvider
+    import numpy as np
+
+    payload = {'b': 1, 'a': [1.5, None], 'when': datetime(2024, 1, 2, 3, 4, 5)}
+    expected = DefaultJSONProvider(ObeyaEpic.app).dumps(payload)
+
+    assert ObeyaEpic.app.json.loads(ObeyaEpic.app.json.dumps(payload)) == ObeyaEpic.app.json.loads(expected)
+    assert ObeyaEpic.app.json.dumps({'n': np.int64(3)}) == '{"n":3}'
+
+
+class TestSanitizeJql:
+    """Test suite for JQL sanitization."""
+
+    def test_accepts_regular_query(self):
+        """Test a normal JQL query passes and is stripped."""
+        assert sanitize_jql('  project = PROJ AND issuetype = Epic  ') == 'project = PROJ AND issuetype = Epic'
+
+    @pytest.mark.parametrize('jql', [
+        'project = PROJ; DROP TABLE issues',
+        'project = PROJ AND summary ~ "delete"',
+        'summary ~ "<SCRIPT>alert(1)</script>"',
+        'summary ~ "javascript:alert(1)"',
+        'summary ~ "line\nbreak"',
+    ])
+    def test_rejects_dangerous_patterns(self, jql):
+        """Test dangerous patterns are rejected case-insensitively."""
+        with pytest.raises(ValueError):
+            sanitize_jql(jql)
+
+    def test_rejects_empty_and_too_long(self):
+        """Test empty and oversized queries are rejected."""
+        with pytest.raises(ValueError):
+            sanitize_jql('')
+        with pytest.raises(ValueError):
+            sanitize_jql('a' * 2001)
+
+
+class TestValidateJiraUrl:
+    """Test suite for Jira URL validation."""
+
+    def test_accepts_public_url(self, monkeypatch):
+        """Test a public Jira URL is accepted."""
+        monkeypatch.setattr(ObeyaEpic, 'resolve_hostname', lambda host: '104.192.141.1')
+        assert validate_jira_url('https://company.atlassian.net') is True
+
+    @pytest.mark.parametrize('url', [
+        'https://localhost:8080',
+        'https://127.0.0.1',
+        'https://0.0.0.0',
+        'https://[::1]/jira',
+        'https://169.254.169.254/latest/meta-data',
+        'https://10.0.0.5',
+        'https://192.168.1.10',
+        'ftp://company.atlassian.net',
+    ])
+    def test_rejects_internal_and_invalid_urls(self, url):
+        """Test loopback, link-local, private and non-HTTP URLs are rejected."""
+        assert validate_jira_url(url) is False
+
+    def test_rejects_hostname_resolving_to_loopback(self, monkeypatch):
+        """Test hostnames are checked by the address they resolve to."""
+        monkeypatch.setattr(ObeyaEpic, 'resolve_hostname', lambda host: '127.0.0.2')
+        assert validate_jira_url('https://sneaky.example.com') is False
+
+    def test_private_network_can_be_allowed(self, monkeypatch):
+        """Test on-prem Jira on a private network can be explicitly allowed."""
+        monkeypatch.setattr(ObeyaEpic, 'ALLOW_PRIVATE_JIRA', True)
+        assert validate_jira_url('https://10.0.0.5') is True
+        assert validate_jira_url('https://127.0.0.1') is False
+
+
+class TestRateLimit:
+    """Test suite for the rate limiting decorator."""
+
+    def setup_method(self):
+        """Reset rate limit state and create a test client."""
+        ObeyaEpic.rate_limit_storage.clear()
+        ObeyaEpic.app.config['TESTING'] = True
+        self.client = ObeyaEpic.app.test_client()
+
+    def test_requests_over_limit_are_rejected(self):
+        """Test the request after the per-window limit returns 429."""
+        for _ in range(ObeyaEpic.RATE_LIMIT_REQUESTS):
+            assert self.client.post('/admin/clear_cache').status_code == 200
+
+        response = self.client.post('/admin/clear_cache')
+
+        assert response.status_code == 429
+        assert response.get_json()['error_type'] == 'RateLimitError'
+
+    def test_expired_timestamps_are_evicted(self):
+        """Test timestamps older than the window no longer count."""
+        stale = ObeyaEpic.time.time() - ObeyaEpic.RATE_LIMIT_WINDOW - 1
+        ObeyaEpic.rate_limit_storage['127.0.0.1'].extend([stale] * ObeyaEpic.RATE_LIMIT_REQUESTS)
+
+        assert self.client.post('/admin/clear_cache').status_code == 200
+        assert len(ObeyaEpic.rate_limit_storage['127.0.0.1']) == 1
+
+    def test_concurrent_requests_never_exceed_limit(self):
+        """Test parallel requests from one client admit exactly the per-window limit."""
+        attempts = ObeyaEpic.RATE_LIMIT_REQUESTS * 3
+
+        def post(_):
+            return ObeyaEpic.app.test_client().post('/admin/clear_cache').status_code
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(post, range(attempts)))
+
+        assert statuses.count(200) == ObeyaEpic.RATE_LIMIT_REQUESTS
+        assert statuses.count(429) == attempts - ObeyaEpic.RATE_LIMIT_REQUESTS
+
+
+class StubRouteJiraClient(FakeJiraClient):
+    """JiraClient replacement used when exercising the Flask routes."""
+
+    updates = []
+
+    def __init__(self, base_url, access_token):
+        super().__init__({
+            'EPIC-1': [make_child('T-1', 7200, 3600), make_child('T-2', 3600, 0)],
+            'EPIC-2': [],
+        }, base_url=base_url, access_token=access_token)
+
+    def test_connection(self):
+        return True
+
+    def fetch_issues(self, jql_query, max_results=5000, fields=None, expand=None):
+        return [make_epic('EPIC-1'), make_epic('EPIC-2', original=3600, remaining=3600)]
+
+    def update_issue_estimates(self, issue_key, original_estimate, remaining_estimate=None):
+        StubRouteJiraClient.updates.append((issue_key, original_estimate, remaining_estimate))
+        return issue_key != 'EPIC-FAIL'
+
+
+class TestAnalyzeEpicsRoute:
+    """Test suite for the /analyze_epics route."""
+
+    def setup_method(self):
+        """Reset shared state and create a test client."""
+        ObeyaEpic.rate_limit_storage.clear()
+        children_cache.clear()
+        ObeyaEpic.app.config['TESTING'] = True
+        self.client = ObeyaEpic.app.test_client()
+
+    def test_analyze_epics_returns_analysis_and_charts(self, monkeypatch):
+        """Test a successful analysis returns epic data and base64 charts."""
+        monkeypatch.setattr(ObeyaEpic, 'JiraClient', StubRouteJiraClient)
+
+        response = self.client.post('/analyze_epics', data={
+            'jira_url': 'https://test.atlassian.net',
+            'access_token': 'test_token_123',
+            'jql_query': 'project = PROJ AND issuetype = Epic'
+        })
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+        assert [epic['key'] for epic in data['epic_analysis']] == ['EPIC-1', 'EPIC-2']
+        assert data['epic_analysis'][0]['original_estimate'] == pytest.approx(3.0)
+        assert len(data['visualizations']['estimate_charts']) == 1
+        assert data['visualizations']['epic_pie_chart']
+
+    def test_export_pdf_uses_cached_charts(self, monkeypatch):
+        """Test PDF export resolves charts from the report token."""
+        monkeypatch.setattr(ObeyaEpic, 'JiraClient', StubRouteJiraClient)
+        analysis = self.client.post('/analyze_epics', data={
+            'jira_url': 'https://test.atlassian.net',
+            'access_token': 'test_token_123',
+            'jql_query': 'project = PROJ AND issuetype = Epic'
+        }).get_json()
+
+        response = self.client.post('/export_pdf', json={
+            'epic_analysis': analysis['epic_analysis'],
+            'report_token': analysis['report_token'],
+            'jira_url': 'https://test.atlassian.net'
+        })
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/pdf'
+        assert response.data.startswith(b'%PDF')
+
+    def test_export_pdf_with_expired_token(self):
+        """Test PDF export asks for a re-run when charts are gone."""
+        response = self.client.post('/export_pdf', json={
+            'epic_analysis': [{'key': 'EPIC-1'}],
+            'report_token': 'unknown'
+        })
+
+        assert response.status_code == 410
+        assert response.get_json()['error_type'] == 'ReportExpiredError'
+
+    def test_export_csv_lists_epics_needing_updates(self):
+        """Test CSV export contains epics with zero estimates but estimated children."""
+        epic_analysis = [{
+            'key': 'EPIC-1', 'original_estimate': 0, 'remaining_estimate': 0, 'num_children': 1,
+            'children': [{'key': 'T-1', 'original_estimate': 2.0, 'remaining_estimate': 1.5}]
+        }, {
+            'key': 'EPIC-2', 'original_estimate': 4.0, 'remaining_estimate': 1.0, 'num_children': 0,
+            'children': []
+        }]
+
+        response = self.client.post('/export_csv', json={'epic_analysis': epic_analysis})
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        assert response.data.decode() == (
+            "Jira ID,Original Estimate (hours),Remaining Estimate (hours)\n"
+            "EPIC-1,2.00,1.50\n"
+        )
+
+    def test_update_estimates_counts_successful_updates(self, monkeypatch):
+        """Test estimate updates are sent for qualifying epics and counted."""
+        monkeypatch.setattr(ObeyaEpic, 'JiraClient', StubRouteJiraClient)
+        StubRouteJiraClient.updates = []
+        children = [{'key': 'T-1', 'original_estimate': 8.0, 'remaining_estimate': 2.0}]
+        epic_analysis = [
+            {'key': key, 'original_estimate': 8.0, 'remaining_estimate': 2.0, 'num_children': 1,
+             'jira_epic_has_zero_estimates': True, 'children': children}
+            for key in ('EPIC-1', 'EPIC-2', 'EPIC-FAIL')
+        ]
+
+        response = self.client.post('/update_estimates', json={
+            'jira_url': 'https://test.atlassian.net',
+            'access_token': 'test_token_123',
+            'epic_analysis': epic_analysis
+        })
+
+        data = response.get_json()
+        assert data['success'] is True
+        assert data['updated_count'] == 2
+        assert data['total_epics'] == 3
+        assert sorted(StubRouteJiraClient.updates) == [
+            ('EPIC-1', '8h', '2h'), ('EPIC-2', '8h', '2h'), ('EPIC-FAIL', '8h', '2h')
+        ]
+
+    def test_exports_short_circuit_on_empty_analysis(self):
+        """Test empty analyses return immediately without building a report."""
+        pdf_response = self.client.post('/export_pdf', json={'epic_analysis': []})
+        csv_response = self.client.post('/export_csv', json={'epic_analysis': []})
+
+        assert pdf_response.status_code == 400
+        assert pdf_response.get_json()['error_type'] == 'NoDataError'
+        assert csv_response.status_code == 200
+        assert csv_response.data.decode() == ObeyaEpic.CSV_HEADER
+
+    def test_export_csv_rejects_invalid_json(self):
+        """Test malformed JSON bodies are reported as unprocessable."""
+        response = self.client.post('/export_csv', data='{not json', content_type='application/json')
+
+        assert response.status_code == 422
+        assert response.get_json()['error_details']['location'] == 'csv_generation'
+
+    def test_analyze_epics_missing_fields(self):
+        """Test analysis with missing required fields."""
+        response = self.client.post('/analyze_epics', data={})
+
+        assert response.status_code == 400
+        assert 'Missing required fields' in response.get_json()['error']
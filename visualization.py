@@ -31,11 +31,19 @@ class VisualizationGenerator:
     and distribution plots for agile metrics analysis.
     """
     
+    _warmed_up = False  # Shared across instances: matplotlib setup runs once per process
+    
     def __init__(self):
         """Initialize the visualization generator."""
         self.figure_size = (12, 8)
         self.dpi = 100
         self.colors = plt.cm.Set3(np.linspace(0, 1, 12))  # Color palette for pie charts
+        
+        # Build matplotlib's font cache up front instead of on the first chart request
+        if not VisualizationGenerator._warmed_up:
+            plt.figure()
+            plt.close()
+            VisualizationGenerator._warmed_up = True
     
     def create_pie_chart(self, data: List[Dict], title: str) -> io.BytesIO:
         """